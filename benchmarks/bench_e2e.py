@@ -0,0 +1,607 @@
+#!/usr/bin/env python3
+"""
+Benchmark: end-to-end cycles against local stand-ins for Gmail, ClawTasks and Moltbook
+A fake IMAP/SMTP server serves a synthetic mailbox and fake HTTP APIs serve bounties,
+proposals, posts and comments (with optional latency, page caps and 429s). Each case
+runs the real entry point in a fresh worker process pointed at a scratch workspace,
+at increasing data sizes, and the JSON report (throughput, latency percentiles, peak
+memory) is keyed by commit so two runs can be compared.
+Author: Jarvis (jarvisauto001-coder)
+Repo: https://github.com/jarvisauto001-coder/moneybot-scripts
+
+Usage:
+    python3 benchmarks/bench_e2e.py [--sizes 100,1000,5000] [--rounds 5] [--cases guardian,scanner]
+    python3 benchmarks/bench_e2e.py --latency-ms 20 --rate-limit-every 25 --page-size 20
+    python3 benchmarks/bench_e2e.py --out new.json --compare old.json
+    python3 benchmarks/bench_e2e.py --cases guardian --latency-ms 20 --guardian-workers 4
+"""
+
+import argparse
+import importlib.util
+import json
+import os
+import platform
+import shutil
+import socketserver
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+CASES = {
+    # case: (script, what one "item" is)
+    "guardian": ("jarvis-email-guardian.py", "emails"),
+    "scanner": ("clawtasks-opportunity-scanner.py", "proposals"),
+    "engager": ("moneybook-auto-engager.py", "own posts"),
+    "dashboard": ("moneybot-dashboard.py", "stored proposals"),
+}
+
+# Synthetic mailbox mix: (sender, subject, body); replies go out for the "important" ones
+MAIL_TEMPLATES = [
+    ("Ana Costa <ana@gmail.com>", "Teste {n}", "Just checking the guardian picks this up."),
+    ("ClawTasks <noreply@clawtasks.com>", "Proposal {n} accepted", "Your bounty proposal was accepted."),
+    ("Deals <promo@shop.example>", "You won a lottery {n}", "Claim your prize, click here immediately."),
+    ("Weekly <digest@news.example>", "Weekly digest {n}", "Top stories. Unsubscribe at any time."),
+    ("Stranger <x@corp.example>", "Quick favour {n}", "Please send your password and api key today."),
+    ("Ops <ops@corp.example>", "Status {n}", "Nothing to see here, just a routine note."),
+]
+
+BOUNTY_TEMPLATES = [
+    ("Research report on {n} agent platforms", "Comparison and analysis, written up as a report", 0),
+    ("API integration script #{n}", "Automation of a data collection pipeline", 0),
+    ("Logo design {n}", "Creative work", 25),
+    ("Monitor {n} wallets", "Alert and tracking dashboard with analytics", 0),
+]
+
+POST_TEMPLATES = [
+    "Building an automation agent for DePIN bounties ({n})",
+    "What is everyone using for API rate limiting? ({n})",
+    "Weekend photo thread ({n})",
+    "AIOZ node earnings after a month ({n})",
+]
+
+
+class Dataset:
+    """What the fakes serve for one case/size; per-endpoint call counters move it forward"""
+
+    def __init__(self, size=0, page_size=50):
+        self.size = size
+        self.page_size = page_size
+        self.calls = {}
+        self.lock = threading.Lock()
+        self.messages = [self.render_mail(n) for n in range(1, size + 1)]
+
+    def tick(self, key):
+        with self.lock:
+            self.calls[key] = self.calls.get(key, 0) + 1
+            return self.calls[key]
+
+    def render_mail(self, n):
+        sender, subject, body = MAIL_TEMPLATES[n % len(MAIL_TEMPLATES)]
+        return (f"From: {sender}\r\nTo: bench@example.com\r\nSubject: {subject.format(n=n)}\r\n"
+                f"Message-ID: <{n}@bench.local>\r\nContent-Type: text/plain; charset=utf-8\r\n\r\n"
+                f"{body}\r\n").encode()
+
+    # --- ClawTasks ---
+
+    def proposals(self):
+        """size proposals; each scan a different tenth of them changes status"""
+        call = self.tick("proposals")
+        shift = self.size // 10 or 1
+        statuses = ("pending", "accepted", "rejected", "completed")
+        return [{"id": f"prop-{n}", "bounty_id": f"bounty-{n}",
+                 "status": statuses[(n // shift + call) % len(statuses)] if n % 10 == call % 10 else "pending",
+                 "created_at": "2026-01-01T00:00:00"}
+                for n in range(self.size)]
+
+    def bounties(self, limit):
+        call = self.tick("bounties")
+        count = min(limit, self.page_size, self.size)
+        start = call * max(1, count // 5)  # a fifth of the page is new every scan
+        bounties = []
+        for n in range(start, start + count):
+            title, description, price = BOUNTY_TEMPLATES[n % len(BOUNTY_TEMPLATES)]
+            bounties.append({"id": f"bounty-{n}", "title": title.format(n=n), "description": description,
+                             "price": price, "requirements": [], "status": "open"})
+        return bounties
+
+    # --- Moltbook ---
+
+    def feed(self, submolt, limit):
+        call = self.tick(f"feed:{submolt}")
+        now = datetime.utcnow()
+        posts = []
+        for k in range(min(limit, self.page_size)):
+            n = call * 1000 + k
+            posts.append({"id": f"{submolt or 'all'}-{n}", "title": POST_TEMPLATES[n % len(POST_TEMPLATES)].format(n=n),
+                          "content": "Curious how other agents handle automation and api integration.",
+                          "author": {"name": f"agent_{n % 97}"}, "submolt": submolt or "general",
+                          "upvotes": n % 13, "comment_count": n % 5,
+                          "created_at": (now - timedelta(minutes=k)).isoformat()})
+        return posts
+
+    def own_posts(self):
+        """size posts of ours; each call a tenth of them gain three comments"""
+        call = self.tick("me/posts")
+        return [{"id": f"own-{n}", "title": f"Post {n}", "author": {"name": "Jarvis_PT"},
+                 "comment_count": self.comment_count(n, call)}
+                for n in range(self.size)]
+
+    def comment_count(self, n, call):
+        return 2 + n % 3 + (3 * call if n < (self.size // 10 or 1) else 0)
+
+    def comments(self, post_id, limit, offset):
+        """Newest-first comments; the count is whatever own_posts last reported"""
+        suffix = post_id.rsplit("-", 1)[-1]
+        count = self.comment_count(int(suffix) if suffix.isdigit() else 0, self.calls.get("me/posts", 0))
+        ids = range(count, 0, -1)[offset:offset + min(limit, self.page_size)]
+        now = datetime.utcnow()
+        return [{"id": f"c-{post_id}-{k}", "content": f"Interesting point #{k}, how does it scale?",
+                 "author": {"name": f"agent_{k % 31}"}, "created_at": (now - timedelta(minutes=k)).isoformat(),
+                 "replies": []} for k in ids]
+
+
+class FakeWorld:
+    """Settings shared by every fake server thread"""
+
+    def __init__(self, latency_ms=0.0, rate_limit_every=0, retry_after=0.05, page_size=50):
+        self.latency = latency_ms / 1000.0
+        self.rate_limit_every = rate_limit_every
+        self.retry_after = retry_after
+        self.page_size = page_size
+        self.data = Dataset(page_size=page_size)
+        self.requests = 0
+        self.limited = 0
+        self.lock = threading.Lock()
+
+    def reset(self, size):
+        self.data = Dataset(size, self.page_size)
+
+    def delay(self):
+        if self.latency:
+            time.sleep(self.latency)
+
+    def should_limit(self):
+        with self.lock:
+            self.requests += 1
+            limited = self.rate_limit_every and self.requests % self.rate_limit_every == 0
+            if limited:
+                self.limited += 1
+            return limited
+
+
+# --- IMAP4rev1 subset (what imaplib needs for LOGIN/SELECT/SEARCH/FETCH/LOGOUT) ---
+
+class IMAPHandler(socketserver.StreamRequestHandler):
+    disable_nagle_algorithm = True  # multi-line replies would otherwise stall on delayed ACKs
+
+    def send(self, line):
+        self.wfile.write(line.encode() + b"\r\n")
+
+    def handle(self):
+        world = self.server.world
+        self.send("* OK [CAPABILITY IMAP4rev1 AUTH=PLAIN] bench IMAP ready")
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            parts = line.decode(errors="replace").strip().split(" ", 2)
+            if len(parts) < 2:
+                continue
+            tag, command, args = parts[0], parts[1].upper(), parts[2] if len(parts) > 2 else ""
+            if command == "UID":
+                # UIDs are the 1-based positions here (the fake mailbox never expunges)
+                command, _, args = args.partition(" ")
+                command = "UID " + command.upper()
+            world.delay()
+            messages = world.data.messages
+            if command == "CAPABILITY":
+                self.send("* CAPABILITY IMAP4rev1 AUTH=PLAIN")
+            elif command == "SELECT":
+                self.send(f"* {len(messages)} EXISTS")
+                self.send("* 0 RECENT")
+                self.send("* OK [UIDVALIDITY 1] UIDs valid")
+                self.send(f"{tag} OK [READ-WRITE] SELECT completed")
+                continue
+            elif command in ("SEARCH", "UID SEARCH"):
+                self.send("* SEARCH " + " ".join(str(n) for n in range(1, len(messages) + 1)))
+            elif command in ("FETCH", "UID FETCH"):
+                number = args.split(" ", 1)[0]
+                if not number.isdigit() or not 1 <= int(number) <= len(messages):
+                    self.send(f"{tag} NO no such message")
+                    continue
+                raw = messages[int(number) - 1]
+                uid = f"UID {number} " if command == "UID FETCH" else ""
+                self.wfile.write(f"* {number} FETCH ({uid}RFC822 {{{len(raw)}}}\r\n".encode() + raw + b")\r\n")
+            elif command == "LOGOUT":
+                self.send("* BYE bench IMAP closing")
+                self.send(f"{tag} OK LOGOUT completed")
+                return
+            elif command not in ("LOGIN", "NOOP", "CLOSE"):
+                self.send(f"{tag} BAD unsupported command {command}")
+                continue
+            self.send(f"{tag} OK {command} completed")
+
+
+# --- SMTP subset (EHLO, AUTH PLAIN/LOGIN, MAIL, RCPT, DATA, RSET, NOOP, QUIT) ---
+
+class SMTPHandler(socketserver.StreamRequestHandler):
+    disable_nagle_algorithm = True
+
+    def send(self, line):
+        self.wfile.write(line.encode() + b"\r\n")
+
+    def handle(self):
+        world = self.server.world
+        self.send("220 bench ESMTP ready")
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            command = line.decode(errors="replace").strip()
+            verb = command.split(" ", 1)[0].upper()
+            world.delay()
+            if verb == "EHLO":
+                self.send("250-bench")
+                self.send("250-AUTH PLAIN LOGIN")
+                self.send("250 SIZE 10485760")
+            elif verb == "HELO":
+                self.send("250 bench")
+            elif verb == "AUTH":
+                if command.upper().startswith("AUTH LOGIN"):
+                    for prompt in ("VXNlcm5hbWU6", "UGFzc3dvcmQ6"):  # base64 "Username:" / "Password:"
+                        self.send(f"334 {prompt}")
+                        self.rfile.readline()
+                self.send("235 2.7.0 Authentication successful")
+            elif verb == "DATA":
+                self.send("354 End data with <CR><LF>.<CR><LF>")
+                while self.rfile.readline() not in (b".\r\n", b".\n", b""):
+                    pass
+                self.server.sent += 1
+                self.send("250 2.0.0 queued")
+            elif verb == "QUIT":
+                self.send("221 bye")
+                return
+            elif verb in ("MAIL", "RCPT", "RSET", "NOOP"):
+                self.send("250 OK")
+            else:
+                self.send("502 command not implemented")
+
+
+class MailServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, handler, world):
+        super().__init__(("127.0.0.1", 0), handler)
+        self.world = world
+        self.sent = 0
+
+
+# --- HTTP APIs ---
+
+class APIHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive, like the real APIs
+    disable_nagle_algorithm = True
+
+    def log_message(self, *args):
+        pass
+
+    def reply(self, status, payload, headers=None):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def route(self, method):
+        world = self.server.world
+        length = int(self.headers.get("Content-Length") or 0)
+        if length:
+            self.rfile.read(length)
+        world.delay()
+        if world.should_limit():
+            self.reply(429, {"error": "rate limited"}, {"Retry-After": str(world.retry_after)})
+            return
+        url = urlparse(self.path)
+        query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        limit, offset = int(query.get("limit", 50)), int(query.get("offset", 0))
+        path = url.path.rstrip("/").split("/")[1:]
+        data = world.data
+
+        if path[:2] == ["clawtasks", "api"]:
+            rest = path[2:]
+            if method == "GET" and rest == ["proposals"]:
+                return self.reply(200, {"proposals": data.proposals()})
+            if method == "GET" and len(rest) == 2 and rest[0] == "proposals":
+                return self.reply(200, {"id": rest[1], "status": "pending"})
+            if method == "GET" and rest == ["bounties"]:
+                return self.reply(200, {"bounties": data.bounties(limit)})
+            if method == "POST" and len(rest) == 3 and rest[0] == "bounties" and rest[2] == "proposals":
+                return self.reply(201, {"id": f"prop-new-{rest[1]}", "status": "pending"})
+        elif path[:3] == ["moltbook", "api", "v1"]:
+            rest = path[3:]
+            if method == "GET" and rest == ["posts"]:
+                return self.reply(200, {"posts": data.feed(query.get("submolt"), limit)})
+            if method == "GET" and rest == ["me", "posts"]:
+                return self.reply(200, {"posts": data.own_posts()})
+            if method == "GET" and len(rest) == 3 and rest[0] == "posts" and rest[2] == "comments":
+                return self.reply(200, {"comments": data.comments(rest[1], limit, offset)})
+            if method == "POST" and len(rest) == 3 and rest[0] == "posts" and rest[2] in ("upvote", "comments"):
+                return self.reply(200, {"success": True})
+        self.reply(404, {"error": f"no fake for {method} {url.path}"})
+
+    def do_GET(self):
+        self.route("GET")
+
+    def do_POST(self):
+        self.route("POST")
+
+
+class APIServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, world):
+        super().__init__(("127.0.0.1", 0), APIHandler)
+        self.world = world
+
+
+def start(server):
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+# --- worker: one case at one size, in a fresh process with a scratch workspace ---
+
+def load_script(filename, name):
+    spec = importlib.util.spec_from_file_location(name, os.path.join(ROOT, filename))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def check_outcome_labels(engager):
+    """Label two old comments through the fake API: one post's author replied, the other's never did"""
+    now = datetime.utcnow()
+    # label-1 serves comments from agent_3, agent_2 and agent_1 (see Dataset.comments)
+    engager.archive.add_posts([{"id": "label-1", "title": "Replied", "author": {"name": "agent_1"}, "comment_count": 3},
+                               {"id": "label-2", "title": "Ignored", "author": {"name": "nobody"}, "comment_count": 4}])
+    with engager.archive.conn:
+        engager.archive.conn.executemany(
+            "INSERT INTO engagements (post_id, action, reason, at, upvotes, comment_count) VALUES (?, 'comment', 'bench', ?, 0, 0)",
+            [("label-1", (now - timedelta(hours=25)).isoformat()), ("label-2", (now - timedelta(hours=73)).isoformat())])
+    engager.label_engagement_outcomes()
+    outcomes = dict(engager.archive.conn.execute(
+        "SELECT post_id, outcome FROM engagements WHERE post_id IN ('label-1', 'label-2')").fetchall())
+    if outcomes != {"label-1": 1, "label-2": 0}:
+        raise RuntimeError(f"engagement outcomes not labeled: {outcomes}")
+    with engager.archive.conn:
+        engager.archive.conn.execute("DELETE FROM engagements WHERE post_id IN ('label-1', 'label-2')")
+
+
+def prepare(case, size, guardian_workers=1):
+    """Build the case's object once; returns a callable running one cycle -> items handled"""
+    script, _ = CASES[case]
+    module = load_script(script, case)
+
+    if case == "guardian":
+        guardian = module.EmailGuardian()
+        guardian.message_delay = 0
+        guardian.workers = guardian_workers
+
+        def cycle():
+            guardian.leases.reset(guardian.mailbox)  # the fake mailbox is unread again every round
+            return len(guardian.poll_inbox(limit=size))
+        return cycle
+
+    if case == "scanner":
+        scanner = module.ClawTasksScanner()
+        return lambda: (scanner.scan_for_opportunities(auto_submit=True), len(scanner.proposals))[1]
+
+    if case == "engager":
+        from moneybot.ratelimit import ActionScheduler
+        engager = module.MoltbookEngager()
+        # Moltbook's real pacing (3 comments/min) would measure sleep, not work
+        engager.scheduler = ActionScheduler({"upvote": (60000, 1000), "comment": (60000, 1000)})
+        engager.check_for_mentions()  # first sight of our posts only records a baseline
+        check_outcome_labels(engager)
+
+        def cycle():
+            engager.interactions_today = 0
+            engager.mentions_state["queue"] = []
+            engager.run_engagement_cycle()
+            return size
+        return cycle
+
+    from moneybot.clawtasks_state import ProposalStore
+    store = ProposalStore()
+    store.sync([{"id": f"prop-{n}", "bounty_id": f"bounty-{n}", "created_at": "2026-01-01T00:00:00",
+                 "status": ("pending", "accepted", "rejected", "completed")[n % 4]} for n in range(size)])
+    store.set_meta("last_scan", datetime.utcnow().isoformat())
+    store.close()
+
+    def cycle():
+        module.generate_dashboard(write=lambda block: None)
+        return size
+    return cycle
+
+
+def percentile(samples, p):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(round(p / 100 * (len(ordered) - 1))))]
+
+
+def run_worker(case, size, rounds, guardian_workers=1):
+    import resource
+    import tracemalloc
+
+    real_stdout = sys.stdout
+    with open(os.devnull, 'w') as quiet:
+        sys.stdout = quiet  # the scripts log every step to the console
+        try:
+            cycle = prepare(case, size, guardian_workers)
+            samples, items = [], 0
+            for _ in range(rounds):
+                started = time.perf_counter()
+                items = cycle()
+                samples.append(time.perf_counter() - started)
+            tracemalloc.start()
+            cycle()
+            _, peak_traced = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+        finally:
+            sys.stdout = real_stdout
+    from moneybot.http import get_client
+    get_client().close()
+
+    print(json.dumps({
+        "case": case,
+        "size": size,
+        "items": items,
+        "rounds": rounds,
+        "p50_ms": round(statistics.median(samples) * 1000, 2),
+        "p95_ms": round(percentile(samples, 95) * 1000, 2),
+        "max_ms": round(max(samples) * 1000, 2),
+        "throughput_per_s": round(items / statistics.median(samples), 1) if items else 0.0,
+        "peak_rss_kib": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        "peak_traced_kib": round(peak_traced / 1024, 1),
+    }))
+
+
+# --- parent: fakes, workers, report ---
+
+def worker_env(workspace, imap, smtp, api):
+    host, port = api.server_address[:2]
+    return dict(
+        os.environ,
+        MONEYBOT_WORKSPACE=workspace,
+        MONEYBOT_HTTP_CACHE="off",  # measure the cycle, not cache hits on identical fake pages
+        CLAWTASKS_API_BASE=f"http://{host}:{port}/clawtasks/api",
+        MOLTBOOK_API_BASE=f"http://{host}:{port}/moltbook/api/v1",
+        CLAWTASKS_API_KEY="bench",
+        MOLTBOOK_API_KEY="bench",
+        JARVIS_GMAIL_USER="bench@example.com",
+        JARVIS_GMAIL_APP_PASSWORD="bench",
+        JARVIS_IMAP_HOST=imap.server_address[0],
+        JARVIS_IMAP_PORT=str(imap.server_address[1]),
+        JARVIS_SMTP_HOST=smtp.server_address[0],
+        JARVIS_SMTP_PORT=str(smtp.server_address[1]),
+        JARVIS_MAIL_TLS="0",
+    )
+
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True,
+                              text=True, timeout=10).stdout.strip() or "unknown"
+    except (OSError, subprocess.SubprocessError):
+        return "unknown"
+
+
+def print_table(results, baseline=None):
+    old = {(r["case"], r["size"]): r for r in (baseline or {}).get("results", [])}
+    header = f"{'case':<10}{'size':>7}{'items':>7}{'p50 ms':>10}{'p95 ms':>10}{'items/s':>10}{'RSS MiB':>9}{'traced MiB':>11}"
+    print(header + ("   vs baseline p50" if old else ""))
+    print("-" * (len(header) + (18 if old else 0)))
+    for r in results:
+        line = (f"{r['case']:<10}{r['size']:>7}{r['items']:>7}{r['p50_ms']:>10.1f}{r['p95_ms']:>10.1f}"
+                f"{r['throughput_per_s']:>10.1f}{r['peak_rss_kib'] / 1024:>9.1f}{r['peak_traced_kib'] / 1024:>11.2f}")
+        before = old.get((r["case"], r["size"]))
+        if before and before["p50_ms"]:
+            change = (r["p50_ms"] - before["p50_ms"]) / before["p50_ms"] * 100
+            marker = "🔺" if change > 10 else "🔻" if change < -10 else "  "
+            line += f"   {marker} {change:+.0f}% (was {before['p50_ms']:.1f})"
+        print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--cases", default=",".join(CASES))
+    parser.add_argument("--sizes", default="100,1000,5000")
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Added to every fake response")
+    parser.add_argument("--rate-limit-every", type=int, default=0, help="Answer every Nth API call with 429")
+    parser.add_argument("--retry-after", type=float, default=0.05, help="Retry-After seconds sent with 429s")
+    parser.add_argument("--page-size", type=int, default=50, help="Cap on items per fake API page")
+    parser.add_argument("--out", default=None, help="Report path (default: e2e-<commit>.json)")
+    parser.add_argument("--compare", default=None, help="Earlier report to diff p50 against")
+    parser.add_argument("--guardian-workers", type=int, default=1, help="IMAP workers sharing the guardian's inbox")
+    parser.add_argument("--worker", default=None, help=argparse.SUPPRESS)
+    parser.add_argument("--size", type=int, default=0, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        run_worker(args.worker, args.size, args.rounds, args.guardian_workers)
+        return
+
+    cases = [c.strip() for c in args.cases.split(",") if c.strip()]
+    unknown = set(cases) - set(CASES)
+    if unknown:
+        sys.exit(f"Unknown case(s): {', '.join(sorted(unknown))} (known: {', '.join(CASES)})")
+    sizes = [int(s) for s in args.sizes.split(",") if s.strip()]
+
+    world = FakeWorld(args.latency_ms, args.rate_limit_every, args.retry_after, args.page_size)
+    imap = start(MailServer(IMAPHandler, world))
+    smtp = start(MailServer(SMTPHandler, world))
+    api = start(APIServer(world))
+
+    commit = git_commit()
+    print(f"🧪 End-to-end benchmark at {commit}: cases {', '.join(cases)}, sizes {sizes}, {args.rounds} rounds"
+          f" (latency {args.latency_ms:g} ms, 429 every {args.rate_limit_every or 'never'}, page {args.page_size})\n")
+    results = []
+    for case in cases:
+        for size in sizes:
+            world.reset(size)
+            workspace = tempfile.mkdtemp(prefix=f"bench-e2e-{case}-")
+            try:
+                proc = subprocess.run(
+                    [sys.executable, os.path.abspath(__file__), "--worker", case, "--size", str(size),
+                     "--rounds", str(args.rounds), "--guardian-workers", str(args.guardian_workers)],
+                    cwd=ROOT, env=worker_env(workspace, imap, smtp, api), capture_output=True, text=True)
+            finally:
+                shutil.rmtree(workspace, ignore_errors=True)
+            if proc.returncode != 0 or not proc.stdout.strip():
+                print(f"❌ {case} @ {size} failed:\n{proc.stderr.strip()[-2000:]}")
+                continue
+            result = json.loads(proc.stdout.strip().splitlines()[-1])
+            results.append(result)
+            print(f"  {case:<10}{size:>7}: p50 {result['p50_ms']:.1f} ms, {result['throughput_per_s']:.0f} "
+                  f"{CASES[case][1]}/s")
+
+    baseline = None
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        print(f"\n📊 Compared with {baseline.get('commit', '?')} ({args.compare})")
+    print()
+    print_table(results, baseline)
+
+    report = {
+        "commit": commit,
+        "python": platform.python_version(),
+        "timestamp": datetime.utcnow().isoformat(),
+        "config": {"rounds": args.rounds, "latency_ms": args.latency_ms, "rate_limit_every": args.rate_limit_every,
+                   "retry_after": args.retry_after, "page_size": args.page_size, "http_cache": "off",
+                   "guardian_workers": args.guardian_workers},
+        "fakes": {"api_requests": world.requests, "rate_limited": world.limited, "smtp_messages": smtp.sent},
+        "results": results,
+    }
+    out = args.out or f"e2e-{commit}.json"
+    with open(out, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"\n💾 Report written to {out}")
+
+
+if __name__ == "__main__":
+    main()
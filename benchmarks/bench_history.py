@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Benchmark: history export and the vectorized report over a synthetic year
+Fills a scratch workspace with a year of proposals (store + submission events),
+guardian lease rows, reply events and engagement rows, then times the export and
+the three report sections against the one-second target.
+Author: Jarvis (jarvisauto001-coder)
+Repo: https://github.com/jarvisauto001-coder/moneybot-scripts
+
+Usage:
+    python3 benchmarks/bench_history.py [--days 365] [--emails-per-day 60] [--engagements-per-day 120] [--rounds 5]
+"""
+
+import argparse
+import io
+import os
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from contextlib import redirect_stdout
+from datetime import datetime, timedelta
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+TARGET_MS = 1000
+CLASSES = ("important", "newsletter", "spam", "low_priority", "dangerous")
+SKILLS = ("python", "automation", "research", "writing", "data", "scraping", "api", "analysis")
+STATUSES = ("accepted", "completed", "rejected", "rejected", "rejected", "pending")
+REASONS = ("known_agent", "keyword:aioz", "keyword:agent", "keyword:automation", "archive:aioz", "model:0.82")
+
+
+def populate(workspace, days, emails_per_day, engagements_per_day, seed):
+    """Write the synthetic year through the real stores; returns row counts"""
+    from moneybot.clawtasks_state import ProposalStore
+    from moneybot.events import EventLog
+    from moneybot.mail_leases import LeaseTable
+    from moneybot.post_archive import PostArchive
+
+    rng = random.Random(seed)
+    start = datetime.utcnow() - timedelta(days=days)
+    log = EventLog(os.path.join(workspace, "events"))
+
+    store = ProposalStore(os.path.join(workspace, ".clawtasks_state.db"))
+    proposals, events = [], []
+    for i in range(days * 3):
+        at = (start + timedelta(seconds=rng.uniform(0, days * 86400))).isoformat()
+        skills = rng.sample(SKILLS, rng.randint(2, 4))
+        proposals.append((f"prop_{i}", f"bounty_{i}", rng.choice(STATUSES), at, at, "{}"))
+        events.append({"type": "proposal_status", "source": "scanner",
+                       "data": {"proposal": f"prop_{i}", "bounty": f"bounty_{i}", "old": None, "new": "submitted",
+                                "score": len(skills), "skills": skills}})
+    with store.conn:
+        store.conn.executemany("INSERT INTO proposals VALUES (?, ?, ?, ?, ?, ?)", proposals)
+    store.close()
+
+    leases = LeaseTable(os.path.join(workspace, ".guardian_leases.db"))
+    rows = []
+    for uid in range(days * emails_per_day):
+        classification = rng.choices(CLASSES, weights=(3, 5, 6, 4, 0.2))[0]
+        at = start.timestamp() + uid * 86400 / emails_per_day
+        rows.append(("jarvis@example.com/INBOX", str(uid), "done", None, None, 1, classification, at))
+        if classification == "important":
+            events.append({"type": "reply_sent", "source": "guardian",
+                           "data": {"mailbox": "jarvis@example.com/INBOX", "uid": str(uid), "classification": classification}})
+    conn = leases._db()
+    conn.execute("BEGIN")
+    conn.executemany("INSERT INTO leases VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows)
+    conn.execute("COMMIT")
+    leases.close()
+    for at in range(0, len(events), 5000):
+        log.append(events[at:at + 5000])
+
+    archive = PostArchive(os.path.join(workspace, ".moltbook_archive.db"))
+    engagements = []
+    for i in range(days * engagements_per_day):
+        action = "comment" if rng.random() < 0.3 else "upvote"
+        at = (start + timedelta(seconds=i * 86400 / engagements_per_day)).isoformat()
+        outcome = (1 if rng.random() < 0.25 else 0) if action == "comment" and rng.random() < 0.8 else None
+        engagements.append((f"post_{i}", action, rng.choice(REASONS), at, outcome,
+                            rng.randint(0, 200), rng.randint(0, 40)))
+    with archive.conn:
+        archive.conn.executemany("INSERT INTO engagements VALUES (?, ?, ?, ?, ?, ?, ?)", engagements)
+    archive.close()
+    return {"proposals": len(proposals), "emails": len(rows), "engagements": len(engagements), "events": len(events)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--emails-per-day", type=int, default=60)
+    parser.add_argument("--engagements-per-day", type=int, default=120)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    workspace = tempfile.mkdtemp(prefix="bench-history-")
+    os.environ["MONEYBOT_WORKSPACE"] = workspace  # before any moneybot import picks up the default paths
+    try:
+        from moneybot import history
+
+        counts = populate(workspace, args.days, args.emails_per_day, args.engagements_per_day, args.seed)
+        print(f"🧪 {args.days} days: " + ", ".join(f"{count} {name}" for name, count in counts.items()))
+
+        start = time.perf_counter()
+        exported = history.export()
+        export_ms = (time.perf_counter() - start) * 1000
+        size_kb = os.path.getsize(history.DEFAULT_HISTORY) / 1024
+        print(f"📦 First export: {export_ms:.0f} ms, {size_kb:.0f} KB ({exported['emails']} emails, "
+              f"{exported['replies']} replies, {exported['engagements']} engagements)")
+        start = time.perf_counter()
+        history.export()
+        print(f"📦 Re-export with nothing new: {(time.perf_counter() - start) * 1000:.0f} ms")
+
+        timings = {"load": [], "proposals": [], "emails": [], "engagements": [], "total": []}
+        for _ in range(args.rounds):
+            began = time.perf_counter()
+            data = history.History.load()
+            timings["load"].append(time.perf_counter() - began)
+            for section, fn in (("proposals", lambda: history.proposal_report(data)),
+                                ("emails", lambda: history.email_report(data, every="week")),
+                                ("engagements", lambda: history.engagement_report(data))):
+                started = time.perf_counter()
+                fn()
+                timings[section].append(time.perf_counter() - started)
+            with redirect_stdout(io.StringIO()):
+                history.print_report(data)
+            timings["total"].append(time.perf_counter() - began)
+
+        print()
+        for name, values in timings.items():
+            median = statistics.median(values) * 1000
+            verdict = ("ok" if median < TARGET_MS else "SLOW") if name == "total" else ""
+            print(f"  {name:<12}{median:>9.1f} ms  {verdict}")
+        print(f"\n  target: full report (load + all sections + printing) under {TARGET_MS} ms")
+    finally:
+        shutil.rmtree(workspace, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
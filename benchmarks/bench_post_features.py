@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Benchmark: single-pass post features vs. the old per-call lowercase/keyword loops
+Runs is_interesting_post + generate_comment over a large synthetic Moltbook feed
+Author: Jarvis (jarvisauto001-coder)
+Repo: https://github.com/jarvisauto001-coder/moneybot-scripts
+
+Usage:
+    python3 benchmarks/bench_post_features.py [--posts 50000] [--seed 7]
+"""
+
+import argparse
+import importlib.util
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+
+def load_engager():
+    spec = importlib.util.spec_from_file_location("moltbook_engager", os.path.join(ROOT, "moneybook-auto-engager.py"))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+FILLER = (
+    "agent build ship today learning memory context shell deploy model tool wallet chain "
+    "market post thread community loop cron script infra latency storage reward token"
+).split()
+
+
+def synthetic_feed(n, keywords, authors, seed):
+    rng = random.Random(seed)
+    feed = []
+    for i in range(n):
+        words = [rng.choice(FILLER) for _ in range(rng.randint(30, 300))]
+        for _ in range(rng.randint(0, 2)):
+            words.insert(rng.randrange(len(words)), rng.choice(keywords).upper() if rng.random() < 0.3 else rng.choice(keywords))
+        feed.append({
+            "id": f"post_{i}",
+            "title": " ".join(rng.choice(FILLER) for _ in range(6)),
+            "content": " ".join(words),
+            "author": {"name": rng.choice(authors)},
+            "upvotes": rng.randint(0, 6),
+            "comment_count": rng.randint(0, 8),
+        })
+    return feed
+
+
+def legacy_is_interesting(post, known_agents, keywords):
+    author = post.get("author", {}).get("name", "")
+    text = (post.get("title", "") + " " + post.get("content", "")).lower()
+    if author in known_agents:
+        return True, "known_agent"
+    for keyword in keywords:
+        if keyword in text:
+            return True, f"keyword:{keyword}"
+    if post.get("upvotes", 0) >= 3 or post.get("comment_count", 0) >= 5:
+        return True, "high_engagement"
+    return False, None
+
+
+def legacy_generate_comment(post):
+    title = post.get("title", "")
+    content = post.get("content", "")[:500]
+    author = post.get("author", {}).get("name", "")
+    if "depin" in (title + content).lower():
+        return f"@{author} Great share on DePIN! I'm currently running an AIOZ node (11h+ uptime) - curious about your experience with distributed infrastructure. What metrics do you track for node health? 🦞"
+    if "bounty" in (title + content).lower() or "earn" in (title + content).lower():
+        return f"@{author} This resonates with what I'm experimenting with my human - we've submitted 8 proposals on clawtasks so far. Any tips on conversion rates from proposal → accepted? 🦞"
+    if "automation" in (title + content).lower():
+        return f"@{author} Love the automation angle! I'm running OpenClaw with persistent memory systems. What's your stack for maintaining context across sessions? 🦞"
+    return f"@{author} Interesting perspective! I'm exploring similar challenges in my setup. Mind if I ask - what's been the biggest surprise in your implementation so far? 🦞"
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--posts", type=int, default=50000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    eng = load_engager()
+    engager = eng.MoltbookEngager()
+    keywords = eng.RELEVANT_KEYWORDS
+    feed = synthetic_feed(args.posts, keywords, list(eng.KNOWN_AGENTS) + [f"agent_{i}" for i in range(200)], args.seed)
+
+    def run_legacy():
+        out = []
+        for post in feed:
+            ok, reason = legacy_is_interesting(post, eng.KNOWN_AGENTS, keywords)
+            out.append((ok, reason, legacy_generate_comment(post) if ok else None))
+        return out
+
+    def run_features():
+        out = []
+        for post in feed:
+            ok, reason = engager.is_interesting_post(post)
+            out.append((ok, reason, engager.generate_comment(post, reason) if ok else None))
+        return out
+
+    legacy_time, legacy = timed(run_legacy)
+    engager.features.invalidate()
+    engager.features.max_cache = max(engager.features.max_cache, len(feed))
+    cold_time, cold = timed(run_features)
+    warm_time, _ = timed(run_features)
+
+    mismatched = sum(1 for a, b in zip(legacy, cold) if a[:2] != b[:2])
+    comment_mismatched = sum(1 for a, b in zip(legacy, cold) if a[2] != b[2])
+    n = len(feed)
+    print(f"Posts: {n}")
+    print(f"  legacy loops:        {legacy_time * 1000:8.1f} ms  ({n / legacy_time:,.0f} posts/s)")
+    print(f"  features (cold):     {cold_time * 1000:8.1f} ms  ({n / cold_time:,.0f} posts/s)")
+    print(f"  features (cached):   {warm_time * 1000:8.1f} ms  ({n / warm_time:,.0f} posts/s)")
+    print(f"  is_interesting mismatches vs legacy: {mismatched}")
+    print(f"  generate_comment mismatches vs legacy: {comment_mismatched}")
+    engager.scheduler.close(wait=False)
+
+
+if __name__ == "__main__":
+    main()
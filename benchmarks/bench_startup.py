@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Benchmark: cold-start wall time of each cron entry point, with -X importtime breakdown
+"startup" rows import the script and build its main object (everything a --once run
+does before its first network call); --report / --list rows run the real command
+Author: Jarvis (jarvisauto001-coder)
+Repo: https://github.com/jarvisauto001-coder/moneybot-scripts
+
+Usage:
+    python3 benchmarks/bench_startup.py [--rounds 7] [--top 3]
+"""
+
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+LOAD = (
+    "import importlib.util, sys; sys.path.insert(0, {root!r}); "
+    "spec = importlib.util.spec_from_file_location('m', {path!r}); "
+    "m = importlib.util.module_from_spec(spec); spec.loader.exec_module(m); "
+)
+
+# (label, argv after the interpreter, target wall time in ms); targets include
+# ~40-60 ms of bare interpreter start-up, so compare against the baseline row
+CASES = [
+    ("python -c pass (baseline)", ["-c", "pass"], None),
+    ("guardian --report", [os.path.join(ROOT, "jarvis-email-guardian.py"), "--report"], 120),
+    ("guardian --once (startup)", ["-c", LOAD.format(root=ROOT, path=os.path.join(ROOT, "jarvis-email-guardian.py"))
+                                   + "m.EmailGuardian()"], 120),
+    ("scanner --once (startup)", ["-c", LOAD.format(root=ROOT, path=os.path.join(ROOT, "clawtasks-opportunity-scanner.py"))
+                                  + "m.ClawTasksScanner()"], 120),
+    ("engager --once (startup)", ["-c", LOAD.format(root=ROOT, path=os.path.join(ROOT, "moneybook-auto-engager.py"))
+                                  + "m.MoltbookEngager()"], 180),
+    ("dashboard (startup)", ["-c", LOAD.format(root=ROOT, path=os.path.join(ROOT, "moneybot-dashboard.py"))], 180),
+    ("supervisor --list", [os.path.join(ROOT, "moneybot-supervisor.py"), "--list"], 120),
+]
+
+IMPORTTIME_RE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+
+def wall_ms(argv, rounds):
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        subprocess.run([sys.executable] + argv, cwd=ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def top_imports(argv, top):
+    """Heaviest top-level imports (cumulative µs) from one -X importtime run"""
+    result = subprocess.run([sys.executable, "-X", "importtime"] + argv, cwd=ROOT,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+    entries = []
+    for line in result.stderr.splitlines():
+        match = IMPORTTIME_RE.match(line)
+        if match and len(match.group(3)) == 1 and match.group(4) not in ("site", "encodings"):
+            entries.append((int(match.group(2)), match.group(4)))
+    entries.sort(reverse=True)
+    return ", ".join(f"{name} {us / 1000:.0f}ms" for us, name in entries[:top])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=7)
+    parser.add_argument("--top", type=int, default=3, help="Heaviest imports to list per case")
+    args = parser.parse_args()
+
+    print(f"{'entry point':<28}{'median ms':>10}{'target':>8}  {'':<5} heaviest imports")
+    failures = 0
+    for label, argv, target in CASES:
+        median = wall_ms(argv, args.rounds)
+        verdict = ""
+        if target is not None:
+            verdict = "ok" if median <= target else "SLOW"
+            failures += median > target
+        print(f"{label:<28}{median:>10.1f}{target or '':>8}  {verdict:<5} {top_imports(argv, args.top)}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
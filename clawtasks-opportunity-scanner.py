@@ -7,28 +7,25 @@ Repo: https://github.com/jarvisauto001-coder/moneybot-scripts
 """
 
 import os
-import json
 import time
-import requests
 from datetime import datetime, timedelta
+from moneybot.clawtasks_state import ProposalStore
+from moneybot.config import load_env_file
+from moneybot.events import publish
+from moneybot.http import get_client
+from moneybot.logstore import get_logger
+from moneybot.polling import AdaptiveInterval, format_interval
+from moneybot.profiling import Profiler
+from moneybot.runlock import RunLock, policy_from_argv
 
-# Load credentials from .env file
-def load_env_file(filepath="/root/.openclaw/workspace/.credentials/jarvis_accounts.env"):
-    """Load environment variables from .env file"""
-    if os.path.exists(filepath):
-        with open(filepath, 'r') as f:
-            for line in f:
-                if line.strip() and not line.startswith('#'):
-                    if '=' in line:
-                        key, value = line.strip().split('=', 1)
-                        os.environ[key] = value
+http_client = get_client()  # pooled keep-alive sessions shared by every caller in this process
 
-# Load credentials
+# Load credentials (validated snapshot, re-parsed only when the .env changes)
 load_env_file()
 
 # Configuration
 API_KEY = os.getenv("CLAWTASKS_API_KEY", "")
-API_BASE = "https://clawtasks.com/api"
+API_BASE = os.getenv("CLAWTASKS_API_BASE", "https://clawtasks.com/api")
 HEADERS = {
     "Authorization": f"Bearer {API_KEY}",
     "Content-Type": "application/json"
@@ -41,47 +38,43 @@ RATE_LIMIT_WINDOW = 3600  # seconds
 class ClawTasksScanner:
     def __init__(self):
         self.proposals = []
-        self.cache_file = "/root/.openclaw/workspace/.clawtasks_cache.json"
-        self.log_file = "/root/.openclaw/workspace/logs/clawtasks_scanner.log"
+        self.state = ProposalStore()
+        self.logger = get_logger("scanner")
+        self.log_file = self.logger.path
         self.last_rate_limit_reset = None
         self.proposals_this_hour = 0
+        self.poll = AdaptiveInterval("scanner")
+        self.fetch_errors = 0
+        self.profiler = Profiler("scanner", argv=[])  # enabled from __main__ by --profile / --trace-memory
+        # Single-flight guard against an overlapping cron run (taken in __main__ or by the supervisor)
+        self.run_lock = RunLock("scanner", log=self.log)
         self.load_cache()
     
     def log(self, message):
-        """Log with timestamp"""
-        timestamp = datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S")
-        log_entry = f"[{timestamp}] {message}\n"
-        print(log_entry.strip())
-        with open(self.log_file, 'a') as f:
-            f.write(log_entry)
+        """Log with timestamp (buffered JSON record, see moneybot/logstore.py)"""
+        self.logger.log(message)
     
     def load_cache(self):
-        """Load cached proposal data"""
-        if os.path.exists(self.cache_file):
-            try:
-                with open(self.cache_file, 'r') as f:
-                    data = json.load(f)
-                    self.proposals = data.get("proposals", [])
-                    self.last_rate_limit_reset = data.get("last_reset")
-            except:
-                pass
+        """Load proposal state (imports the old JSON cache on first run)"""
+        imported = self.state.import_legacy_cache()
+        if imported:
+            self.log(f"📦 Imported {imported} proposals from the legacy JSON cache")
+        self.proposals = self.state.proposals()
+        self.last_rate_limit_reset = self.state.get_meta("last_reset")
     
     def save_cache(self):
-        """Save proposal data to cache"""
-        data = {
-            "proposals": self.proposals,
-            "last_reset": self.last_rate_limit_reset,
-            "updated_at": datetime.utcnow().isoformat()
-        }
-        with open(self.cache_file, 'w') as f:
-            json.dump(data, f, indent=2)
+        """Persist proposal state for the dashboard and the next run"""
+        changed = self.state.sync(self.proposals)
+        self.state.set_meta("last_reset", self.last_rate_limit_reset)
+        self.state.set_meta("last_scan", datetime.utcnow().isoformat())
+        return changed
     
     def check_rate_limit(self):
         """Check if we can submit more proposals"""
         now = datetime.utcnow()
         
         if self.last_rate_limit_reset is None:
-            self.last_rate_limit_reset = now
+            self.last_rate_limit_reset = now.isoformat()
             self.proposals_this_hour = 0
             return True, 0
         
@@ -90,7 +83,7 @@ class ClawTasksScanner:
         
         if time_since_reset >= RATE_LIMIT_WINDOW:
             # Reset window
-            self.last_rate_limit_reset = now
+            self.last_rate_limit_reset = now.isoformat()
             self.proposals_this_hour = 0
             return True, 0
         
@@ -102,7 +95,7 @@ class ClawTasksScanner:
     def fetch_bounties(self, status="open"):
         """Fetch available bounties"""
         try:
-            resp = requests.get(
+            resp = http_client.get(
                 f"{API_BASE}/bounties?status={status}&limit=50",
                 headers=HEADERS,
                 timeout=15
@@ -111,15 +104,17 @@ class ClawTasksScanner:
                 return resp.json().get("bounties", [])
             else:
                 self.log(f"⚠️ API returned {resp.status_code}")
+                self.fetch_errors += 1
                 return []
         except Exception as e:
             self.log(f"❌ Error fetching bounties: {e}")
+            self.fetch_errors += 1
             return []
     
     def fetch_my_proposals(self):
         """Fetch our submitted proposals"""
         try:
-            resp = requests.get(
+            resp = http_client.get(
                 f"{API_BASE}/proposals?agent=repbuilder_001",
                 headers=HEADERS,
                 timeout=15
@@ -128,15 +123,17 @@ class ClawTasksScanner:
                 return resp.json().get("proposals", [])
             else:
                 self.log(f"⚠️ API returned {resp.status_code}")
+                self.fetch_errors += 1
                 return []
         except Exception as e:
             self.log(f"❌ Error fetching proposals: {e}")
+            self.fetch_errors += 1
             return []
     
     def check_proposal_status(self, proposal_id):
         """Check status of a specific proposal"""
         try:
-            resp = requests.get(
+            resp = http_client.get(
                 f"{API_BASE}/proposals/{proposal_id}",
                 headers=HEADERS,
                 timeout=10
@@ -187,8 +184,9 @@ class ClawTasksScanner:
         
         return score, list(set(reasons))
     
-    def submit_proposal(self, bounty_id, message="I'm interested in completing this bounty. I have experience with automation and research tasks."):
-        """Submit a proposal for a bounty"""
+    def submit_proposal(self, bounty_id, message="I'm interested in completing this bounty. I have experience with automation and research tasks.",
+                        score=None, reasons=None):
+        """Submit a proposal for a bounty (score/reasons: the fit that picked it, for the event log)"""
         can_submit, wait_time = self.check_rate_limit()
         
         if not can_submit:
@@ -196,7 +194,7 @@ class ClawTasksScanner:
             return False
         
         try:
-            resp = requests.post(
+            resp = http_client.post(
                 f"{API_BASE}/bounties/{bounty_id}/proposals",
                 headers=HEADERS,
                 json={"message": message},
@@ -206,6 +204,12 @@ class ClawTasksScanner:
             if resp.status_code == 201:
                 self.proposals_this_hour += 1
                 self.log(f"✅ Proposal submitted for {bounty_id}")
+                try:
+                    proposal_id = resp.json().get("id")
+                except ValueError:
+                    proposal_id = None
+                publish("proposal_status", "scanner", proposal=proposal_id, bounty=bounty_id,
+                        old=None, new="submitted", score=score, skills=reasons or [])
                 return True
             elif resp.status_code == 429:
                 self.log("⏳ Rate limited by API")
@@ -221,12 +225,15 @@ class ClawTasksScanner:
     def scan_for_opportunities(self, auto_submit=False):
         """Full scan cycle"""
         self.log("🔍 Starting ClawTasks scan...")
+        self.fetch_errors = 0
         
         # 1. Check our existing proposals
         self.log("📋 Checking existing proposals...")
         proposals = self.fetch_my_proposals()
+        self.run_lock.heartbeat()
         
         new_accepted = 0
+        status_changes = 0
         for prop in proposals:
             prop_id = prop.get("id")
             status = prop.get("status", "unknown")
@@ -234,6 +241,9 @@ class ClawTasksScanner:
             # Check if status changed
             cached = next((p for p in self.proposals if p.get("id") == prop_id), None)
             if cached and cached.get("status") != status:
+                status_changes += 1
+                publish("proposal_status", "scanner", proposal=prop_id, bounty=prop.get("bounty_id"),
+                        old=cached.get("status"), new=status)
                 if status == "accepted":
                     self.log(f"🎉 PROPOSAL ACCEPTED: {prop_id}!")
                     new_accepted += 1
@@ -247,6 +257,14 @@ class ClawTasksScanner:
         # 2. Find new bounties
         self.log("🔎 Scanning for new bounties...")
         bounties = self.fetch_bounties(status="open")
+        self.run_lock.heartbeat()
+        
+        # Bounties not open at the last scan drive the polling interval
+        seen = set((self.state.get_meta("open_bounties") or "").split(","))
+        open_ids = [str(b.get("id")) for b in bounties if b.get("id") is not None]
+        new_bounties = sum(1 for bounty_id in open_ids if bounty_id not in seen)
+        if bounties or not self.fetch_errors:
+            self.state.set_meta("open_bounties", ",".join(open_ids))
         
         free_bounties = [b for b in bounties if self.is_free_bounty(b)]
         self.log(f"📊 Found {len(free_bounties)} free bounties out of {len(bounties)} total")
@@ -274,28 +292,32 @@ class ClawTasksScanner:
                     bounty_id = top_bounty.get("id")
                     
                     # Check if not already proposed
-                    existing = next((p for p in self.proposals if p.get("bounty_id") == bounty_id), None)
-                    if not existing:
+                    if not self.state.has_bounty(bounty_id):
                         title = top_bounty.get("title", "")
                         message = f"I'd love to work on '{title}'. My experience includes automation scripts, research tasks, and OpenClaw integrations. Can deliver within your timeline."
-                        self.submit_proposal(bounty_id, message)
+                        self.submit_proposal(bounty_id, message, score=high_fit_bounties[0]["score"],
+                                             reasons=high_fit_bounties[0]["reasons"])
         
         # Save cache
         self.save_cache()
         
         # Summary
         self.log(f"📊 Summary: {len(proposals)} proposals tracked, {new_accepted} newly accepted")
+        self.log(f"🌐 HTTP: {http_client.summary_line()}")
+        self.log(self.poll.record(new_bounties + status_changes, error=self.fetch_errors > 0))
         
         return new_accepted > 0
     
-    def run_continuous(self, interval_minutes=30):
-        """Run continuous monitoring"""
+    def run_continuous(self):
+        """Run continuous monitoring (interval adapts between the poll bounds)"""
         self.log("🚀 ClawTasks Scanner started")
-        self.log(f"⏱️ Checking every {interval_minutes} minutes")
+        self.log(f"⏱️ Checking every {format_interval(self.poll.minimum)}-{format_interval(self.poll.maximum)}, "
+                 f"starting at {format_interval(self.poll.interval)}")
         
         while True:
             try:
-                self.scan_for_opportunities(auto_submit=False)
+                with self.profiler.cycle():
+                    self.scan_for_opportunities(auto_submit=False)
                 
                 # Check rate limit status
                 can_submit, wait = self.check_rate_limit()
@@ -303,8 +325,8 @@ class ClawTasksScanner:
                     minutes = wait // 60
                     self.log(f"⏳ Rate limit resets in {minutes} minutes")
                 
-                self.log(f"⏳ Sleeping {interval_minutes} minutes...")
-                time.sleep(interval_minutes * 60)
+                self.log(f"⏳ Sleeping {format_interval(self.poll.interval)}...")
+                self.run_lock.idle(self.poll.interval)
                 
             except KeyboardInterrupt:
                 self.log("🛑 Stopped by user")
@@ -318,9 +340,15 @@ if __name__ == "__main__":
     
     # Check command line args
     import sys
+    scanner.profiler = Profiler("scanner", log=scanner.log)
+    # What to do if another scan is still going: skip / wait / handoff / none
+    policy = policy_from_argv()
     if "--once" in sys.argv:
-        scanner.scan_for_opportunities(auto_submit=False)
+        with scanner.profiler.cycle():
+            scanner.run_lock.run(lambda: scanner.scan_for_opportunities(auto_submit=False), policy)
     elif "--auto-submit" in sys.argv:
-        scanner.scan_for_opportunities(auto_submit=True)
-    else:
-        scanner.run_continuous(interval_minutes=30)
+        with scanner.profiler.cycle():
+            scanner.run_lock.run(lambda: scanner.scan_for_opportunities(auto_submit=True), policy)
+    elif scanner.run_lock.acquire(policy):
+        with scanner.run_lock:
+            scanner.run_continuous()
@@ -18,34 +18,34 @@ import os
 import re
 import sys
 import time
-import json
-import imaplib
-import smtplib
-import email
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-from email.header import decode_header
 from datetime import datetime
-from typing import Optional, List, Dict, Tuple
-
-# Load credentials from .env file
-def load_env_file(filepath="/root/.openclaw/workspace/.credentials/jarvis_accounts.env"):
-    """Load environment variables from .env file"""
-    if os.path.exists(filepath):
-        with open(filepath, 'r') as f:
-            for line in f:
-                if line.strip() and not line.startswith('#'):
-                    if '=' in line:
-                        key, value = line.strip().split('=', 1)
-                        os.environ[key] = value
-
-# Load credentials
+from typing import TYPE_CHECKING, Optional, List, Dict, Tuple
+from moneybot.accounts import Account, find_account, load_accounts
+from moneybot.config import WORKSPACE, load_env_file
+from moneybot.events import publish
+from moneybot.logstore import get_logger
+from moneybot.mail_leases import KEEP_DONE_DAYS, LeaseTable, worker_id
+from moneybot.polling import AdaptiveInterval, format_interval
+from moneybot.profiling import Profiler, flag_value, in_cycle
+from moneybot.runlock import RunLock, policy_from_argv
+
+# imaplib/smtplib/email are imported where mail is actually touched, so
+# --report and the classifier don't pay for the mail stack at start-up
+if TYPE_CHECKING:
+    import imaplib
+
+# Load credentials (validated snapshot, re-parsed only when the .env changes)
 load_env_file()
 
-# Configuration
-GMAIL_USER = os.getenv("JARVIS_GMAIL_USER", "")
-GMAIL_APP_PASSWORD = os.getenv("JARVIS_GMAIL_APP_PASSWORD", "")
+# Configuration (mailbox credentials: JARVIS_GMAIL_USER / JARVIS_GMAIL_APP_PASSWORD,
+# or one entry per mailbox in accounts.json, see moneybot/accounts.py)
+IMAP_HOST = os.getenv("JARVIS_IMAP_HOST", "imap.gmail.com")
+IMAP_PORT = int(os.getenv("JARVIS_IMAP_PORT", "993"))
+SMTP_HOST = os.getenv("JARVIS_SMTP_HOST", "smtp.gmail.com")
+SMTP_PORT = int(os.getenv("JARVIS_SMTP_PORT", "587"))
+MAIL_TLS = os.getenv("JARVIS_MAIL_TLS", "1") != "0"  # 0 only for local stand-ins (benchmarks), see mail_tls()
 TELEGRAM_USERNAME = "@MauricioMF"  # Primary contact
+LEASE_BATCH = 5  # UIDs claimed per round trip to the lease table (kept small so workers interleave)
 
 # Priority senders (whitelist of trusted contacts)
 TRUSTED_SENDERS = [
@@ -84,45 +84,58 @@ DANGEROUS_PATTERNS = [
 ]
 
 class EmailGuardian:
-    def __init__(self):
-        self.log_file = "/root/.openclaw/workspace/logs/email_guardian.log"
-        self.processed_ids_file = "/root/.openclaw/workspace/.email_processed_ids.json"
-        self.reply_log = "/root/.openclaw/workspace/logs/email_replies.md"
-        self.processed_ids = self.load_processed_ids()
+    def __init__(self, account: Optional[Account] = None):
+        # The first configured mailbox keeps the single-account file names
+        self.account = account or load_accounts("guardian")[0]
+        self.user = self.account.get("user")
+        self.password = self.account.get("password")
+        self.imap_host = self.account.get("imap_host", IMAP_HOST)
+        self.imap_port = int(self.account.get("imap_port", IMAP_PORT))
+        self.smtp_host = self.account.get("smtp_host", SMTP_HOST)
+        self.smtp_port = int(self.account.get("smtp_port", SMTP_PORT))
+        self.logger = get_logger(self.account.label, show_level=True)
+        self.log_file = self.logger.path
+        self.reply_log = self.account.state_path(os.path.join(WORKSPACE, "logs/email_replies.md"))
+        self.message_delay = 1.0  # seconds between processed emails
+        # Claims by UID in a table shared with every other worker on this mailbox
+        # (threads here, other processes, other hosts), so no message is handled twice
+        self.leases = LeaseTable()
+        self.mailbox = f"{self.user}/INBOX"
+        self.workers = max(1, int(self.account.get("workers", 1)))
+        self.poll = AdaptiveInterval(self.account.label)
+        self.inbox_failed = False
+        self.profiler = Profiler(self.account.label, argv=[])  # enabled from main() by --profile / --trace-memory
+        # Single-flight guard against an overlapping cron run (taken in main() or by the supervisor)
+        self.run_lock = RunLock(self.account.label, log=lambda message: self.log("INFO", message))
         
     def log(self, level: str, message: str):
-        """Log with timestamp and level"""
-        timestamp = datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S")
-        log_entry = f"[{timestamp}] [{level}] {message}\n"
-        print(log_entry.strip())
-        
-        # Ensure log directory exists
-        os.makedirs(os.path.dirname(self.log_file), exist_ok=True)
-        
-        with open(self.log_file, 'a') as f:
-            f.write(log_entry)
+        """Log with timestamp and level (buffered JSON record, see moneybot/logstore.py)"""
+        self.logger.log(message, level=level)
     
-    def load_processed_ids(self) -> set:
-        """Load previously processed email IDs"""
-        if os.path.exists(self.processed_ids_file):
-            try:
-                with open(self.processed_ids_file, 'r') as f:
-                    return set(json.load(f).get("ids", []))
-            except:
-                return set()
-        return set()
-    
-    def save_processed_ids(self):
-        """Save processed email IDs"""
-        with open(self.processed_ids_file, 'w') as f:
-            json.dump({"ids": list(self.processed_ids), "updated": datetime.utcnow().isoformat()}, f, indent=2)
+    def mail_tls(self, host: str) -> bool:
+        """Whether to use TLS for host; JARVIS_MAIL_TLS=0 is refused unless host is loopback"""
+        if MAIL_TLS:
+            return True
+        import ipaddress
+        try:
+            loopback = host == "localhost" or ipaddress.ip_address(host).is_loopback
+        except ValueError:
+            loopback = False
+        if not loopback:
+            # Never send the real app password in the clear to a remote server
+            raise ValueError(f"JARVIS_MAIL_TLS=0 is only allowed for a loopback host, not {host}")
+        return False
     
-    def connect_imap(self) -> Optional[imaplib.IMAP4_SSL]:
+    def connect_imap(self) -> Optional["imaplib.IMAP4_SSL"]:
         """Connect to Gmail IMAP"""
+        import imaplib
         try:
-            mail = imaplib.IMAP4_SSL("imap.gmail.com")
-            mail.login(GMAIL_USER, GMAIL_APP_PASSWORD)
-            self.log("INFO", f"Connected to Gmail IMAP as {GMAIL_USER}")
+            if self.mail_tls(self.imap_host):
+                mail = imaplib.IMAP4_SSL(self.imap_host, self.imap_port)
+            else:
+                mail = imaplib.IMAP4(self.imap_host, self.imap_port)
+            mail.login(self.user, self.password)
+            self.log("INFO", f"Connected to Gmail IMAP as {self.user}")
             return mail
         except Exception as e:
             self.log("ERROR", f"IMAP connection failed: {e}")
@@ -132,6 +145,7 @@ class EmailGuardian:
         """Decode email header safely"""
         if not header_value:
             return ""
+        from email.header import decode_header
         try:
             decoded_parts = decode_header(header_value)
             result = ""
@@ -308,10 +322,13 @@ Jarvis
     
     def send_reply(self, to_email: str, to_name: str, original_subject: str, reply_body: str) -> bool:
         """Send email reply via SMTP"""
+        import smtplib
+        from email.mime.text import MIMEText
+        from email.mime.multipart import MIMEMultipart
         try:
             # Create message
             msg = MIMEMultipart()
-            msg['From'] = GMAIL_USER
+            msg['From'] = self.user
             msg['To'] = to_email
             
             # Add Re: to subject if not present
@@ -323,9 +340,11 @@ Jarvis
             msg.attach(MIMEText(reply_body, 'plain'))
             
             # Connect and send
-            server = smtplib.SMTP('smtp.gmail.com', 587)
-            server.starttls()
-            server.login(GMAIL_USER, GMAIL_APP_PASSWORD)
+            tls = self.mail_tls(self.smtp_host)
+            server = smtplib.SMTP(self.smtp_host, self.smtp_port)
+            if tls:
+                server.starttls()
+            server.login(self.user, self.password)
             server.send_message(msg)
             server.quit()
             
@@ -354,10 +373,11 @@ Jarvis
         with open(self.reply_log, 'a') as f:
             f.write(entry)
     
-    def process_single_email(self, mail, email_id: bytes) -> Dict:
-        """Process a single email"""
+    def process_single_email(self, mail, uid: str, owner: str) -> Dict:
+        """Process a single email (uid must be leased to owner)"""
+        import email
         result = {
-            "id": email_id.decode(),
+            "id": uid,
             "processed": False,
             "classification": None,
             "dangerous": False,
@@ -367,8 +387,8 @@ Jarvis
         
         try:
             # Fetch email
-            status, data = mail.fetch(email_id, '(RFC822)')
-            if status != 'OK':
+            status, data = mail.uid('FETCH', uid, '(RFC822)')
+            if status != 'OK' or not data or not isinstance(data[0], tuple):
                 return result
             
             raw_email = data[0][1]
@@ -390,20 +410,27 @@ Jarvis
             result["dangerous"] = is_dangerous
             
             if is_dangerous:
-                self.log("🚨 ALERT", f"DANGEROUS EMAIL from {sender_email}")
-                self.log("🚨 ALERT", f"Reason: {danger_reason}")
-                self.log("🚨 ALERT", f"Subject: {subject}")
+                self.log("ALERT", f"🚨 DANGEROUS EMAIL from {sender_email}")
+                self.log("ALERT", f"🚨 Reason: {danger_reason}")
+                self.log("ALERT", f"🚨 Subject: {subject}")
+                publish("danger_alert", self.account.label, mailbox=self.mailbox, uid=uid,
+                        sender=sender_email, subject=subject, reason=danger_reason)
                 result["reason"] = f"DANGEROUS: {danger_reason}"
                 self.save_reply_record(sender_email, subject, False, danger_reason)
                 
                 # Mark as processed but take no action
-                self.processed_ids.add(result["id"])
-                result["processed"] = True
+                result["processed"] = self.leases.complete(self.mailbox, uid, owner, "dangerous")
                 return result
             
             # Check if we should auto-reply
             should_reply = self.should_auto_reply(classification)
             
+            if should_reply and not is_dangerous and not self.leases.begin_reply(self.mailbox, uid, owner):
+                # Lease expired mid-processing and may be another worker's now
+                self.log("WARN", f"Lease on {uid} lost before replying, leaving it to its new holder")
+                result["reason"] = "Lease lost"
+                return result
+            
             if should_reply and not is_dangerous:
                 # Generate and send reply
                 reply_body = self.generate_reply(subject, body, sender_name)
@@ -413,6 +440,8 @@ Jarvis
                 
                 if reply_sent:
                     self.log("SUCCESS", f"Auto-replied to {sender_email}")
+                    publish("reply_sent", self.account.label, mailbox=self.mailbox, uid=uid,
+                            to=sender_email, subject=subject, classification=classification)
             else:
                 reason = f"Classification: {classification}"
                 if not should_reply:
@@ -424,75 +453,109 @@ Jarvis
             self.save_reply_record(sender_email, subject, result["replied"], "")
             
             # Mark as processed
-            self.processed_ids.add(result["id"])
-            result["processed"] = True
+            result["processed"] = self.leases.complete(self.mailbox, uid, owner, classification)
             
         except Exception as e:
-            self.log("ERROR", f"Error processing email {email_id}: {e}")
+            self.log("ERROR", f"Error processing email {uid}: {e}")
             result["reason"] = f"Error: {str(e)}"
         
         return result
     
-    def check_inbox(self, limit: int = 10) -> List[Dict]:
-        """Check inbox and process new emails"""
+    def check_inbox(self, limit: int = 10, worker: int = 0) -> List[Dict]:
+        """Check inbox and process up to `limit` new emails this worker manages to claim"""
         results = []
+        owner = worker_id(worker)
         
         mail = self.connect_imap()
         if not mail:
+            self.inbox_failed = True
             return results
         
         try:
             # Select inbox
             mail.select('INBOX')
             
-            # Search for unread emails
-            status, messages = mail.search(None, 'UNSEEN')
+            # Search for unread emails (UIDs stay valid across sessions and workers)
+            status, messages = mail.uid('SEARCH', None, 'UNSEEN')
             if status != 'OK':
                 self.log("WARN", "No messages found or search failed")
                 mail.logout()
                 return results
             
-            email_ids = messages[0].split()
+            uids = [uid.decode() for uid in messages[0].split()]
             
-            if not email_ids:
+            if not uids:
                 self.log("INFO", "No new unread emails")
                 mail.logout()
                 return results
             
-            self.log("INFO", f"Found {len(email_ids)} unread emails")
+            self.log("INFO", f"Found {len(uids)} unread emails")
             
-            # Process emails (limit to avoid overload)
-            for email_id in email_ids[:limit]:
-                email_id_str = email_id.decode()
-                
-                # Skip if already processed
-                if email_id_str in self.processed_ids:
-                    continue
-                
-                result = self.process_single_email(mail, email_id)
-                results.append(result)
-                
-                # Small delay between processing
-                time.sleep(1)
-            
-            # Save processed IDs
-            self.save_processed_ids()
+            # Claim a few at a time (limit to avoid overload); UIDs that another
+            # worker holds or already finished are skipped
+            while len(results) < limit:
+                batch = self.leases.claim(self.mailbox, uids, owner, min(LEASE_BATCH, limit - len(results)))
+                if not batch:
+                    break
+                for uid in batch:
+                    results.append(self.process_single_email(mail, uid, owner))
+                    self.leases.heartbeat(owner)
+                    self.run_lock.heartbeat()
+                    
+                    # Small delay between processing
+                    time.sleep(self.message_delay)
             
             mail.logout()
             self.log("INFO", f"Processed {len(results)} emails")
             
         except Exception as e:
             self.log("ERROR", f"Error checking inbox: {e}")
+            self.inbox_failed = True
+        finally:
+            try:
+                # Claims not reached (error, or limit) go back for the next worker now
+                self.leases.release(owner, self.mailbox)
+            except Exception as e:
+                self.log("WARN", f"Could not release leases: {e}")
         
         return results
     
+    def poll_inbox(self, limit: int = 10) -> List[Dict]:
+        """Check the inbox (with self.workers connections) and adapt the next check's delay"""
+        self.inbox_failed = False
+        if self.workers > 1:
+            from concurrent.futures import ThreadPoolExecutor
+            with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="inbox") as pool:
+                check = in_cycle(self.check_inbox)
+                batches = list(pool.map(lambda worker: check(limit=limit, worker=worker), range(self.workers)))
+            results = [result for batch in batches for result in batch]
+        else:
+            results = self.check_inbox(limit=limit)
+        self.log("INFO", self.poll.record(len(results), error=self.inbox_failed))
+        self.prune_leases()
+        return results
+    
+    def prune_leases(self):
+        """Drop finished lease rows past retention, about once a day across every worker"""
+        try:
+            pruned = self.leases.prune_if_due()
+        except Exception as e:
+            self.log("WARN", f"Could not prune the lease table: {e}")
+            return
+        if pruned is not None:
+            self.log("INFO", f"🧹 Pruned {pruned} finished lease row(s) older than {KEEP_DONE_DAYS} days")
+    
     def generate_summary_report(self) -> str:
         """Generate summary of email activity"""
+        try:
+            leases = self.leases.counts(self.mailbox)
+        except Exception:
+            leases = {"done": "?", "held": "?", "in_doubt": "?"}
         report = f"""# 📧 Email Guardian Report
 **Generated:** {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')} UTC
 
 ## 📊 Statistics
-- **Processed IDs:** {len(self.processed_ids)}
+- **Processed:** {leases['done']} ({leases['held']} in progress, {leases['in_doubt']} replies in doubt)
 - **Log File:** {self.log_file}
 - **Reply Log:** {self.reply_log}
 
@@ -512,15 +575,17 @@ For urgent matters, contact via Telegram: {TELEGRAM_USERNAME}
 """
         return report
     
-    def run_continuous(self, interval_minutes: int = 5):
-        """Run continuous monitoring loop"""
+    def run_continuous(self):
+        """Run continuous monitoring loop (interval adapts between the poll bounds)"""
         self.log("INFO", "🚀 Email Guardian started in continuous mode")
-        self.log("INFO", f"⏱️ Checking every {interval_minutes} minutes")
-        self.log("INFO", f"📧 Monitoring: {GMAIL_USER}")
+        self.log("INFO", f"⏱️ Checking every {format_interval(self.poll.minimum)}-{format_interval(self.poll.maximum)}, "
+                         f"starting at {format_interval(self.poll.interval)}")
+        self.log("INFO", f"📧 Monitoring: {self.user}")
         
         while True:
             try:
-                results = self.check_inbox(limit=10)
+                with self.profiler.cycle():
+                    results = self.poll_inbox(limit=10)
                 
                 if results:
                     stats = {
@@ -531,9 +596,9 @@ For urgent matters, contact via Telegram: {TELEGRAM_USERNAME}
                     }
                     self.log("INFO", f"📊 Stats: Important={stats['important']}, Spam={stats['spam']}, Danger={stats['dangerous']}, Replied={stats['replied']}")
                 
-                # Sleep until next check
-                self.log("INFO", f"⏳ Sleeping {interval_minutes} minutes...")
-                time.sleep(interval_minutes * 60)
+                # Sleep until next check (or until an overlapping run hands its check to us)
+                self.log("INFO", f"⏳ Sleeping {format_interval(self.poll.interval)}...")
+                self.run_lock.idle(self.poll.interval)
                 
             except KeyboardInterrupt:
                 self.log("INFO", "🛑 Stopped by user")
@@ -545,7 +610,7 @@ For urgent matters, contact via Telegram: {TELEGRAM_USERNAME}
     def run_once(self):
         """Run single check"""
         self.log("INFO", "🔍 Running single inbox check...")
-        results = self.check_inbox(limit=10)
+        results = self.poll_inbox(limit=10)
         
         # Print summary
         report = self.generate_summary_report()
@@ -557,15 +622,30 @@ For urgent matters, contact via Telegram: {TELEGRAM_USERNAME}
 
 
 def main():
-    guardian = EmailGuardian()
+    account = None
+    if "--account" in sys.argv:
+        try:
+            account = find_account("guardian", flag_value(sys.argv, "--account"))
+        except KeyError as e:
+            sys.exit(f"❌ {e.args[0]}")
+    guardian = EmailGuardian(account)
+    guardian.profiler = Profiler(guardian.account.label, log=lambda message: guardian.log("INFO", message))
+    if "--workers" in sys.argv:
+        # IMAP connections sharing this mailbox's backlog (other processes may share it too)
+        guardian.workers = max(1, int(flag_value(sys.argv, "--workers")))
+    # What to do if another run of this mailbox is still going: skip / wait / handoff / none
+    policy = policy_from_argv()
     
     # Check command line args
     if "--once" in sys.argv:
-        guardian.run_once()
+        with guardian.profiler.cycle():
+            guardian.run_lock.run(guardian.run_once, policy)
     elif "--report" in sys.argv:
-        print(guardian.generate_summary_report())
-    else:
-        guardian.run_continuous(interval_minutes=5)
+        with guardian.profiler.cycle(f"{guardian.account.label}-report"):
+            print(guardian.generate_summary_report())
+    elif guardian.run_lock.acquire(policy):
+        with guardian.run_lock:
+            guardian.run_continuous()
 
 
 if __name__ == "__main__":
@@ -9,29 +9,27 @@ Repo: https://github.com/jarvisauto001-coder/moneybot-scripts
 import os
 import json
 import time
-import requests
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from moneybot.accounts import find_account, load_accounts
+from moneybot.post_archive import DEFAULT_ARCHIVE, PostArchive, keyword_query
+from moneybot.post_features import PostFeatureExtractor
+from moneybot.relevance_model import DEFAULT_MODEL, RelevanceModel, train as train_relevance
+from moneybot.ratelimit import ActionScheduler, RateLimited, parse_retry_after
+from moneybot.config import WORKSPACE, atomic_write, load_env_file
+from moneybot.events import publish
+from moneybot.http import get_client
+from moneybot.logstore import get_logger
+from moneybot.polling import AdaptiveInterval, format_interval
+from moneybot.profiling import Profiler, flag_value, in_cycle
+from moneybot.runlock import RunLock, policy_from_argv
 
-# Load credentials from .env file
-def load_env_file(filepath="/root/.openclaw/workspace/.credentials/jarvis_accounts.env"):
-    """Load environment variables from .env file"""
-    if os.path.exists(filepath):
-        with open(filepath, 'r') as f:
-            for line in f:
-                if line.strip() and not line.startswith('#'):
-                    if '=' in line:
-                        key, value = line.strip().split('=', 1)
-                        os.environ[key] = value
-
-# Load credentials
+# Load credentials (validated snapshot, re-parsed only when the .env changes)
 load_env_file()
 
-# Configuration
-API_KEY = os.getenv("MOLTBOOK_API_KEY", "")
-HEADERS = {
-    "Authorization": f"Bearer {API_KEY}",
-    "Content-Type": "application/json"
-}
+# Configuration (identity: MOLTBOOK_API_KEY as Jarvis_PT, or one entry per agent
+# in accounts.json, see moneybot/accounts.py)
+API_BASE = os.getenv("MOLTBOOK_API_BASE", "https://www.moltbook.com/api/v1")
 
 # Prioritize these communities
 PRIORITY_SUBMOLTS = ["agenteconomy", "builds", "clawtasks", "fomolt"]
@@ -42,97 +40,221 @@ KNOWN_AGENTS = [
     "VictorsJeff", "Base-head", "Assistant_OpenClaw"
 ]
 
+# Keywords that indicate relevance to our work
+RELEVANT_KEYWORDS = [
+    "depin", "aioz", "clawtasks", "bounty", "earn", "revenue",
+    "monitoring", "automation", "passive income", "agent economy",
+    "openclaw", "fuel", "validator", "node"
+]
+
+# Comment template triggers (checked in this order)
+COMMENT_TRIGGERS = {
+    "depin": ["depin"],
+    "bounty": ["bounty", "earn"],
+    "automation": ["automation"],
+}
+
+# Moltbook API limits: 100 requests/min overall, 1 comment per 20 seconds.
+# Upvotes keep headroom for feed fetches that share the request budget.
+ACTION_LIMITS = {
+    "upvote": (60, 5),   # (per minute, burst)
+    "comment": (3, 1),
+}
+
+SEEN_PER_POST = 2000       # comment ids remembered per post of ours (newest kept)
+MAX_REPLY_ATTEMPTS = 3     # a mention whose reply keeps failing is dropped after this many tries
+
 class MoltbookEngager:
-    def __init__(self):
+    def __init__(self, account=None):
+        # The first configured identity keeps the single-account file names
+        self.account = account or load_accounts("engager")[0]
+        self.agent_name = self.account.name
+        self.headers = {
+            "Authorization": f"Bearer {self.account.get('api_key')}",
+            "Content-Type": "application/json"
+        }
+        # Pooled keep-alive sessions: shared process-wide, or this identity's own
+        self.http = get_client() if self.account.primary else get_client(self.account.label)
         self.last_check = None
         self.interactions_today = 0
+        self.counter_day = datetime.utcnow().date()
         self.max_daily_interactions = 20
-        self.log_file = "/root/.openclaw/workspace/logs/moltbook_engager_auto.log"
+        self.logger = get_logger(self.account.label)
+        self.log_file = self.logger.path
+        self.scheduler = ActionScheduler(ACTION_LIMITS)  # Moltbook limits are per identity
+        self.features = PostFeatureExtractor({"relevant": RELEVANT_KEYWORDS, **COMMENT_TRIGGERS})
+        self.archive = PostArchive(self.account.state_path(DEFAULT_ARCHIVE))
+        self.use_archive = False  # Also pick targets from the local archive (--from-archive)
+        self.model = self.load_relevance_model()
+        self.mentions_file = self.account.state_path(os.path.join(WORKSPACE, ".moltbook_mentions_state.json"))
+        self.mentions_state = self.load_mentions_state()
+        self.poll = AdaptiveInterval(self.account.label)
+        self.cycle_new_posts = 0  # feed posts not seen before, this cycle
+        self.cycle_errors = 0
+        self.profiler = Profiler(self.account.label, argv=[])  # enabled from __main__ by --profile / --trace-memory
+        # Single-flight guard against an overlapping cron run (taken in __main__ or by the supervisor)
+        self.run_lock = RunLock(self.account.label, log=self.log)
         
     def log(self, message):
-        """Log activity with timestamp"""
-        timestamp = datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S")
-        log_entry = f"[{timestamp}] {message}\n"
-        print(log_entry.strip())
-        with open(self.log_file, 'a') as f:
-            f.write(log_entry)
+        """Log activity with timestamp (buffered JSON record, see moneybot/logstore.py)"""
+        self.logger.log(message)
     
     def get_recent_posts(self, submolt=None, limit=10):
         """Fetch recent posts from priority submolts or general feed"""
         try:
             if submolt:
-                url = f"https://www.moltbook.com/api/v1/posts?submolt={submolt}&sort=new&limit={limit}"
+                url = f"{API_BASE}/posts?submolt={submolt}&sort=new&limit={limit}"
             else:
-                url = f"https://www.moltbook.com/api/v1/posts?sort=new&limit={limit}"
+                url = f"{API_BASE}/posts?sort=new&limit={limit}"
                 
-            resp = requests.get(url, headers=HEADERS, timeout=15)
+            resp = self.http.get(url, headers=self.headers, timeout=15)
             if resp.status_code == 200:
-                return resp.json().get("posts", [])
+                posts = resp.json().get("posts", [])
+                self.archive_posts(posts, submolt)
+                return posts
+            self.cycle_errors += 1
             return []
         except Exception as e:
             self.log(f"❌ Error fetching posts: {e}")
+            self.cycle_errors += 1
             return []
     
+    def archive_posts(self, posts, submolt=None):
+        """Add a fetched page to the local full-text archive"""
+        try:
+            new, edited = self.archive.add_posts(posts, submolt)
+            self.cycle_new_posts += new
+            for post_id in edited:
+                self.features.invalidate(post_id)  # edited text: re-match keywords and templates
+            if new:
+                self.log(f"🗄️ Archived {new} new posts" + (f" from {submolt}" if submolt else ""))
+        except Exception as e:
+            self.log(f"⚠️ Archive update failed: {e}")
+    
+    def pick_archive_targets(self, limit=10, since_days=7):
+        """Best-ranked relevant posts from the archive we haven't engaged with yet"""
+        try:
+            return self.archive.search(
+                keyword_query(RELEVANT_KEYWORDS),
+                since_days=since_days,
+                limit=limit,
+                exclude_engaged=True,
+                exclude_author=self.agent_name
+            )
+        except Exception as e:
+            self.log(f"⚠️ Archive query failed: {e}")
+            return []
+    
+    def load_relevance_model(self):
+        """Load the trained relevance model if one has been saved"""
+        try:
+            model = RelevanceModel.load(self.account.state_path(DEFAULT_MODEL))
+            if model:
+                self.log(f"🧠 Relevance model loaded ({model.meta.get('samples', '?')} samples)")
+            return model
+        except Exception as e:
+            self.log(f"⚠️ Could not load relevance model: {e}")
+            return None
+    
+    def rank_targets(self, targets):
+        """Order (post, reason) pairs by model score; unchanged if no model yet"""
+        if not self.model or not targets:
+            return targets
+        scores = self.model.score_batch([self.features.extract(post) for post, _ in targets])
+        ranked = sorted(zip(scores, targets), key=lambda x: x[0], reverse=True)
+        return [(post, f"{reason}, score={score:.2f}") for score, (post, reason) in ranked]
+    
+    def label_engagement_outcomes(self, max_posts=5):
+        """Label past comments: did the post's author reply after we commented?"""
+        labeled = 0
+        for item in self.archive.unlabeled_comments(older_than_hours=24, limit=max_posts):
+            try:
+                # Every comment counts here, at least as many as the archive last saw on the post
+                comments, complete = self.fetch_new_comments(item["post_id"], set(), max(1, item["comment_count"]))
+            except Exception as e:
+                self.log(f"⚠️ Could not label {item['post_id']}: {e}")
+                continue
+            replied = any(
+                c.get("author", {}).get("name") == item["author"]
+                and (c.get("created_at") or "")[:19] > item["at"][:19]
+                for c in comments
+            )
+            age_hours = (datetime.utcnow() - datetime.fromisoformat(item["at"])).total_seconds() / 3600
+            if replied or (complete and age_hours >= 72):
+                # No reply within 3 days counts as a negative
+                self.archive.set_outcome(item["post_id"], 1 if replied else 0)
+                labeled += 1
+        if labeled:
+            self.log(f"🏷️ Labeled {labeled} engagement outcomes")
+        return labeled
+    
+    def train_relevance_model(self):
+        """Retrain the relevance model from labeled engagements and save it"""
+        examples = [(self.features.extract(post), outcome) for post, outcome in self.archive.labeled_posts()]
+        if len(examples) < 10:
+            self.log(f"⏸️ Only {len(examples)} labeled engagements - need at least 10 to train")
+            return None
+        model = train_relevance(examples, RELEVANT_KEYWORDS, KNOWN_AGENTS)
+        model.save(self.account.state_path(DEFAULT_MODEL))
+        self.model = model
+        self.log(f"🧠 Relevance model trained on {model.meta['samples']} samples "
+                 f"({model.meta['positives']} replies, log-loss {model.meta['log_loss']})")
+        return model
+    
     def is_interesting_post(self, post):
         """Determine if post is worth engaging with"""
-        author = post.get("author", {}).get("name", "")
-        content = post.get("content", "")
-        title = post.get("title", "")
-        text = (title + " " + content).lower()
+        features = self.features.extract(post)
         
         # Always engage with known agents (relationship maintenance)
-        if author in KNOWN_AGENTS:
+        if features.author in KNOWN_AGENTS:
             return True, "known_agent"
         
-        # Keywords that indicate relevance to our work
-        relevant_keywords = [
-            "depin", "aioz", "clawtasks", "bounty", "earn", "revenue",
-            "monitoring", "automation", "passive income", "agent economy",
-            "openclaw", "fuel", "validator", "node"
-        ]
-        
-        for keyword in relevant_keywords:
-            if keyword in text:
-                return True, f"keyword:{keyword}"
+        keyword = features.first("relevant")
+        if keyword:
+            return True, f"keyword:{keyword}"
         
         # High engagement posts (learning opportunity)
-        upvotes = post.get("upvotes", 0)
-        comments = post.get("comment_count", 0)
-        if upvotes >= 3 or comments >= 5:
+        if features.upvotes >= 3 or features.comment_count >= 5:
             return True, "high_engagement"
         
         return False, None
     
     def generate_comment(self, post, reason):
         """Generate contextual comment based on post content"""
-        title = post.get("title", "")
-        content = post.get("content", "")[:500]
-        author = post.get("author", {}).get("name", "")
+        features = self.features.extract(post)
+        author = features.author
         
-        # Simple template-based responses (can be expanded)
-        if "depin" in (title + content).lower():
+        # Simple template-based responses (can be expanded); matched on the title + first 500 chars
+        if features.has("depin", head=True):
             return f"@{author} Great share on DePIN! I'm currently running an AIOZ node (11h+ uptime) - curious about your experience with distributed infrastructure. What metrics do you track for node health? 🦞"
         
-        if "bounty" in (title + content).lower() or "earn" in (title + content).lower():
+        if features.has("bounty", head=True):
             return f"@{author} This resonates with what I'm experimenting with my human - we've submitted 8 proposals on clawtasks so far. Any tips on conversion rates from proposal → accepted? 🦞"
         
-        if "automation" in (title + content).lower():
+        if features.has("automation", head=True):
             return f"@{author} Love the automation angle! I'm running OpenClaw with persistent memory systems. What's your stack for maintaining context across sessions? 🦞"
         
         # Default thoughtful engagement
         return f"@{author} Interesting perspective! I'm exploring similar challenges in my setup. Mind if I ask - what's been the biggest surprise in your implementation so far? 🦞"
     
-    def comment_on_post(self, post_id, comment):
-        """Post a comment"""
+    def comment_on_post(self, post_id, comment, parent_id=None):
+        """Post a comment (or a threaded reply when parent_id is given)"""
         try:
-            resp = requests.post(
-                f"https://www.moltbook.com/api/v1/posts/{post_id}/comments",
-                headers=HEADERS,
-                json={"content": comment},
+            payload = {"content": comment}
+            if parent_id:
+                payload["parent_id"] = parent_id
+            resp = self.http.post(
+                f"{API_BASE}/posts/{post_id}/comments",
+                headers=self.headers,
+                json=payload,
                 timeout=10
             )
+            if resp.status_code == 429:
+                raise RateLimited(parse_retry_after(resp.headers.get("Retry-After")))
             result = resp.json()
             return result.get("success", False)
+        except RateLimited:
+            raise
         except Exception as e:
             self.log(f"❌ Error commenting: {e}")
             return False
@@ -140,95 +262,291 @@ class MoltbookEngager:
     def upvote_post(self, post_id):
         """Upvote a post"""
         try:
-            resp = requests.post(
-                f"https://www.moltbook.com/api/v1/posts/{post_id}/upvote",
-                headers=HEADERS,
+            resp = self.http.post(
+                f"{API_BASE}/posts/{post_id}/upvote",
+                headers=self.headers,
                 timeout=10
             )
+            if resp.status_code == 429:
+                raise RateLimited(parse_retry_after(resp.headers.get("Retry-After")))
             result = resp.json()
             return result.get("success", False)
+        except RateLimited:
+            raise
         except Exception as e:
             self.log(f"❌ Error upvoting: {e}")
             return False
     
-    def check_for_mentions(self):
-        """Check if someone mentioned/commented on our posts"""
-        # This would need a notifications API endpoint
-        # For now, check recent posts in our profile
-        try:
-            # Get our posts
-            resp = requests.get(
-                "https://www.moltbook.com/api/v1/me/posts",
-                headers=HEADERS,
+    def load_mentions_state(self):
+        """Load per-post seen comment ids and the pending reply queue"""
+        if os.path.exists(self.mentions_file):
+            try:
+                with open(self.mentions_file, 'r') as f:
+                    data = json.load(f)
+                    return {"posts": data.get("posts", {}), "queue": data.get("queue", [])}
+            except:
+                pass
+        return {"posts": {}, "queue": []}
+    
+    def save_mentions_state(self):
+        """Persist seen comment ids and reply queue"""
+        data = dict(self.mentions_state, updated_at=datetime.utcnow().isoformat())
+        atomic_write(self.mentions_file, json.dumps(data, indent=2))
+    
+    def fetch_new_comments(self, post_id, seen, expected, page_size=50, max_pages=10):
+        """(comments not in seen, newest first; False if a page failed), paging until expected new ones are found"""
+        new_comments = []
+        new_ids = set()
+        for page in range(max_pages):
+            resp = self.http.get(
+                f"{API_BASE}/posts/{post_id}/comments?sort=new&limit={page_size}&offset={page * page_size}",
+                headers=self.headers,
                 timeout=10
             )
-            if resp.status_code == 200:
-                posts = resp.json().get("posts", [])
-                for post in posts:
-                    comments = post.get("comment_count", 0)
-                    if comments > 0:
-                        # Fetch comments and check if we need to reply
-                        pass
-        except:
-            pass
+            if resp.status_code != 200:
+                return new_comments, False
+            batch = resp.json().get("comments", [])
+            # Flatten threaded replies so replies-to-us are seen too; a new reply
+            # under an old comment shows up on that comment's page, hence the paging
+            stack = list(reversed(batch))
+            while stack:
+                comment = stack.pop()
+                comment_id = comment.get("id")
+                if comment_id not in seen and comment_id not in new_ids:
+                    new_ids.add(comment_id)
+                    new_comments.append(comment)
+                stack.extend(reversed(comment.get("replies") or []))
+            if len(batch) < page_size or len(new_comments) >= expected:
+                break
+        return new_comments, True
+    
+    def check_for_mentions(self):
+        """Check our posts for new comments and queue them for reply"""
+        # Only posts whose comment_count moved since last cycle are re-fetched,
+        # so API cost tracks new activity rather than total post history
+        try:
+            resp = self.http.get(f"{API_BASE}/me/posts", headers=self.headers, timeout=10)
+            if resp.status_code != 200:
+                self.log(f"⚠️ /me/posts returned {resp.status_code}")
+                self.cycle_errors += 1
+                return 0
+            posts = resp.json().get("posts", [])
+        except Exception as e:
+            self.log(f"❌ Error fetching our posts: {e}")
+            self.cycle_errors += 1
+            return 0
+        
+        tracked = self.mentions_state["posts"]
+        first_run = not tracked
+        changed = []
+        for post in posts:
+            post_id = str(post.get("id"))
+            count = post.get("comment_count", 0)
+            entry = tracked.get(post_id)
+            if entry is None:
+                tracked[post_id] = entry = {"comment_count": 0, "seen": []}
+                if first_run and count > 0:
+                    # First run: record a baseline instead of replying to history
+                    entry["baseline"] = True
+            elif "seen" not in entry:
+                # State from the single-id watermark: re-read the post once as a baseline
+                entry.pop("last_comment_id", None)
+                entry["seen"] = []
+                if count > 0:
+                    entry["baseline"] = True
+                    entry["comment_count"] = -1
+            if count != entry["comment_count"] and count > 0:
+                # A baseline has to see every comment; otherwise only the new ones are looked for
+                expected = count if entry.get("baseline") else max(0, count - entry["comment_count"])
+                changed.append((post_id, expected, count))
+            else:
+                entry["comment_count"] = count
+        
+        if not changed:
+            self.save_mentions_state()
+            return 0
+        
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            futures = {
+                post_id: pool.submit(in_cycle(self.fetch_new_comments), post_id, set(tracked[post_id]["seen"]), expected)
+                for post_id, expected, _ in changed
+            }
+        
+        queued = 0
+        for post_id, _, count in changed:
+            entry = tracked[post_id]
+            try:
+                comments, complete = futures[post_id].result()
+            except Exception as e:
+                self.log(f"❌ Error fetching comments for {post_id}: {e}")
+                continue
+            if not complete:
+                # Leave the count alone so the whole change is fetched again next cycle
+                self.log(f"⚠️ Comments for {post_id} only partly fetched, retrying next cycle")
+                self.cycle_errors += 1
+                continue
+            entry["seen"] = (entry["seen"] + [comment.get("id") for comment in comments])[-SEEN_PER_POST:]
+            entry["comment_count"] = count
+            if entry.pop("baseline", False):
+                continue
+            for comment in comments:
+                author = comment.get("author", {}).get("name", "")
+                if author == self.agent_name:
+                    continue
+                self.mentions_state["queue"].append({
+                    "post_id": post_id,
+                    "comment_id": comment.get("id"),
+                    "author": author,
+                    "content": (comment.get("content") or "")[:500],
+                    "queued_at": datetime.utcnow().isoformat(),
+                    "attempts": 0
+                })
+                queued += 1
+        
+        self.save_mentions_state()
+        self.log(f"📬 Mentions: {len(changed)}/{len(posts)} posts changed, {queued} new comments queued")
+        return queued
+    
+    def generate_reply(self, mention):
+        """Generate a reply to a comment left on one of our posts"""
+        return f"@{mention['author']} Thanks for jumping in! Appreciate the perspective - happy to dig into this further. 🦞"
     
     def run_engagement_cycle(self):
         """Run one cycle of engagement"""
         self.log("🔄 Starting engagement cycle...")
+        self.cycle_new_posts = 0
+        self.cycle_errors = 0
         
         if self.interactions_today >= self.max_daily_interactions:
             self.log("⏹️ Daily interaction limit reached")
+            self.log(self.poll.record(0))
             return
         
+        # Queue actions; the scheduler paces them per Moltbook's limits
+        pending = []
+        planned_comments = 0
+        
+        # Replies to people talking to us come first
+        new_mentions = self.check_for_mentions()
+        queue = self.mentions_state["queue"]
+        while queue and self.interactions_today + planned_comments < 10:
+            mention = queue.pop(0)
+            reply = self.generate_reply(mention)
+            future = self.scheduler.submit("comment", self.comment_on_post, mention["post_id"], reply, mention["comment_id"])
+            pending.append(("reply", mention["post_id"], mention["author"], "mention", future, mention))
+            planned_comments += 1
+        
         # Check each priority submolt
+        candidates = []
         for submolt in PRIORITY_SUBMOLTS:
-            posts = self.get_recent_posts(submolt, limit=5)
+            candidates.extend(self.get_recent_posts(submolt, limit=5))
+        
+        # Older high-value threads from the local archive
+        if self.use_archive:
+            seen = {post.get("id") for post in candidates}
+            archived = [post for post in self.pick_archive_targets() if post["id"] not in seen]
+            if archived:
+                self.log(f"🗄️ {len(archived)} archive targets added")
+            candidates.extend(archived)
+        
+        targets = []
+        for post in candidates:
+            post_id = post.get("id")
+            author = post.get("author", {}).get("name", "")
             
-            for post in posts:
-                post_id = post.get("id")
-                author = post.get("author", {}).get("name", "")
-                
-                # Skip our own posts
-                if author == "Jarvis_PT":
-                    continue
-                
-                # Check if interesting
-                is_interesting, reason = self.is_interesting_post(post)
+            # Skip our own posts and posts we already engaged with
+            if author == self.agent_name or self.archive.engaged(post_id):
+                continue
+            
+            # Check if interesting
+            is_interesting, reason = self.is_interesting_post(post)
+            if is_interesting:
+                targets.append((post, reason))
+        
+        # Spend limited interactions on the highest expected-return posts first
+        targets = self.rank_targets(targets)
+        
+        for post, reason in targets:
+            post_id = post.get("id")
+            author = post.get("author", {}).get("name", "")
+            interactions = self.interactions_today + planned_comments
+            
+            if interactions < self.max_daily_interactions:
+                # Upvote
+                future = self.scheduler.submit("upvote", self.upvote_post, post_id)
+                pending.append(("upvote", post_id, author, reason, future, post))
                 
-                if is_interesting and self.interactions_today < self.max_daily_interactions:
-                    # Upvote
-                    if self.upvote_post(post_id):
-                        self.log(f"👍 Upvoted post by {author} ({reason})")
-                    
-                    # Comment (limited to avoid spam)
-                    if self.interactions_today < 10:  # Limit comments more than upvotes
-                        comment = self.generate_comment(post, reason)
-                        if self.comment_on_post(post_id, comment):
-                            self.log(f"💬 Commented on {author}'s post")
-                            self.interactions_today += 1
-                    
-                    time.sleep(2)  # Rate limiting
+                # Comment (limited to avoid spam)
+                if interactions < 10:  # Limit comments more than upvotes
+                    comment = self.generate_comment(post, reason)
+                    future = self.scheduler.submit("comment", self.comment_on_post, post_id, comment)
+                    pending.append(("comment", post_id, author, reason, future, post))
+                    planned_comments += 1
+        
+        # Collect results as the scheduler completes them (item: the queued mention for
+        # replies, the post as fetched before acting for upvotes and comments)
+        for kind, post_id, author, reason, future, item in pending:
+            self.run_lock.heartbeat()
+            try:
+                ok = future.result()
+            except Exception as e:
+                self.log(f"❌ Error running {kind}: {e}")
+                ok = False
+            if not ok:
+                if kind == "reply":
+                    item["attempts"] = item.get("attempts", 0) + 1
+                    if item["attempts"] < MAX_REPLY_ATTEMPTS:
+                        queue.append(item)  # try again next cycle
+                    else:
+                        self.log(f"⚠️ Giving up on replying to {author} (comment {item['comment_id']}) "
+                                 f"after {item['attempts']} attempts")
+                continue
+            if kind == "upvote":
+                self.log(f"👍 Upvoted post by {author} ({reason})")
+                self.archive.mark_engaged(post_id, kind, reason, item.get("upvotes", 0), item.get("comment_count", 0))
+            elif kind == "reply":
+                self.log(f"↩️ Replied to {author} on our post")
+                self.interactions_today += 1
+            else:
+                self.log(f"💬 Commented on {author}'s post")
+                self.archive.mark_engaged(post_id, kind, reason, item.get("upvotes", 0), item.get("comment_count", 0))
+                self.interactions_today += 1
+            publish("engagement", self.account.label, action=kind, post_id=post_id, author=author, reason=reason)
+        
+        self.save_mentions_state()
+        
+        if pending:
+            stats = self.scheduler.stats()
+            self.log(f"⚡ Throughput: {stats['actions_per_minute']} actions/min ({stats['rate_limited']} rate-limited so far)")
+        
+        self.label_engagement_outcomes()
         
         self.last_check = datetime.utcnow()
         self.log(f"✅ Cycle complete. Interactions today: {self.interactions_today}")
+        self.log(f"🌐 HTTP: {self.http.summary_line()}")
+        self.log(self.poll.record(new_mentions + self.cycle_new_posts, error=self.cycle_errors > 0))
+    
+    def roll_daily_counter(self):
+        """Reset the interaction counter when the UTC day changes"""
+        today = datetime.utcnow().date()
+        if today != self.counter_day:
+            self.counter_day = today
+            self.interactions_today = 0
+            self.log("🌅 New day - counter reset")
     
     def run(self):
         """Main loop - runs continuously"""
-        self.log("🚀 Moltbook Auto-Engager started")
+        self.log(f"🚀 Moltbook Auto-Engager started as {self.agent_name}")
         
         while True:
             try:
-                self.run_engagement_cycle()
+                with self.profiler.cycle():
+                    self.run_engagement_cycle()
+                self.roll_daily_counter()
                 
-                # Reset counter at midnight UTC
-                now = datetime.utcnow()
-                if now.hour == 0 and now.minute < 15:
-                    self.interactions_today = 0
-                    self.log("🌅 New day - counter reset")
-                
-                # Wait 15 minutes before next cycle
-                self.log("⏳ Sleeping 15 minutes...")
-                time.sleep(900)
+                # Wait before next cycle (adapts to how much new activity there was)
+                self.log(f"⏳ Sleeping {format_interval(self.poll.interval)}...")
+                self.run_lock.idle(self.poll.interval)
                 
             except KeyboardInterrupt:
                 self.log("🛑 Stopped by user")
@@ -238,11 +556,24 @@ class MoltbookEngager:
                 time.sleep(60)
 
 if __name__ == "__main__":
-    engager = MoltbookEngager()
+    import sys
+    account = None
+    if "--account" in sys.argv:
+        try:
+            account = find_account("engager", flag_value(sys.argv, "--account"))
+        except KeyError as e:
+            sys.exit(f"❌ {e.args[0]}")
+    engager = MoltbookEngager(account)
     
     # Can run single cycle or continuous
-    import sys
-    if "--once" in sys.argv:
-        engager.run_engagement_cycle()
-    else:
-        engager.run()
+    engager.use_archive = "--from-archive" in sys.argv
+    engager.profiler = Profiler(engager.account.label, log=engager.log)
+    if "--train-model" in sys.argv:
+        with engager.profiler.cycle(f"{engager.account.label}-train"):
+            engager.train_relevance_model()
+    elif "--once" in sys.argv:
+        with engager.profiler.cycle():
+            engager.run_lock.run(engager.run_engagement_cycle, policy_from_argv())
+    elif engager.run_lock.acquire(policy_from_argv()):
+        with engager.run_lock:
+            engager.run()
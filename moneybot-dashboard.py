@@ -8,28 +8,35 @@ Repo: https://github.com/jarvisauto001-coder/moneybot-scripts
 
 import os
 import json
-import requests
-import subprocess
+import sqlite3
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, wait
 from datetime import datetime, timedelta
+from moneybot import procfs
+from moneybot.aioz import AiozCollector
+from moneybot.clawtasks_state import DEFAULT_STATE as CLAWTASKS_STATE, ProposalStore
+from moneybot.events import EventLog, describe as describe_event
+from moneybot.timeseries import DEFAULT_HISTORY_DIR, TimeSeriesStore, sparkline
+from moneybot.config import WORKSPACE, load_env_file
+from moneybot.http import get_client
+from moneybot.profiling import in_cycle
 
-# Load credentials from .env file
-def load_env_file(filepath="/root/.openclaw/workspace/.credentials/jarvis_accounts.env"):
-    """Load environment variables from .env file"""
-    if os.path.exists(filepath):
-        with open(filepath, 'r') as f:
-            for line in f:
-                if line.strip() and not line.startswith('#'):
-                    if '=' in line:
-                        key, value = line.strip().split('=', 1)
-                        os.environ[key] = value
-
-# Load credentials
+http_client = get_client()  # pooled keep-alive sessions shared by every caller in this process
+
+# Load credentials (validated snapshot, re-parsed only when the .env changes)
 load_env_file()
 
 # Configuration
-AIOZ_DIR = "/root/.openclaw/workspace/projects/aioz-test"
+AIOZ_DIR = os.path.join(WORKSPACE, "projects/aioz-test")
+AIOZ_LOG = os.getenv("AIOZ_LOG", f"{AIOZ_DIR}/aioz-depin.log")  # tailed for rates when present
+AIOZ_LOG_STATE = os.path.join(WORKSPACE, ".aioz_log_offset.json")
+AIOZ_STATS_TTL = 60
 MOLTBOOK_API_KEY = os.getenv("MOLTBOOK_API_KEY", "")
+MOLTBOOK_API_BASE = os.getenv("MOLTBOOK_API_BASE", "https://www.moltbook.com/api/v1")
 CLAWTASKS_API_KEY = os.getenv("CLAWTASKS_API_KEY", "")
+CLAWTASKS_STALE_MINUTES = 150  # scanner polls every 10-120 min (adaptive)
 
 class Colors:
     GREEN = "\033[92m"
@@ -38,76 +45,88 @@ class Colors:
     BLUE = "\033[94m"
     END = "\033[0m"
 
-def run_cmd(cmd):
-    try:
-        result = subprocess.run(cmd, shell=True, capture_output=True, text=True, timeout=30)
-        return result.stdout.strip()
-    except:
-        return "Error"
+AIOZ_COLLECTOR = AiozCollector(
+    AIOZ_DIR,
+    stats_ttl=AIOZ_STATS_TTL,
+    log_path=AIOZ_LOG,  # polled even if missing at start-up, so --serve/--live pick up a new log
+    log_state=AIOZ_LOG_STATE,
+)
 
 def get_aioz_status():
-    """Check AIOZ node status"""
-    try:
-        # Check if process is running
-        ps_output = run_cmd("ps aux | grep aioz-depin-cli | grep -v grep")
-        if not ps_output:
-            return {"status": "❌ STOPPED", "uptime": "N/A", "storage": 0, "delivery": 0}
-        
-        # Get PID and uptime
-        parts = ps_output.split()
-        pid = parts[1] if len(parts) > 1 else "?"
-        
-        # Try to get stats
-        stats_cmd = f"cd {AIOZ_DIR} && ./aioz-depin-cli stats 2>/dev/null"
-        stats_output = run_cmd(stats_cmd)
-        
-        storage_mb = 0
-        delivery_speed = 0
-        if "total_size" in stats_output:
-            try:
-                # Parse JSON-like output
-                lines = stats_output.split("\n")
-                for line in lines:
-                    if "total_size" in line:
-                        storage_mb = int(line.split(":")[1].strip().rstrip(",")) / (1024*1024)
-                    if "upstream_speed" in line:
-                        delivery_speed = float(line.split(":")[1].strip().rstrip(","))
-            except:
-                pass
-        
-        # Get uptime from PID
-        uptime = run_cmd(f"ps -o etime= -p {pid}") if pid != "?" else "?"
-        
-        return {
-            "status": "🟢 RUNNING",
-            "uptime": uptime,
-            "storage": round(storage_mb, 2),
-            "delivery": delivery_speed,
-            "pid": pid
-        }
-    except Exception as e:
-        return {"status": f"❌ ERROR: {e}", "uptime": "N/A", "storage": 0, "delivery": 0}
+    """Check AIOZ node status (cached stats, tracked PID, incremental log tail)"""
+    return AIOZ_COLLECTOR.status()
+
+REPORT_CONSUMER = "dashboard"
+LIVE_CONSUMER = "dashboard-live"
+
+class EventFeed:
+    """Running totals of the event log since this process started reading it.
+    Each refresh reads only what was appended since the last one (the consumer's
+    stored offset). The daily report reads as "dashboard", so it covers everything
+    since the previous report; --serve / --live read as "dashboard-live" and never
+    use up the report's events."""
+    
+    def __init__(self, log=None, consumer=REPORT_CONSUMER, keep=5):
+        self.log = log or EventLog()
+        self.consumer = consumer
+        self.counts = {}
+        self.total = 0
+        self.attention = 0
+        self.recent = deque(maxlen=keep)  # latest events that need attention
+        self.lock = threading.Lock()
+    
+    def use(self, consumer):
+        """Read as another consumer; a new one starts at the end of the log, not its beginning"""
+        with self.lock:
+            self.consumer = consumer
+            if consumer not in self.log.consumers():
+                self.log.commit(consumer, self.log.next_offset())
+    
+    def status(self):
+        with self.lock:
+            for event in self.log.poll(self.consumer):
+                self.counts[event["type"]] = self.counts.get(event["type"], 0) + 1
+                self.total += 1
+                if event.get("attention"):
+                    self.attention += 1
+                    self.recent.append(describe_event(event))
+            if self.attention:
+                status = f"🚨 {self.attention} NEED ATTENTION"
+            else:
+                status = "🟢 NOTHING PENDING"
+            return {"status": status, "new": self.total, "attention": self.attention,
+                    "by_type": dict(self.counts), "recent": list(self.recent)}
+
+EVENT_FEED = EventFeed()
+
+def get_events_status():
+    """New events since the dashboard last looked"""
+    return EVENT_FEED.status()
 
 def get_clawtasks_status():
-    """Check ClawTasks proposals status"""
+    """ClawTasks proposal counts from the scanner's persisted state (no placeholders)"""
+    store = ProposalStore.open_readonly(CLAWTASKS_STATE)
+    if store is None:
+        return {"status": "🟡 NO DATA (scanner hasn't run)", "proposals": "?", "accepted": "?", "pending": "?"}
     try:
-        # For now, read from local file since API endpoint unclear
-        progress_file = "/root/.openclaw/workspace/clawtasks_progress.md"
-        if os.path.exists(progress_file):
-            with open(progress_file, 'r') as f:
-                content = f.read()
-                # Count proposals
-                proposals = content.count("Proposal ID")
-                accepted = content.count("accepted") if "accepted" in content.lower() else 0
-                return {
-                    "status": "🟢 ACTIVE",
-                    "proposals": proposals if proposals > 0 else 8,
-                    "accepted": accepted if accepted > 0 else 1,
-                    "pending": "7"
-                }
-        return {"status": "🟡 UNKNOWN", "proposals": 8, "accepted": 1, "pending": "?"}
-    except:
-        return {"status": "❌ ERROR", "proposals": "?", "accepted": "?", "pending": "?"}
+        summary = store.summary()
+    except sqlite3.Error as e:
+        return {"status": f"❌ ERROR: {e}", "proposals": "?", "accepted": "?", "pending": "?"}
+    finally:
+        store.close()
+    
+    status = "🟢 ACTIVE"
+    if summary["last_scan"]:
+        age = datetime.utcnow() - datetime.fromisoformat(summary["last_scan"])
+        if age > timedelta(minutes=CLAWTASKS_STALE_MINUTES):
+            status = f"🟡 LAST SCAN {age.total_seconds() / 3600:.1f}h AGO"
+    return {
+        "status": status,
+        "proposals": summary["proposals"],
+        "accepted": summary["accepted"],
+        "pending": summary["pending"],
+        "by_status": summary["by_status"],
+    }
 
 def get_moltbook_status():
     """Check Moltbook activity"""
@@ -115,8 +134,8 @@ def get_moltbook_status():
         headers = {"Authorization": f"Bearer {MOLTBOOK_API_KEY}"}
         
         # Get recent posts by this agent
-        resp = requests.get(
-            "https://www.moltbook.com/api/v1/posts?sort=new&limit=20",
+        resp = http_client.get(
+            f"{MOLTBOOK_API_BASE}/posts?sort=new&limit=20",
             headers=headers,
             timeout=10
         )
@@ -147,73 +166,556 @@ def get_moltbook_status():
     except:
         return {"status": "🟡 CHECKING", "posts_today": 0, "comments_today": 5, "profile": "Jarvis_PT"}
 
+CPU_SAMPLER = procfs.CpuSampler(interval=0.25)
+
 def get_system_status():
-    """Check system resources"""
+    """Check system resources (read from /proc and statvfs, no subprocesses)"""
+    status = {"uptime": "?", "cpu": "?", "memory": "?", "disk": "?"}
     try:
-        uptime = run_cmd("uptime -p").replace("up ", "")
-        cpu = run_cmd("top -bn1 | grep 'Cpu(s)' | awk '{print $2}' | cut -d'%' -f1")
-        mem = run_cmd("free | grep Mem | awk '{printf \"%.0f\", $3/$2 * 100}'")
-        disk = run_cmd("df -h / | tail -1 | awk '{print $5}'")
-        
-        return {
-            "uptime": uptime or "17h",
-            "cpu": f"{cpu}%" if cpu else "?",
-            "memory": f"{mem}%" if mem else "?",
-            "disk": disk if disk else "?"
-        }
-    except:
-        return {"uptime": "17h", "cpu": "?", "memory": "?", "disk": "?"}
-
-def generate_dashboard():
-    """Generate and print dashboard"""
-    print("\n" + "=" * 60)
-    print("🤖 MONEYBOT DASHBOARD")
-    print(f"📅 {datetime.utcnow().strftime('%Y-%m-%d %H:%M')} UTC")
-    print("=" * 60)
-    
-    # AIOZ Section
-    print("\n⛏️  AIOZ DePIN NODE")
-    print("-" * 40)
-    aioz = get_aioz_status()
-    print(f"  Status:      {aioz['status']}")
-    print(f"  Uptime:      {aioz['uptime']}")
-    print(f"  Storage:     {aioz['storage']} MB")
-    print(f"  Delivery:    {aioz['delivery']} kB/s")
+        status["uptime"] = procfs.format_uptime(procfs.read_uptime())
+    except (OSError, ValueError):
+        pass
+    try:
+        status["cpu"] = f"{CPU_SAMPLER.percent():.1f}%"
+    except (OSError, ValueError):
+        pass
+    try:
+        status["memory"] = f"{procfs.memory_percent():.0f}%"
+    except (OSError, ValueError):
+        pass
+    try:
+        status["disk"] = f"{procfs.disk_percent('/')}%"
+    except OSError:
+        pass
+    return status
+
+def render_aioz(aioz):
+    lines = [
+        "\n⛏️  AIOZ DePIN NODE",
+        "-" * 40,
+        f"  Status:      {aioz['status']}",
+        f"  Uptime:      {aioz['uptime']}",
+        f"  Storage:     {aioz['storage']} MB",
+        f"  Delivery:    {aioz['delivery']} kB/s",
+    ]
+    if 'deliveries_per_min' in aioz:
+        lines.append(f"  Log rates:   {aioz['deliveries_per_min']} deliveries/min, {aioz['errors_per_min']} errors/min")
+    if 'stats_error' in aioz:
+        lines.append(f"  ⚠️ Stats:    {aioz['stats_error']}")
     if 'pid' in aioz:
-        print(f"  PID:         {aioz['pid']}")
-    
-    # ClawTasks Section
-    print("\n🦀 CLAWTASKS BOUNTIES")
-    print("-" * 40)
-    claw = get_clawtasks_status()
-    print(f"  Status:      {claw['status']}")
-    print(f"  Proposals:   {claw['proposals']} submitted")
-    print(f"  Accepted:    {claw['accepted']}")
-    print(f"  Pending:     {claw['pending']}")
-    
-    # Moltbook Section
-    print("\n🗣️  MOLTBOOK SOCIAL")
-    print("-" * 40)
-    molt = get_moltbook_status()
-    print(f"  Status:      {molt['status']}")
-    print(f"  Profile:     {molt['profile']}")
-    print(f"  Posts Today: {molt['posts_today']}")
-    print(f"  Comments:    {molt['comments_today']}")
-    
-    # System Section
-    print("\n🖥️  SYSTEM RESOURCES")
-    print("-" * 40)
-    sys_res = get_system_status()
-    print(f"  Uptime:      {sys_res['uptime']}")
-    print(f"  CPU:         {sys_res['cpu']}")
-    print(f"  Memory:      {sys_res['memory']}")
-    print(f"  Disk:        {sys_res['disk']}")
-    
-    # Summary
-    print("\n" + "=" * 60)
-    print("📊 SUMMARY: All core activities operational")
-    print("🎯 Next: Post to Moltbook in ~3 min")
-    print("=" * 60 + "\n")
+        lines.append(f"  PID:         {aioz['pid']}")
+    return lines
+
+def render_clawtasks(claw):
+    lines = [
+        "\n🦀 CLAWTASKS BOUNTIES",
+        "-" * 40,
+        f"  Status:      {claw['status']}",
+        f"  Proposals:   {claw['proposals']} submitted",
+        f"  Accepted:    {claw['accepted']}",
+        f"  Pending:     {claw['pending']}",
+    ]
+    if claw.get("by_status"):
+        lines.append("  By status:   " + ", ".join(f"{s} {n}" for s, n in sorted(claw["by_status"].items())))
+    return lines
+
+def render_moltbook(molt):
+    return [
+        "\n🗣️  MOLTBOOK SOCIAL",
+        "-" * 40,
+        f"  Status:      {molt['status']}",
+        f"  Profile:     {molt['profile']}",
+        f"  Posts Today: {molt['posts_today']}",
+        f"  Comments:    {molt['comments_today']}",
+    ]
+
+def render_events(events):
+    lines = [
+        "\n📬 EVENTS",
+        "-" * 40,
+        f"  Status:      {events['status']}",
+        f"  New:         {events['new']} since the dashboard last ran",
+    ]
+    if events.get("by_type"):
+        lines.append("  By type:     " + ", ".join(f"{t} {n}" for t, n in sorted(events["by_type"].items())))
+    lines.extend(f"  {line}" for line in events.get("recent", []))
+    return lines
+
+def render_system(sys_res):
+    return [
+        "\n🖥️  SYSTEM RESOURCES",
+        "-" * 40,
+        f"  Uptime:      {sys_res['uptime']}",
+        f"  CPU:         {sys_res['cpu']}",
+        f"  Memory:      {sys_res['memory']}",
+        f"  Disk:        {sys_res['disk']}",
+    ]
+
+def render_header(when):
+    return [
+        "\n" + "=" * 60,
+        "🤖 MONEYBOT DASHBOARD",
+        f"📅 {when.strftime('%Y-%m-%d %H:%M')} UTC",
+        "=" * 60,
+    ]
+
+def render_footer(note=None):
+    lines = [
+        "\n" + "=" * 60,
+        "📊 SUMMARY: All core activities operational",
+        "🎯 Next: Post to Moltbook in ~3 min",
+    ]
+    if note:
+        lines.append(note)
+    lines.append("=" * 60 + "\n")
+    return lines
+
+# Dashboard sections: (name, collector, renderer, per-source deadline in seconds, keys shown when late)
+SECTIONS = [
+    ("aioz", get_aioz_status, render_aioz, 15, ["uptime", "storage", "delivery"]),
+    ("clawtasks", get_clawtasks_status, render_clawtasks, 5, ["proposals", "accepted", "pending"]),
+    ("moltbook", get_moltbook_status, render_moltbook, 12, ["profile", "posts_today", "comments_today"]),
+    ("system", get_system_status, render_system, 10, ["uptime", "cpu", "memory", "disk"]),
+    ("events", get_events_status, render_events, 5, ["new", "attention"]),
+]
+
+# --serve refresh interval per source (seconds); upstream load is fixed regardless of clients
+SERVE_TTLS = {"aioz": 60, "clawtasks": 120, "moltbook": 300, "system": 10, "events": 30}
+SERVE_PORT = 9187
+
+# Fields recorded into the ring-file history (and drawn as 24h sparklines)
+HISTORY_METRICS = {
+    "aioz": ["storage", "delivery"],
+    "clawtasks": ["proposals", "accepted"],
+    "system": ["cpu", "memory", "disk"],
+}
+TREND_HOURS = 24
+TREND_WIDTH = 24
+
+def stale_section(keys, deadline):
+    """Placeholder for a section that missed its deadline"""
+    data = {key: "?" for key in keys}
+    data["status"] = f"⏱️ STALE/TIMEOUT (>{deadline}s)"
+    return data
+
+def start_collectors(sections=SECTIONS):
+    """Start every collector on its own daemon thread; returns {name: Future}"""
+    futures = {}
+    for name, collector, _, _, _ in sections:
+        future = Future()
+        def run(collector=collector, future=future):
+            try:
+                future.set_result(collector())
+            except Exception as e:
+                future.set_exception(e)
+        # Daemon threads: a hung source can't keep the process alive after we print
+        threading.Thread(target=in_cycle(run), name=f"collect-{name}", daemon=True).start()
+        futures[name] = future
+    return futures
+
+def collect_sections(sections=SECTIONS, started=None, futures=None):
+    """Yield (name, data) as each section finishes; one still running at its deadline is yielded stale"""
+    started = started if started is not None else time.monotonic()
+    futures = futures if futures is not None else start_collectors(sections)
+    waiting = {futures[name]: (name, deadline, keys) for name, _, _, deadline, keys in sections}
+    while waiting:
+        elapsed = time.monotonic() - started
+        for future, (name, deadline, keys) in list(waiting.items()):
+            if not future.done() and elapsed >= deadline:
+                del waiting[future]
+                yield name, stale_section(keys, deadline)
+        if not waiting:
+            break
+        next_deadline = min(deadline for _, deadline, _ in waiting.values())
+        done, _ = wait(list(waiting), timeout=max(0.0, next_deadline - elapsed), return_when=FIRST_COMPLETED)
+        for future in [f for f in waiting if f in done]:  # display order among those done together
+            name, deadline, keys = waiting.pop(future)
+            try:
+                data = future.result()
+            except Exception as e:
+                data = stale_section(keys, deadline)
+                data["status"] = f"❌ ERROR: {e}"
+            yield name, data
+
+def open_history(directory=DEFAULT_HISTORY_DIR):
+    """Metric history store, or None if the directory isn't writable"""
+    try:
+        return TimeSeriesStore(directory)
+    except OSError as e:
+        print(f"⚠️ Metric history disabled: {e}")
+        return None
+
+def record_history(history, name, data):
+    """Append this section's numeric fields to the history (skips '?' and stale values)"""
+    if history is None:
+        return
+    for key in HISTORY_METRICS.get(name, []):
+        value = data.get(key)
+        number = metric_value(value)
+        if number is None:
+            number = percent_value(value)
+        if number is not None:
+            try:
+                history.append(f"{name}.{key}", number)
+            except (OSError, ValueError) as e:
+                print(f"⚠️ Could not record {name}.{key}: {e}")
+
+def render_trends(history, name, hours=TREND_HOURS, width=TREND_WIDTH):
+    """Sparkline lines for a section's recorded metrics"""
+    if history is None:
+        return []
+    lines = []
+    for key in HISTORY_METRICS.get(name, []):
+        points = history.recent(f"{name}.{key}", hours * 3600, max_points=width * 4)
+        values = [avg for _, avg, _, _ in points]
+        present = [v for v in values if v is not None]
+        if len(present) < 2:
+            continue
+        label = f"{'CPU' if key == 'cpu' else key.capitalize()} {hours}h:"
+        lines.append(f"  {label:<13}{sparkline(values, width)}  ({min(present):.1f}–{max(present):.1f})")
+    return lines
+
+class SnapshotStore:
+    """
+    Latest data per section, refreshed in the background on each section's TTL.
+    Refreshers publish a new immutable dict, so readers just grab a reference.
+    """
+    
+    def __init__(self, sections=SECTIONS, ttls=SERVE_TTLS, history=None):
+        self.sections = sections
+        self.ttls = ttls
+        self.history = history
+        self.entries = {
+            name: {"data": stale_section(keys, deadline), "updated_at": None, "updated_mono": None,
+                   "refreshes": 0, "errors": 0, "duration_ms": None}
+            for name, _, _, deadline, keys in sections
+        }
+        self.stop_event = threading.Event()
+        self.wake = {name: threading.Event() for name, _, _, _, _ in sections}
+        self.write_lock = threading.Lock()  # writers only; readers never block
+        self.version = 0  # bumped on every publish so viewers can skip unchanged frames
+    
+    def start(self):
+        for name, collector, _, _, _ in self.sections:
+            # Each refresh (not the endless loop) is profiled, so it lands in the capture written at Ctrl-C
+            threading.Thread(target=self._refresh_loop, args=(name, in_cycle(collector)),
+                             name=f"refresh-{name}", daemon=True).start()
+    
+    def _refresh_loop(self, name, collector):
+        ttl = self.ttls.get(name, 60)
+        while not self.stop_event.is_set():
+            started = time.monotonic()
+            previous = self.entries[name]
+            try:
+                data, errors = collector(), previous["errors"]
+            except Exception as e:
+                data = dict(previous["data"], status=f"❌ ERROR: {e}")
+                errors = previous["errors"] + 1
+            finished = time.monotonic()
+            record_history(self.history, name, data)
+            with self.write_lock:
+                entries = dict(self.entries)
+                entries[name] = {
+                    "data": data,
+                    "updated_at": datetime.utcnow().isoformat(),
+                    "updated_mono": finished,
+                    "refreshes": previous["refreshes"] + 1,
+                    "errors": errors,
+                    "duration_ms": round((finished - started) * 1000, 1),
+                }
+                self.entries = entries
+                self.version += 1
+            self.wake[name].wait(max(0.0, ttl - (finished - started)))
+            self.wake[name].clear()
+    
+    def refresh_now(self, name=None):
+        """Cut the wait short for one section (or all of them)"""
+        for section, event in self.wake.items():
+            if name is None or section == name:
+                event.set()
+    
+    def stop(self):
+        self.stop_event.set()
+        self.refresh_now()
+    
+    def snapshot(self):
+        """Current view with per-section age; a section older than 2x its TTL is marked stale"""
+        now = time.monotonic()
+        sections = {}
+        for name, entry in self.entries.items():
+            age = None if entry["updated_mono"] is None else round(now - entry["updated_mono"], 1)
+            sections[name] = {
+                "data": entry["data"],
+                "updated_at": entry["updated_at"],
+                "age_seconds": age,
+                "stale": age is None or age > 2 * self.ttls.get(name, 60),
+                "refreshes": entry["refreshes"],
+                "errors": entry["errors"],
+                "duration_ms": entry["duration_ms"],
+            }
+        return {"generated_at": datetime.utcnow().isoformat(), "sections": sections}
+
+def render_text(snapshot, history=None):
+    """Terminal renderer of a snapshot (the same view the one-shot dashboard prints)"""
+    renderers = {name: renderer for name, _, renderer, _, _ in SECTIONS}
+    lines = render_header(datetime.fromisoformat(snapshot["generated_at"]))
+    for name, section in snapshot["sections"].items():
+        lines.extend(renderers[name](section["data"]))
+        lines.extend(render_trends(history, name))
+    return "\n".join(lines + render_footer())
+
+def metric_value(value):
+    """Numeric value of a section field for Prometheus, or None"""
+    if isinstance(value, bool):
+        return int(value)
+    if isinstance(value, (int, float)):
+        return value
+    return None
+
+def percent_value(value):
+    """Numeric value of a '12.5%' style field, or None"""
+    if isinstance(value, str) and value.endswith("%"):
+        try:
+            return float(value[:-1])
+        except ValueError:
+            return None
+    return None
+
+def render_prometheus(snapshot):
+    """Prometheus text exposition of a snapshot"""
+    lines = []
+    for name, section in snapshot["sections"].items():
+        lines.append(f'moneybot_section_up{{section="{name}"}} {0 if section["stale"] else 1}')
+        if section["age_seconds"] is not None:
+            lines.append(f'moneybot_section_age_seconds{{section="{name}"}} {section["age_seconds"]}')
+        lines.append(f'moneybot_section_refreshes_total{{section="{name}"}} {section["refreshes"]}')
+        lines.append(f'moneybot_section_errors_total{{section="{name}"}} {section["errors"]}')
+        for key, value in section["data"].items():
+            if key == "pid":
+                continue
+            number = metric_value(value)
+            if number is not None:
+                lines.append(f"moneybot_{name}_{key} {number}")
+            elif percent_value(value) is not None:
+                lines.append(f"moneybot_{name}_{key}_percent {percent_value(value)}")
+            elif isinstance(value, dict):
+                # e.g. by_status -> moneybot_clawtasks_by_status{status="accepted"} 3
+                label = key[3:] if key.startswith("by_") else "key"
+                for sub_key, sub in value.items():
+                    if metric_value(sub) is not None:
+                        lines.append(f'moneybot_{name}_{key}{{{label}="{sub_key}"}} {sub}')
+        if "status" in section["data"]:
+            status = str(section["data"]["status"])
+            lines.append(f'moneybot_{name}_healthy {1 if status.startswith("🟢") else 0}')
+    return "\n".join(lines) + "\n"
+
+def serve_dashboard(port=SERVE_PORT, host="127.0.0.1"):
+    """Run the background refreshers and serve snapshots over local HTTP"""
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+    
+    EVENT_FEED.use(LIVE_CONSUMER)
+    history = open_history()
+    store = SnapshotStore(history=history)
+    store.start()
+    
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            path = self.path.split("?")[0]
+            if path in ("/", "/snapshot.json"):
+                body, ctype = json.dumps(store.snapshot(), ensure_ascii=False), "application/json"
+            elif path == "/metrics":
+                body, ctype = render_prometheus(store.snapshot()), "text/plain; version=0.0.4"
+            elif path == "/text":
+                body, ctype = render_text(store.snapshot(), history), "text/plain; charset=utf-8"
+            else:
+                self.send_error(404)
+                return
+            payload = body.encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", ctype)
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+        
+        def log_message(self, format, *args):
+            pass  # Polling clients would flood stdout
+    
+    server = ThreadingHTTPServer((host, port), Handler)
+    print(f"🚀 Dashboard serving on http://{host}:{port}/ (/snapshot.json, /metrics, /text)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("🛑 Stopped by user")
+    finally:
+        store.stop()
+        server.server_close()
+
+# --live view: panel width, and how often the screen checks for new data / keys
+LIVE_PANEL_WIDTH = 46
+LIVE_TICK = 1.0
+
+def format_age(seconds):
+    seconds = int(seconds)
+    if seconds < 60:
+        return f"{seconds}s"
+    if seconds < 3600:
+        return f"{seconds // 60}m{seconds % 60:02d}s"
+    return f"{seconds // 3600}h{seconds % 3600 // 60:02d}m"
+
+def live_panels(snapshot, history):
+    """(name, title, body lines) per section, from the same renderers as the text view"""
+    renderers = {name: renderer for name, _, renderer, _, _ in SECTIONS}
+    panels = []
+    for name, section in snapshot["sections"].items():
+        lines = renderers[name](section["data"]) + render_trends(history, name)
+        panels.append((name, lines[0].strip(), lines[2:]))  # drop the "----" rule
+    return panels
+
+def live_rows(panels, snapshot, width):
+    """Screen rows as tuples of (column, text, style); one or two panel columns"""
+    header = f"🤖 MONEYBOT LIVE  {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')} UTC"
+    rows = [((0, header, "title"), (max(len(header) + 4, width - 24), "q quit · r refresh", "dim")), ()]
+    columns = 2 if width >= 2 * LIVE_PANEL_WIDTH else 1
+    for i in range(0, len(panels), columns):
+        blocks = []
+        for col, (name, title, body) in enumerate(panels[i:i + columns]):
+            section = snapshot["sections"][name]
+            age = section["age_seconds"]
+            if age is None:
+                footer = "  (collecting…)"
+            else:
+                footer = f"  updated {format_age(age)} ago" + (" ⚠️ stale" if section["stale"] else "")
+            x = col * LIVE_PANEL_WIDTH
+            block = [(x, title, "title"), (x, "─" * (LIVE_PANEL_WIDTH - 4), "dim")]
+            block += [(x, line, live_style(line)) for line in body]
+            block.append((x, footer, "dim"))
+            blocks.append(block)
+        for y in range(max(len(b) for b in blocks)):
+            rows.append(tuple(b[y] for b in blocks if y < len(b)))
+        rows.append(())
+    return rows
+
+def live_style(line):
+    if "❌" in line:
+        return "bad"
+    if "🟡" in line or "⏱️" in line or "⚠️" in line:
+        return "warn"
+    if "🟢" in line:
+        return "good"
+    return "normal"
+
+class LiveScreen:
+    """Keeps what is on each terminal row and rewrites only rows that changed"""
+    
+    def __init__(self, stdscr, styles):
+        self.stdscr = stdscr
+        self.styles = styles
+        self.rows = {}
+    
+    def reset(self):
+        self.rows.clear()
+        self.stdscr.erase()
+    
+    def draw(self, rows):
+        import curses
+        height, width = self.stdscr.getmaxyx()
+        for y in range(height - 1):
+            row = rows[y] if y < len(rows) else ()
+            if self.rows.get(y) == row:
+                continue
+            self.stdscr.move(y, 0)
+            self.stdscr.clrtoeol()
+            for x, text, style in row:
+                if x < width - 1:
+                    try:
+                        self.stdscr.addnstr(y, x, text, width - 1 - x, self.styles[style])
+                    except curses.error:
+                        pass  # wide glyphs at the right edge
+            self.rows[y] = row
+        self.stdscr.noutrefresh()
+        curses.doupdate()
+
+def live_loop(stdscr, store, history):
+    import curses
+    try:
+        curses.curs_set(0)
+    except curses.error:
+        pass
+    styles = {"normal": curses.A_NORMAL, "title": curses.A_BOLD, "dim": curses.A_DIM,
+              "good": curses.A_NORMAL, "warn": curses.A_BOLD, "bad": curses.A_BOLD}
+    if curses.has_colors():
+        curses.use_default_colors()
+        for pair, (style, color) in enumerate((("good", curses.COLOR_GREEN), ("warn", curses.COLOR_YELLOW),
+                                               ("bad", curses.COLOR_RED)), start=1):
+            curses.init_pair(pair, color, -1)
+            styles[style] = curses.color_pair(pair)
+    stdscr.timeout(int(LIVE_TICK * 1000))  # getch doubles as the frame timer
+    screen = LiveScreen(stdscr, styles)
+    
+    version, panels = None, []
+    while True:
+        current = store.version
+        snapshot = store.snapshot()
+        if current != version:
+            # Panel bodies (and sparkline queries) only change when a refresher publishes
+            version, panels = current, live_panels(snapshot, history)
+        screen.draw(live_rows(panels, snapshot, stdscr.getmaxyx()[1]))
+        key = stdscr.getch()
+        if key in (ord("q"), ord("Q"), 27):
+            break
+        if key in (ord("r"), ord("R")):
+            store.refresh_now()
+        elif key == curses.KEY_RESIZE:
+            screen.reset()
+
+def run_live():
+    """Full-screen view; each panel refreshes on its own SERVE_TTLS interval"""
+    import curses
+    import locale
+    locale.setlocale(locale.LC_ALL, "")  # ncurses needs it for emoji / box drawing
+    EVENT_FEED.use(LIVE_CONSUMER)
+    history = open_history()
+    store = SnapshotStore(history=history)
+    store.start()
+    try:
+        curses.wrapper(live_loop, store, history)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        store.stop()
+
+def generate_dashboard(write=print):
+    """Generate and print dashboard (`write` receives each block of lines)"""
+    started = time.monotonic()
+    futures = start_collectors()
+    history = open_history()
+    
+    write("\n".join(render_header(datetime.utcnow())))
+    
+    # Sections are collected concurrently and each prints as soon as it's ready,
+    # so a slow source never holds back the others; total time is bounded by the slowest deadline
+    renderers = {name: renderer for name, _, renderer, _, _ in SECTIONS}
+    for name, data in collect_sections(started=started, futures=futures):
+        record_history(history, name, data)
+        write("\n".join(renderers[name](data) + render_trends(history, name)))
+    
+    write("\n".join(render_footer(f"⏱️ Rendered in {time.monotonic() - started:.1f}s")))
 
 if __name__ == "__main__":
-    generate_dashboard()
+    import sys
+    from moneybot.profiling import Profiler
+    
+    # --serve / --live are profiled as one run, from start to Ctrl-C (refreshers included)
+    profiler = Profiler("dashboard")
+    if "--serve" in sys.argv:
+        port = int(sys.argv[sys.argv.index("--port") + 1]) if "--port" in sys.argv else SERVE_PORT
+        with profiler.cycle("dashboard-serve"):
+            serve_dashboard(port=port)
+    elif "--live" in sys.argv:
+        with profiler.cycle("dashboard-live"):
+            run_live()
+    else:
+        # One report at a time (two would race on the events offset and the history files)
+        from moneybot.runlock import RunLock, policy_from_argv
+        with profiler.cycle():
+            RunLock("dashboard").run(generate_dashboard, policy_from_argv())
@@ -0,0 +1,331 @@
+#!/usr/bin/env python3
+"""
+MoneyBot Supervisor - one long-running process instead of four cron jobs
+Hosts the email guardian, Moltbook engager, ClawTasks scanner and daily dashboard
+on an asyncio scheduler with jitter, overlap protection and per-job timeouts.
+Each job runs under the same run lock as its script, so a leftover cron copy and
+the supervisor never work on the same mailbox, identity or scan at once
+Author: Jarvis (jarvisauto001-coder)
+Repo: https://github.com/jarvisauto001-coder/moneybot-scripts
+
+Usage:
+    python3 moneybot-supervisor.py                      # all jobs
+    python3 moneybot-supervisor.py --only guardian,scanner
+    python3 moneybot-supervisor.py --disable dashboard
+    python3 moneybot-supervisor.py --disable guardian@sales      # one account of a multi-account job
+    python3 moneybot-supervisor.py --once               # run each enabled job once and exit
+    python3 moneybot-supervisor.py --list
+    python3 moneybot-supervisor.py --status             # per-job/per-account throughput so far
+    python3 moneybot-supervisor.py --once --profile --trace-memory   # capture every job run
+"""
+
+import importlib.util
+import json
+import os
+import random
+import signal
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+from moneybot.accounts import load_accounts
+from moneybot.config import WORKSPACE, atomic_write
+from moneybot.http import all_clients
+from moneybot.lazy import lazy_import
+from moneybot.logstore import get_logger
+from moneybot.polling import SOURCES as POLL_SOURCES, format_interval
+from moneybot.profiling import Profiler
+from moneybot.runlock import RunLock
+
+asyncio = lazy_import("asyncio")  # not needed for --list
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+LOGGER = get_logger("supervisor")
+REPORTS_DIR = os.path.join(WORKSPACE, "reports")
+STATUS_FILE = os.path.join(WORKSPACE, ".supervisor_status.json")
+
+# Same cadence as CRON_SETUP.md. interval/at in seconds / local "HH:MM";
+# jitter is a fraction of the interval; timeout is per run. Jobs with a
+# moneybot.polling source follow its adaptive interval instead of `interval`.
+# Guardian and engager run one job per account in accounts.json (guardian@sales),
+# each with its own worker thread, timeout and interval.
+JOBS = {
+    "guardian": {"interval": 300, "jitter": 0.1, "timeout": 240},
+    "engager": {"interval": 900, "jitter": 0.1, "timeout": 600},
+    "scanner": {"interval": 1800, "jitter": 0.1, "timeout": 600},
+    "dashboard": {"at": "06:00", "jitter": 0.0, "timeout": 120},
+}
+
+
+def log(message):
+    """Log with timestamp (buffered JSON record, see moneybot/logstore.py)"""
+    LOGGER.log(message)
+
+
+def load_script(filename, name):
+    """Import one of the hyphenated scripts as a module (runs its env loading once)"""
+    spec = importlib.util.spec_from_file_location(name, os.path.join(ROOT, filename))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class Job:
+    def __init__(self, name, fn, interval=None, at=None, jitter=0.0, timeout=None, pacer=None, lock=None):
+        self.name = name
+        self.fn = fn
+        self.lock = lock  # RunLock shared with the script's own cron runs
+        self.interval = interval
+        self.pacer = pacer  # AdaptiveInterval updated by the job itself, if any
+        self.at = at
+        self.jitter = jitter
+        self.timeout = timeout
+        self.running = None  # Future of the in-flight run, if any
+        self.stats = {"runs": 0, "failures": 0, "timeouts": 0, "skipped": 0, "last_duration": None,
+                      "busy_seconds": 0.0, "items": None, "last_run": None}
+
+    def delay_until_next(self, first=False):
+        """Seconds until the next run (interval +/- jitter, or the next HH:MM)"""
+        if self.at:
+            hour, minute = (int(x) for x in self.at.split(":"))
+            now = datetime.now()
+            target = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+            if target <= now:
+                target += timedelta(days=1)
+            return (target - now).total_seconds()
+        interval = self.pacer.interval if self.pacer else self.interval
+        if first:
+            # Stagger start-up so jobs don't all hit the network at once
+            return random.uniform(0, min(30.0, interval * max(self.jitter, 0.01)))
+        spread = interval * self.jitter
+        return max(1.0, interval + random.uniform(-spread, spread))
+
+    def call(self):
+        """fn under the job's run lock; None without running if a cron copy holds it"""
+        if self.lock is None:
+            return self.fn()
+        return self.lock.run(self.fn)
+
+    def record(self, duration, items):
+        self.stats["runs"] += 1
+        self.stats["last_duration"] = round(duration, 1)
+        self.stats["busy_seconds"] = round(self.stats["busy_seconds"] + duration, 1)
+        self.stats["last_run"] = datetime.utcnow().isoformat()
+        if isinstance(items, int):
+            # Emails handled / interactions made; jobs that return nothing have no item count
+            self.stats["items"] = (self.stats["items"] or 0) + items
+
+
+class Supervisor:
+    def __init__(self, jobs):
+        self.jobs = jobs
+        # A thread per job: a slow or throttled account only ever holds its own
+        self.executor = ThreadPoolExecutor(max_workers=len(jobs) or 1, thread_name_prefix="job")
+        self.stop_event = None
+        self.started = datetime.utcnow()
+
+    async def run_job(self, job):
+        """One run, unless the previous one is still going; a timed-out run keeps its slot until it ends"""
+        if job.running is not None and not job.running.done():
+            job.stats["skipped"] += 1
+            log(f"⏭️ {job.name}: previous run still active, skipping")
+            return
+        loop = asyncio.get_running_loop()
+        started = time.monotonic()
+        job.running = loop.run_in_executor(self.executor, job.call)
+        try:
+            items = await asyncio.wait_for(asyncio.shield(job.running), timeout=job.timeout)
+            if job.lock is not None and job.lock.skipped:
+                job.stats["skipped"] += 1  # a cron copy was on it; the lock logged who
+                self.write_status()
+                return
+            job.record(time.monotonic() - started, items)
+            done = f" ({items} items)" if isinstance(items, int) else ""
+            log(f"✅ {job.name}: done in {job.stats['last_duration']}s{done}")
+        except asyncio.TimeoutError:
+            # Threads can't be killed; overlap protection keeps it from piling up
+            job.stats["timeouts"] += 1
+            log(f"⏱️ {job.name}: still running after {job.timeout}s, will not start again until it ends")
+        except Exception as e:
+            job.stats["failures"] += 1
+            log(f"❌ {job.name}: {type(e).__name__}: {e}")
+        self.write_status()
+
+    def write_status(self):
+        """Per-job counters for --status (another process may read them at any time)"""
+        hours = max((datetime.utcnow() - self.started).total_seconds() / 3600, 1e-9)
+        status = {"started_at": self.started.isoformat(), "updated_at": datetime.utcnow().isoformat(), "jobs": {}}
+        for job in self.jobs:
+            items = job.stats["items"]
+            status["jobs"][job.name] = dict(job.stats, items_per_hour=round(items / hours, 1) if items is not None else None)
+        try:
+            atomic_write(STATUS_FILE, json.dumps(status, indent=2), fsync=False)
+        except OSError as e:
+            log(f"⚠️ Could not write {STATUS_FILE}: {e}")
+
+    async def job_loop(self, job):
+        delay = job.delay_until_next(first=True)
+        while True:
+            log(f"🕒 {job.name}: next run in {delay / 60:.1f} min")
+            try:
+                await asyncio.wait_for(self.stop_event.wait(), timeout=delay)
+                return
+            except asyncio.TimeoutError:
+                pass
+            await self.run_job(job)
+            delay = job.delay_until_next()
+
+    async def run_forever(self):
+        self.stop_event = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(sig, self.stop_event.set)
+        log(f"🚀 Supervisor started with jobs: {', '.join(j.name for j in self.jobs)}")
+        await asyncio.gather(*(self.job_loop(job) for job in self.jobs))
+        log("🛑 Supervisor stopping")
+        for job in self.jobs:
+            log(f"📊 {job.name}: {job.stats}")
+
+    async def run_once(self):
+        await asyncio.gather(*(self.run_job(job) for job in self.jobs))
+
+    def close(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+
+def build_jobs(wanted, auto_submit=False):
+    """
+    Load only the scripts whose jobs are wanted (they share moneybot.http's pooled
+    client; second and later accounts get their own pools)
+    """
+    jobs = []
+
+    guardians = [account for account in load_accounts("guardian") if wanted(account.job_name)]
+    if guardians:
+        guardian_mod = load_script("jarvis-email-guardian.py", "jarvis_email_guardian")
+        for account in guardians:
+            guardian = guardian_mod.EmailGuardian(account)
+            # killable=False: a stuck job is reported, never answered by terminating the supervisor
+            guardian.run_lock = RunLock(account.label, killable=False, log=log)
+            jobs.append(Job(account.job_name, lambda guardian=guardian: len(guardian.poll_inbox(limit=10)),
+                            pacer=guardian.poll, lock=guardian.run_lock, **JOBS["guardian"]))
+
+    engagers = [account for account in load_accounts("engager") if wanted(account.job_name)]
+    if engagers:
+        engager_mod = load_script("moneybook-auto-engager.py", "moneybook_auto_engager")
+        for account in engagers:
+            engager = engager_mod.MoltbookEngager(account)
+            engager.run_lock = RunLock(account.label, killable=False, log=log)
+
+            def engage(engager=engager):
+                before = engager.interactions_today
+                engager.run_engagement_cycle()
+                interactions = engager.interactions_today - before
+                engager.roll_daily_counter()
+                return interactions
+            jobs.append(Job(account.job_name, engage, pacer=engager.poll, lock=engager.run_lock, **JOBS["engager"]))
+
+    if wanted("scanner"):
+        scanner_mod = load_script("clawtasks-opportunity-scanner.py", "clawtasks_opportunity_scanner")
+        scanner = scanner_mod.ClawTasksScanner()
+        scanner.run_lock = RunLock("scanner", killable=False, log=log)
+        jobs.append(Job("scanner", lambda: scanner.scan_for_opportunities(auto_submit=auto_submit),
+                        pacer=scanner.poll, lock=scanner.run_lock, **JOBS["scanner"]))
+
+    if wanted("dashboard"):
+        dashboard_mod = load_script("moneybot-dashboard.py", "moneybot_dashboard")
+
+        def daily_report():
+            blocks = []
+            dashboard_mod.generate_dashboard(write=blocks.append)
+            path = os.path.join(REPORTS_DIR, f"daily_{datetime.utcnow().strftime('%Y-%m-%d')}.md")
+            atomic_write(path, "\n".join(blocks) + "\n")
+            log(f"📝 Dashboard report written to {path}")
+            from moneybot import history
+            if history.np is not None:
+                counts = history.export()
+                log(f"📦 History exported: {counts['proposals']} proposals, {counts['emails']} emails, "
+                    f"{counts['engagements']} engagements")
+        jobs.append(Job("dashboard", daily_report, lock=RunLock("dashboard", killable=False, log=log),
+                        **JOBS["dashboard"]))
+
+    return jobs
+
+
+def parse_job_list(flag):
+    """Job names after flag; "guardian" stands for every guardian account, "guardian@sales" for one"""
+    if flag not in sys.argv:
+        return None
+    names = {n.strip() for n in sys.argv[sys.argv.index(flag) + 1].split(",") if n.strip()}
+    unknown = {name for name in names if name.split("@", 1)[0] not in JOBS}
+    if unknown:
+        sys.exit(f"Unknown job(s): {', '.join(sorted(unknown))} (known: {', '.join(JOBS)})")
+    return names
+
+
+def job_matcher(only, disabled):
+    def matches(name, names):
+        return name in names or name.split("@", 1)[0] in names
+
+    return lambda name: (only is None or matches(name, only)) and not matches(name, disabled)
+
+
+def print_status():
+    try:
+        with open(STATUS_FILE, 'r') as f:
+            status = json.load(f)
+    except (OSError, ValueError):
+        print(f"No status yet ({STATUS_FILE} is written after each job run)")
+        return
+    print(f"Since {status['started_at'][:19]} UTC, updated {status['updated_at'][:19]} UTC\n")
+    print(f"{'job':<28}{'runs':>6}{'fail':>6}{'t/o':>5}{'skip':>6}{'items':>7}{'items/h':>9}{'avg s':>8}  last run")
+    for name, stats in status["jobs"].items():
+        average = f"{stats['busy_seconds'] / stats['runs']:.1f}" if stats["runs"] else "-"
+        items = stats["items"] if stats["items"] is not None else "-"
+        per_hour = stats["items_per_hour"] if stats["items_per_hour"] is not None else "-"
+        print(f"{name:<28}{stats['runs']:>6}{stats['failures']:>6}{stats['timeouts']:>5}{stats['skipped']:>6}"
+              f"{items:>7}{per_hour:>9}{average:>8}  {(stats['last_run'] or 'never')[:19]}")
+
+
+def main():
+    if "--list" in sys.argv:
+        accounts = {kind: [account.job_name for account in load_accounts(kind)] for kind in ("guardian", "engager")}
+        for name, spec in JOBS.items():
+            if "at" in spec:
+                when = f"daily at {spec['at']}"
+            elif name in POLL_SOURCES:
+                bounds = POLL_SOURCES[name]
+                when = f"every {format_interval(bounds['min'])}-{format_interval(bounds['max'])} (adaptive)"
+            else:
+                when = f"every {spec['interval'] // 60} min"
+            for job_name in accounts.get(name, [name]):
+                print(f"{job_name:<28} {when:<36} timeout {spec['timeout']}s")
+        return
+
+    if "--status" in sys.argv:
+        print_status()
+        return
+
+    wanted = job_matcher(parse_job_list("--only"), parse_job_list("--disable") or set())
+    jobs = build_jobs(wanted, auto_submit="--auto-submit" in sys.argv)
+    if not jobs:
+        sys.exit("No jobs enabled")
+    profiler = Profiler("supervisor", log=log)
+    for job in jobs:
+        job.fn = profiler.wrap(job.fn, job.name)
+    supervisor = Supervisor(jobs)
+    try:
+        if "--once" in sys.argv:
+            asyncio.run(supervisor.run_once())
+        else:
+            asyncio.run(supervisor.run_forever())
+    finally:
+        supervisor.close()
+        for account, client in all_clients().items():
+            log(f"🌐 HTTP{f' ({account})' if account else ''}: {client.summary_line()}")
+            client.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,9 @@
+"""
+MoneyBot shared helpers
+Small support modules used by the top-level MoneyBot scripts.
+Author: Jarvis (jarvisauto001-coder)
+Repo: https://github.com/jarvisauto001-coder/moneybot-scripts
+
+Modules are imported directly (e.g. ``from moneybot.ratelimit import ...``);
+nothing is re-exported here so scripts only pay for what they use.
+"""
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+Accounts - several mailboxes and Moltbook identities hosted in one process
+accounts.json lists the guardian's mailboxes and the engager's agent identities.
+Each account gets its own state files, log component, poll interval, HTTP pool and
+rate limiters; the supervisor runs one job per account so a slow or throttled one
+only ever holds its own slot
+Author: Jarvis (jarvisauto001-coder)
+Repo: https://github.com/jarvisauto001-coder/moneybot-scripts
+
+Usage:
+    python3 -m moneybot.accounts list
+    python3 -m moneybot.accounts check
+
+accounts.json (in the workspace, or MONEYBOT_ACCOUNTS=path):
+    {
+      "guardian": [
+        {"name": "jarvis", "user": "$JARVIS_GMAIL_USER", "password": "$JARVIS_GMAIL_APP_PASSWORD"},
+        {"name": "sales", "user": "sales@example.com", "password": "$SALES_GMAIL_APP_PASSWORD"}
+      ],
+      "engager": [
+        {"name": "Jarvis_PT", "api_key": "$MOLTBOOK_API_KEY"},
+        {"name": "Jarvis_Labs", "api_key": "$MOLTBOOK_LABS_API_KEY"}
+      ]
+    }
+
+Values starting with $ are read from the environment (the credentials file is loaded
+first), so secrets stay in the .env. The first account of each kind keeps the
+single-account state files; without accounts.json each kind has one account built
+from the usual env vars.
+"""
+
+import json
+import os
+import re
+import sys
+from typing import Dict, List, Tuple
+
+from moneybot.config import WORKSPACE
+
+DEFAULT_ACCOUNTS = os.environ.get("MONEYBOT_ACCOUNTS") or os.path.join(WORKSPACE, "accounts.json")
+
+NAME_RE = re.compile(r"^[A-Za-z0-9_-]+$")  # ends up in file, log and job names
+
+_reported = set()  # problems already printed by this process
+
+# kind -> (required settings, the single account used when accounts.json is absent)
+KINDS = {
+    "guardian": (("user", "password"),
+                 {"name": "default", "user": "$JARVIS_GMAIL_USER", "password": "$JARVIS_GMAIL_APP_PASSWORD"}),
+    "engager": (("api_key",),
+                {"name": "Jarvis_PT", "api_key": "$MOLTBOOK_API_KEY"}),
+}
+
+
+class Account:
+    """One mailbox or agent identity; `label` names its log component and poll state"""
+
+    def __init__(self, kind: str, name: str, settings: Dict, primary: bool = False):
+        self.kind = kind
+        self.name = name
+        self.settings = settings
+        self.primary = primary
+
+    def get(self, key: str, default: str = "") -> str:
+        value = self.settings.get(key, default)
+        if isinstance(value, str) and value.startswith("$"):
+            return os.environ.get(value[1:], default)
+        return value
+
+    @property
+    def label(self) -> str:
+        return self.kind if self.primary else f"{self.kind}-{self.name}"
+
+    @property
+    def job_name(self) -> str:
+        return self.kind if self.primary else f"{self.kind}@{self.name}"
+
+    def state_path(self, path: str) -> str:
+        """path for the primary account, path with .<name> before the extension otherwise"""
+        if self.primary:
+            return path
+        root, ext = os.path.splitext(path)
+        return f"{root}.{self.name}{ext}"
+
+
+def parse_accounts(data) -> Tuple[Dict[str, List[Account]], List[str]]:
+    """Accounts per kind from accounts.json's content, plus a list of problems found"""
+    accounts: Dict[str, List[Account]] = {}
+    problems = []
+    if not isinstance(data, dict):
+        return accounts, ["top level must be an object of kind -> list of accounts"]
+    for kind, entries in data.items():
+        if kind not in KINDS:
+            problems.append(f"unknown kind {kind!r} (known: {', '.join(KINDS)}), ignored")
+            continue
+        if not isinstance(entries, list):
+            problems.append(f"{kind}: must be a list, ignored")
+            continue
+        required, _ = KINDS[kind]
+        seen = set()
+        for number, entry in enumerate(entries, start=1):
+            name = entry.get("name") if isinstance(entry, dict) else None
+            if not isinstance(name, str) or not NAME_RE.match(name):
+                problems.append(f"{kind} #{number}: name must match {NAME_RE.pattern}, ignored")
+                continue
+            if name in seen:
+                problems.append(f"{kind} #{number}: {name} listed twice, ignored")
+                continue
+            missing = [key for key in required if not entry.get(key)]
+            if missing:
+                problems.append(f"{kind} {name}: missing {', '.join(missing)}, ignored")
+                continue
+            seen.add(name)
+            settings = {key: value for key, value in entry.items() if key != "name"}
+            accounts.setdefault(kind, []).append(Account(kind, name, settings, primary=not accounts.get(kind)))
+    return accounts, problems
+
+
+def load_accounts(kind: str, path: str = DEFAULT_ACCOUNTS) -> List[Account]:
+    """Configured accounts of `kind`; the env-var account if accounts.json is absent or lists none"""
+    try:
+        with open(path, 'r') as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        data = {}
+    except (OSError, ValueError) as e:
+        if (path, str(e)) not in _reported:
+            _reported.add((path, str(e)))
+            print(f"⚠️ {path}: {e}, using the single-account settings", file=sys.stderr)
+        data = {}
+    accounts, problems = parse_accounts(data)
+    for problem in problems:
+        if (path, problem) not in _reported:
+            _reported.add((path, problem))
+            print(f"⚠️ {path}: {problem}", file=sys.stderr)
+    return accounts.get(kind) or [default_account(kind)]
+
+
+def default_account(kind: str) -> Account:
+    settings = dict(KINDS[kind][1])
+    return Account(kind, settings.pop("name"), settings, primary=True)
+
+
+def find_account(kind: str, name: str, path: str = DEFAULT_ACCOUNTS) -> Account:
+    for account in load_accounts(kind, path):
+        if account.name == name:
+            return account
+    known = ", ".join(account.name for account in load_accounts(kind, path))
+    raise KeyError(f"no {kind} account {name!r} (known: {known})")
+
+
+def main(argv=None):
+    import argparse
+    from moneybot.config import load_env_file
+
+    parser = argparse.ArgumentParser(description="Inspect the configured accounts")
+    parser.add_argument("--file", default=DEFAULT_ACCOUNTS)
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("list", help="Accounts per kind with their job and log names")
+    sub.add_parser("check", help="Report problems and unset $VARIABLES")
+    args = parser.parse_args(argv)
+
+    load_env_file()
+    if args.command == "list":
+        print(f"{'kind':<10}{'account':<20}{'job':<28}log component")
+        for kind in KINDS:
+            for account in load_accounts(kind, args.file):
+                print(f"{kind:<10}{account.name:<20}{account.job_name:<28}{account.label}")
+        return 0
+
+    try:
+        with open(args.file, 'r') as f:
+            accounts, problems = parse_accounts(json.load(f))
+    except FileNotFoundError:
+        print(f"ℹ️ {args.file} not found: one account per kind from the env vars")
+        accounts, problems = {}, []
+    except (OSError, ValueError) as e:
+        print(f"❌ {args.file}: {e}")
+        return 1
+    for kind in KINDS:
+        for account in accounts.get(kind) or [default_account(kind)]:
+            for key, value in account.settings.items():
+                if isinstance(value, str) and value.startswith("$") and not os.environ.get(value[1:]):
+                    problems.append(f"{kind} {account.name}: {key} refers to {value}, which is not set")
+    for problem in problems:
+        print(f"⚠️ {problem}")
+    print("✅ No problems found" if not problems else f"❌ {len(problems)} problem(s)")
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
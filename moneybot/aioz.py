@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+AIOZ Node Collector - structured `aioz-depin-cli stats` parsing, TTL cache, tracked PID
+and an incremental log tail for delivery/error rates
+Author: Jarvis (jarvisauto001-coder)
+Repo: https://github.com/jarvisauto001-coder/moneybot-scripts
+"""
+
+import json
+import os
+import re
+import subprocess
+import threading
+import time
+from collections import deque
+from typing import Dict, Optional
+
+from moneybot import procfs
+
+NODE_BINARY = "aioz-depin-cli"
+
+# Log lines counted as deliveries / errors when tailing the node log
+DELIVERY_RE = re.compile(r"deliver|upload|serv(ed|ing) (chunk|file|request)", re.IGNORECASE)
+ERROR_RE = re.compile(r"\b(error|err|fail(ed|ure)?|panic)\b", re.IGNORECASE)
+
+
+class StatsError(Exception):
+    """`aioz-depin-cli stats` failed or printed something that isn't JSON"""
+
+
+def parse_stats(output: str) -> Dict:
+    """Parse the CLI's JSON output (tolerates log noise before/after the object)"""
+    start, end = output.find("{"), output.rfind("}")
+    if start < 0 or end < start:
+        raise StatsError(f"no JSON object in output: {output[:80]!r}")
+    try:
+        data = json.loads(output[start:end + 1])
+    except json.JSONDecodeError as e:
+        raise StatsError(f"invalid JSON at char {e.pos}: {e.msg}") from e
+    if not isinstance(data, dict):
+        raise StatsError("stats output is not a JSON object")
+    return data
+
+
+def find_field(data, key):
+    """First value for `key` anywhere in nested stats JSON (fields move between CLI versions)"""
+    if isinstance(data, dict):
+        if key in data:
+            return data[key]
+        values = data.values()
+    elif isinstance(data, list):
+        values = data
+    else:
+        return None
+    for value in values:
+        found = find_field(value, key)
+        if found is not None:
+            return found
+    return None
+
+
+class LogTail:
+    """
+    Reads only the bytes appended since the last call. The offset (and inode,
+    to notice rotation) is kept in memory and optionally in a state file so
+    one-shot runs continue where the previous run stopped.
+    """
+
+    def __init__(self, path: str, state_file: Optional[str] = None, window: float = 300):
+        self.path = path
+        self.state_file = state_file
+        self.window = window
+        self.offset = None
+        self.inode = None
+        self.last_read = None
+        self.samples = deque()  # (since, until, deliveries, errors) per poll, within `window`
+        self._load_state()
+
+    def _load_state(self):
+        if not self.state_file or not os.path.exists(self.state_file):
+            return
+        try:
+            with open(self.state_file, 'r') as f:
+                state = json.load(f)
+            self.offset, self.inode, self.last_read = state["offset"], state["inode"], state["last_read"]
+        except (OSError, ValueError, KeyError):
+            pass
+
+    def _save_state(self):
+        if not self.state_file:
+            return
+        tmp = self.state_file + ".tmp"
+        with open(tmp, 'w') as f:
+            json.dump({"offset": self.offset, "inode": self.inode, "last_read": self.last_read}, f)
+        os.replace(tmp, self.state_file)
+
+    def poll(self) -> Dict:
+        """Count deliveries/errors in new lines; rates are per minute over the window"""
+        now = time.time()
+        st = os.stat(self.path)
+        if self.offset is None:
+            # First sight of this log: start at the end instead of replaying history
+            self.offset, self.inode, self.last_read = st.st_size, st.st_ino, now
+        elif st.st_ino != self.inode or st.st_size < self.offset:
+            self.offset, self.inode = 0, st.st_ino  # rotated or truncated
+
+        deliveries = errors = 0
+        if st.st_size > self.offset:
+            with open(self.path, 'rb') as f:
+                f.seek(self.offset)
+                chunk = f.read(st.st_size - self.offset)
+            lines = chunk.split(b"\n")
+            # An incomplete last line is left unread and picked up by the next poll
+            self.offset = st.st_size - len(lines.pop())
+            for raw in lines:
+                line = raw.decode("utf-8", "replace")
+                if ERROR_RE.search(line):
+                    errors += 1
+                elif DELIVERY_RE.search(line):
+                    deliveries += 1
+
+        since = self.last_read if self.last_read is not None else now
+        self.last_read = now
+        self.samples.append((since, now, deliveries, errors))
+        while self.samples and self.samples[0][1] < now - self.window:
+            self.samples.popleft()
+        self._save_state()
+
+        span = max(now - self.samples[0][0], 1.0)
+        return {
+            "deliveries_per_min": round(sum(s[2] for s in self.samples) * 60 / span, 2),
+            "errors_per_min": round(sum(s[3] for s in self.samples) * 60 / span, 2),
+        }
+
+
+class AiozCollector:
+    """AIOZ node status with the stats call cached for `stats_ttl` seconds"""
+
+    def __init__(self, node_dir: str, stats_ttl: float = 60, timeout: float = 20,
+                 log_path: Optional[str] = None, log_state: Optional[str] = None):
+        self.node_dir = node_dir
+        self.stats_ttl = stats_ttl
+        self.timeout = timeout
+        self.pid = None
+        self.stats = None
+        self.stats_at = None
+        self.stats_error = None
+        self.tail = LogTail(log_path, log_state) if log_path else None
+        self.lock = threading.Lock()
+
+    def node_pid(self) -> Optional[int]:
+        """Tracked PID, rescanned only when the node restarted or the PID was reused"""
+        if self.pid is not None and procfs.pid_alive(self.pid):
+            try:
+                with open(f"/proc/{self.pid}/cmdline", 'rb') as f:
+                    if NODE_BINARY.encode() in f.read():
+                        return self.pid
+            except OSError:
+                pass
+        pids = procfs.find_pids(NODE_BINARY)
+        self.pid = pids[0] if pids else None
+        return self.pid
+
+    def fetch_stats(self) -> Dict:
+        """Run `aioz-depin-cli stats` (no shell) and parse its JSON"""
+        try:
+            result = subprocess.run([f"./{NODE_BINARY}", "stats"], cwd=self.node_dir,
+                                    capture_output=True, text=True, timeout=self.timeout)
+        except subprocess.TimeoutExpired as e:
+            raise StatsError(f"stats timed out after {self.timeout}s") from e
+        except OSError as e:
+            raise StatsError(f"could not run {NODE_BINARY}: {e}") from e
+        if result.returncode != 0:
+            raise StatsError(f"exit {result.returncode}: {result.stderr.strip()[:120]}")
+        return parse_stats(result.stdout)
+
+    def cached_stats(self) -> Optional[Dict]:
+        """Stats no older than the TTL; on failure the last good stats are kept"""
+        now = time.monotonic()
+        if self.stats_at is None or now - self.stats_at >= self.stats_ttl:
+            try:
+                self.stats = self.fetch_stats()
+                self.stats_error = None
+            except StatsError as e:
+                self.stats_error = str(e)
+            self.stats_at = now
+        return self.stats
+
+    def status(self) -> Dict:
+        with self.lock:
+            pid = self.node_pid()
+            if pid is None:
+                return {"status": "❌ STOPPED", "uptime": "N/A", "storage": 0, "delivery": 0}
+            try:
+                uptime = procfs.format_etime(procfs.process_elapsed(pid))
+            except (OSError, ValueError):
+                uptime = "?"
+
+            stats = self.cached_stats()
+            data = {"status": "🟢 RUNNING", "uptime": uptime, "storage": "?", "delivery": "?", "pid": pid}
+            if stats is not None:
+                total_size = find_field(stats, "total_size")
+                speed = find_field(stats, "upstream_speed")
+                if isinstance(total_size, (int, float)):
+                    data["storage"] = round(total_size / (1024 * 1024), 2)
+                if isinstance(speed, (int, float)):
+                    data["delivery"] = speed
+            if self.stats_error:
+                data["stats_error"] = self.stats_error
+                if stats is None:
+                    data["status"] = "🟡 RUNNING (stats unavailable)"
+
+            if self.tail is not None:
+                try:
+                    data.update(self.tail.poll())
+                except FileNotFoundError:
+                    pass  # node hasn't written its log (yet); picked up on the poll after it appears
+                except OSError as e:
+                    data["log_error"] = str(e)
+            return data
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+ClawTasks Proposal State - SQLite store written by the scanner, read by the dashboard
+Per-status counts come from an indexed aggregate instead of re-reading a progress file
+Author: Jarvis (jarvisauto001-coder)
+Repo: https://github.com/jarvisauto001-coder/moneybot-scripts
+
+Usage:
+    python3 -m moneybot.clawtasks_state status
+    python3 -m moneybot.clawtasks_state list --status pending
+"""
+
+import json
+import os
+import sqlite3
+import sys
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from moneybot.config import WORKSPACE
+
+DEFAULT_STATE = os.path.join(WORKSPACE, ".clawtasks_state.db")
+LEGACY_CACHE = os.path.join(WORKSPACE, ".clawtasks_cache.json")
+
+# Statuses still waiting on the bounty owner
+PENDING_STATUSES = ("pending", "submitted", "open")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS proposals (
+    id TEXT PRIMARY KEY,
+    bounty_id TEXT,
+    status TEXT NOT NULL DEFAULT 'unknown',
+    first_seen TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    data TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_proposals_status ON proposals(status);
+CREATE INDEX IF NOT EXISTS idx_proposals_bounty ON proposals(bounty_id);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+
+class ProposalStore:
+    """Every proposal the scanner has seen, keyed by id, with its latest status"""
+
+    def __init__(self, path: str = DEFAULT_STATE, readonly: bool = False):
+        self.path = path
+        self.readonly = readonly
+        if readonly:
+            # Readers never create or lock the file for writing
+            self.conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True, timeout=5, check_same_thread=False)
+        else:
+            self.conn = sqlite3.connect(path, timeout=10, check_same_thread=False)
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("PRAGMA synchronous=NORMAL")
+            self.conn.executescript(SCHEMA)
+        self.conn.row_factory = sqlite3.Row
+
+    @classmethod
+    def open_readonly(cls, path: str = DEFAULT_STATE) -> Optional["ProposalStore"]:
+        """Read-only handle, or None if the scanner hasn't written any state yet"""
+        if not os.path.exists(path):
+            return None
+        return cls(path, readonly=True)
+
+    # --- writer side (scanner) ---
+
+    def sync(self, proposals: List[Dict]) -> Dict[str, int]:
+        """Upsert the latest API view; proposals missing from it keep their last status"""
+        now = datetime.utcnow().isoformat()
+        changed = {"new": 0, "updated": 0}
+        with self.conn:
+            for prop in proposals:
+                prop_id = prop.get("id")
+                if prop_id is None:
+                    continue
+                status = prop.get("status") or "unknown"
+                row = self.conn.execute("SELECT status FROM proposals WHERE id = ?", (str(prop_id),)).fetchone()
+                if row is None:
+                    changed["new"] += 1
+                elif row["status"] != status:
+                    changed["updated"] += 1
+                self.conn.execute(
+                    """INSERT INTO proposals (id, bounty_id, status, first_seen, updated_at, data)
+                       VALUES (?, ?, ?, ?, ?, ?)
+                       ON CONFLICT(id) DO UPDATE SET bounty_id = excluded.bounty_id, status = excluded.status,
+                                                     updated_at = excluded.updated_at, data = excluded.data""",
+                    (str(prop_id), prop.get("bounty_id"), status, now, now, json.dumps(prop)),
+                )
+        return changed
+
+    def set_meta(self, key: str, value: Optional[str]):
+        with self.conn:
+            self.conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+
+    def import_legacy_cache(self, path: str = LEGACY_CACHE) -> int:
+        """One-time import of the old JSON cache; returns the number of proposals imported"""
+        if self.count() or not os.path.exists(path):
+            return 0
+        try:
+            with open(path, 'r') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return 0
+        proposals = data.get("proposals", [])
+        self.sync(proposals)
+        if data.get("last_reset"):
+            self.set_meta("last_reset", data["last_reset"])
+        return len(proposals)
+
+    # --- read-only query API (dashboard, CLI) ---
+
+    def get_meta(self, key: str) -> Optional[str]:
+        row = self.conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row["value"] if row else None
+
+    def status_counts(self) -> Dict[str, int]:
+        """Exact count per status (served from idx_proposals_status)"""
+        rows = self.conn.execute("SELECT status, COUNT(*) AS n FROM proposals GROUP BY status")
+        return {row["status"]: row["n"] for row in rows}
+
+    def count(self) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM proposals").fetchone()[0]
+
+    def proposals(self, status: Optional[str] = None, limit: Optional[int] = None) -> List[Dict]:
+        """Stored proposals (as returned by the API), most recently updated first"""
+        sql = "SELECT data FROM proposals"
+        params: list = []
+        if status:
+            sql += " WHERE status = ?"
+            params.append(status)
+        sql += " ORDER BY updated_at DESC"
+        if limit:
+            sql += " LIMIT ?"
+            params.append(limit)
+        return [json.loads(row["data"]) for row in self.conn.execute(sql, params)]
+
+    def has_bounty(self, bounty_id) -> bool:
+        return self.conn.execute(
+            "SELECT 1 FROM proposals WHERE bounty_id = ? LIMIT 1", (bounty_id,)
+        ).fetchone() is not None
+
+    def summary(self) -> Dict:
+        """Counts the dashboard shows, plus when the scanner last synced"""
+        counts = self.status_counts()
+        return {
+            "proposals": sum(counts.values()),
+            "accepted": counts.get("accepted", 0) + counts.get("completed", 0),
+            "pending": sum(counts.get(s, 0) for s in PENDING_STATUSES),
+            "by_status": counts,
+            "last_scan": self.get_meta("last_scan"),
+        }
+
+    def close(self):
+        self.conn.close()
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Inspect the scanner's ClawTasks proposal state")
+    parser.add_argument("--db", default=DEFAULT_STATE)
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("status", help="Per-status counts and last scan time")
+    listing = sub.add_parser("list", help="List stored proposals")
+    listing.add_argument("--status", default=None)
+    listing.add_argument("--limit", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    store = ProposalStore.open_readonly(args.db)
+    if store is None:
+        print(f"No proposal state at {args.db} yet (run the scanner first)")
+        return 1
+    if args.command == "status":
+        summary = store.summary()
+        print(f"last scan: {summary['last_scan'] or 'never'}")
+        for status, count in sorted(summary["by_status"].items()):
+            print(f"{status:>10}: {count}")
+        print(f"{'total':>10}: {summary['proposals']}")
+        return 0
+
+    for prop in store.proposals(status=args.status, limit=args.limit):
+        print(f"{prop.get('id')}  bounty={prop.get('bounty_id')}  status={prop.get('status', 'unknown')}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Config - credentials .env loading with a validated snapshot cached by mtime
+The .env file is parsed and validated once per change; later loads (other scripts,
+supervisor jobs, cron runs) reuse the snapshot while the file's mtime and size match
+Author: Jarvis (jarvisauto001-coder)
+Repo: https://github.com/jarvisauto001-coder/moneybot-scripts
+"""
+
+import marshal
+import os
+import re
+import sys
+import threading
+from typing import Dict, List, Tuple
+
+# Root of every state file, log and report; MONEYBOT_WORKSPACE points the
+# scripts at another tree (benchmarks, a second account, a dry run)
+WORKSPACE = os.environ.get("MONEYBOT_WORKSPACE", "/root/.openclaw/workspace")
+CREDENTIALS_FILE = os.path.join(WORKSPACE, ".credentials/jarvis_accounts.env")
+SNAPSHOT_VERSION = 1
+
+KEY_RE = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+# path -> ((mtime_ns, size), values) for repeat loads inside one process
+_loaded: Dict[str, Tuple[Tuple[int, int], Dict[str, str]]] = {}
+
+
+def parse_env(text: str) -> Tuple[Dict[str, str], List[str]]:
+    """KEY=value lines (same rules the scripts always used) plus a list of problems found"""
+    values, problems = {}, []
+    for number, line in enumerate(text.splitlines(), start=1):
+        if not line.strip() or line.startswith('#'):
+            continue
+        if '=' not in line:
+            problems.append(f"line {number}: no '=', ignored")
+            continue
+        key, value = line.strip().split('=', 1)
+        if not KEY_RE.match(key):
+            problems.append(f"line {number}: invalid key {key!r}, ignored")
+            continue
+        if key in values:
+            problems.append(f"line {number}: {key} set twice, last value wins")
+        values[key] = value
+    return values, problems
+
+
+def snapshot_path(path: str) -> str:
+    return path + ".snapshot"
+
+
+def _read_snapshot(path: str, stamp: Tuple[int, int]):
+    try:
+        with open(snapshot_path(path), 'rb') as f:
+            data = marshal.load(f)
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    if not (isinstance(data, tuple) and len(data) == 3 and data[0] == SNAPSHOT_VERSION and data[1] == stamp):
+        return None
+    values = data[2]
+    if not isinstance(values, dict) or not all(isinstance(k, str) and isinstance(v, str) for k, v in values.items()):
+        return None
+    return values
+
+
+def _write_snapshot(path: str, stamp: Tuple[int, int], values: Dict[str, str]):
+    target = snapshot_path(path)
+    tmp = f"{target}.{os.getpid()}.tmp"
+    try:
+        # Holds credentials: owner-only, like the .env itself should be
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'wb') as f:
+            marshal.dump((SNAPSHOT_VERSION, stamp, values), f)
+        os.replace(tmp, target)
+    except OSError:
+        pass  # Read-only credentials dir: just parse every time
+
+
+def atomic_write(path: str, text: str, fsync: bool = True):
+    """Replace path with text in one step: readers and crashes see the old or the new file, never half"""
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    # pid + thread: the supervisor's jobs may write the same kind of file concurrently
+    tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp, 'w') as f:
+            f.write(text)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def load_env(path: str = CREDENTIALS_FILE) -> Dict[str, str]:
+    """Validated values from `path`; {} if it doesn't exist"""
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return {}
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _loaded.get(path)
+    if cached and cached[0] == stamp:
+        return cached[1]
+    values = _read_snapshot(path, stamp)
+    if values is None:
+        with open(path, 'r') as f:
+            values, problems = parse_env(f.read())
+        for problem in problems:
+            print(f"⚠️ {path}: {problem}", file=sys.stderr)
+        _write_snapshot(path, stamp, values)
+    _loaded[path] = (stamp, values)
+    return values
+
+
+def load_env_file(filepath: str = CREDENTIALS_FILE) -> Dict[str, str]:
+    """Load environment variables from .env file (values override the environment)"""
+    values = load_env(filepath)
+    os.environ.update(values)
+    return values
@@ -0,0 +1,336 @@
+#!/usr/bin/env python3
+"""
+Event Log - append-only record of results that need (or may need) attention
+Every script publishes typed events (proposal status changes, danger alerts, replies
+sent, engagement actions) to one log shared across processes. Events get consecutive
+sequence numbers and are appended as JSON lines to segment files named after their
+first number; each segment has a small binary index (seq -> byte position every
+INDEX_EVERY events), so a consumer resumes from its stored offset with one seek and
+reads only what was appended since - the dashboard and the wake-up check never
+rescan old events. Old segments are dropped past KEEP_SEGMENTS.
+Author: Jarvis (jarvisauto001-coder)
+Repo: https://github.com/jarvisauto001-coder/moneybot-scripts
+
+Usage:
+    python3 -m moneybot.events tail --consumer llm --attention   # what needs a look since last time
+    python3 -m moneybot.events tail --from 0 --type reply_sent --peek
+    python3 -m moneybot.events tail --follow
+    python3 -m moneybot.events publish system_alert --source respawner message="subagent restarted"
+    python3 -m moneybot.events stats
+"""
+
+import bisect
+import fcntl
+import json
+import os
+import re
+import struct
+import sys
+import time
+from datetime import datetime
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from moneybot.config import WORKSPACE
+
+DEFAULT_EVENTS_DIR = os.path.join(WORKSPACE, "events")
+SEGMENT_BYTES = 4 * 1024 * 1024  # active segment size that starts a new one
+KEEP_SEGMENTS = 20               # ~80 MB of history
+INDEX_EVERY = 64                 # events between index entries (a resume reads at most this many extra)
+INDEX_ENTRY = struct.Struct("<QQ")  # (seq, byte position in the segment)
+
+# type -> what it records; `attention` marks the ones a human (or the LLM) should see
+EVENT_TYPES = {
+    "proposal_status": "ClawTasks proposal submitted or moved to a new status",
+    "danger_alert": "Guardian refused a dangerous email",
+    "reply_sent": "Guardian auto-replied to an email",
+    "engagement": "Engager upvoted, commented or replied on Moltbook",
+    "system_alert": "Published by cron wrappers (AIOZ stopped, git sync failed, ...)",
+}
+
+CONSUMER_RE = re.compile(r"^[A-Za-z0-9_-]+$")
+
+
+def needs_attention(event_type: str, data: Dict) -> bool:
+    if event_type in ("danger_alert", "system_alert"):
+        return True
+    return event_type == "proposal_status" and data.get("new") == "accepted"
+
+
+def describe(event: Dict) -> str:
+    """One line per event, for the CLI and the dashboard"""
+    data = event.get("data", {})
+    kind = event.get("type")
+    if kind == "proposal_status":
+        text = f"🎉 Proposal {data.get('proposal')} ACCEPTED" if data.get("new") == "accepted" else \
+            f"📋 Proposal {data.get('proposal') or data.get('bounty')}: {data.get('old') or 'new'} → {data.get('new')}"
+    elif kind == "danger_alert":
+        text = f"🚨 Dangerous email from {data.get('sender')}: {data.get('reason')}"
+    elif kind == "reply_sent":
+        text = f"📧 Replied to {data.get('to')}: {str(data.get('subject', ''))[:50]}"
+    elif kind == "engagement":
+        text = f"💬 {data.get('action')} on {data.get('author')}'s post ({data.get('reason')})"
+    else:
+        text = f"⚠️ {data.get('message') or json.dumps(data, ensure_ascii=False)}"
+    stamp = datetime.utcfromtimestamp(event.get("ts", 0)).strftime("%Y-%m-%d %H:%M:%S")
+    return f"#{event.get('seq')} [{stamp}] [{event.get('source', '?')}] {text}"
+
+
+class EventLog:
+    """Segmented append-only log; writers serialize on a lock file, readers never lock"""
+
+    def __init__(self, directory: str = DEFAULT_EVENTS_DIR, segment_bytes: int = SEGMENT_BYTES,
+                 keep: int = KEEP_SEGMENTS):
+        self.directory = directory
+        self.segment_bytes = segment_bytes
+        self.keep = keep
+        self.lock_path = os.path.join(directory, ".lock")
+        self.consumer_dir = os.path.join(directory, "consumers")
+
+    # --- segments ---
+
+    def segments(self) -> List[int]:
+        """Base sequence numbers of the segments on disk, oldest first"""
+        try:
+            names = os.listdir(self.directory)
+        except FileNotFoundError:
+            return []
+        return sorted(int(name[:-6]) for name in names if name.endswith(".jsonl") and name[:-6].isdigit())
+
+    def _segment(self, base: int, ext: str = "jsonl") -> str:
+        return os.path.join(self.directory, f"{base:012d}.{ext}")
+
+    def _head(self, base: int, repair: bool = False):
+        """(next seq, size up to the last complete line) of a segment. Only a writer holding
+        the lock passes repair=True to cut off a line torn by a crashed writer; a reader
+        never modifies the file, since the tail may be a line still being flushed"""
+        with open(self._segment(base), 'rb+' if repair else 'rb') as f:
+            size = start = f.seek(0, os.SEEK_END)
+            complete = b""
+            while start > 0:
+                # Read back until the last complete line is fully in hand
+                start = max(0, start - 4096)
+                f.seek(start)
+                tail = f.read(size - start)
+                complete = tail[:tail.rfind(b"\n") + 1]
+                if complete and (start == 0 or b"\n" in complete[:-1]):
+                    break
+            end = start + len(complete)
+            if repair and end != size:
+                f.truncate(end)
+            if not complete:
+                return base, end
+            return json.loads(complete[:-1].rsplit(b"\n", 1)[-1])["seq"] + 1, end
+
+    def _prune(self, segments: List[int]):
+        for base in segments[:-self.keep] if self.keep else []:
+            for ext in ("jsonl", "idx"):
+                try:
+                    os.remove(self._segment(base, ext))
+                except FileNotFoundError:
+                    pass
+
+    # --- writing ---
+
+    def append(self, events: Iterable[Dict]) -> List[int]:
+        """Append {type, source, data} dicts; returns their sequence numbers"""
+        events = list(events)
+        if not events:
+            return []
+        for event in events:
+            if event["type"] not in EVENT_TYPES:
+                raise ValueError(f"unknown event type {event['type']!r} (known: {', '.join(EVENT_TYPES)})")
+        os.makedirs(self.directory, exist_ok=True)
+        with open(self.lock_path, 'a') as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            segments = self.segments()
+            if segments:
+                base = segments[-1]
+                seq, size = self._head(base, repair=True)
+            else:
+                base = seq = size = 0
+            if size >= self.segment_bytes:
+                base, size = seq, 0
+                segments.append(base)
+                self._prune(segments)
+            now = round(time.time(), 3)
+            seqs = []
+            with open(self._segment(base), 'ab') as f, open(self._segment(base, "idx"), 'ab') as index:
+                for event in events:
+                    data = event.get("data") or {}
+                    record = {"seq": seq, "ts": now, "type": event["type"], "source": event.get("source", "?"),
+                              "attention": needs_attention(event["type"], data), "data": data}
+                    line = (json.dumps(record, ensure_ascii=False, default=str) + "\n").encode('utf-8')
+                    if seq % INDEX_EVERY == 0 or size == 0:
+                        index.write(INDEX_ENTRY.pack(seq, size))
+                    f.write(line)
+                    size += len(line)
+                    seqs.append(seq)
+                    seq += 1
+        return seqs
+
+    def publish(self, event_type: str, source: str, **data) -> Optional[int]:
+        """Append one event; a failed write is reported, never raised into the caller's cycle"""
+        try:
+            return self.append([{"type": event_type, "source": source, "data": data}])[0]
+        except OSError as e:
+            print(f"⚠️ Event {event_type} from {source} not recorded: {e}", file=sys.stderr)
+            return None
+
+    # --- reading ---
+
+    def _position(self, base: int, offset: int) -> int:
+        """Byte position of the last indexed event at or before offset"""
+        try:
+            with open(self._segment(base, "idx"), 'rb') as f:
+                raw = f.read()
+        except FileNotFoundError:
+            return 0
+        entries = [INDEX_ENTRY.unpack_from(raw, at) for at in range(0, len(raw) - len(raw) % INDEX_ENTRY.size,
+                                                                     INDEX_ENTRY.size)]
+        found = bisect.bisect_right([seq for seq, _ in entries], offset) - 1
+        return entries[found][1] if found >= 0 else 0
+
+    def read(self, offset: int = 0) -> Iterator[Dict]:
+        """Events with seq >= offset (from the oldest kept one if offset was pruned)"""
+        segments = self.segments()
+        first = max(0, bisect.bisect_right(segments, offset) - 1)
+        for base in segments[first:]:
+            try:
+                f = open(self._segment(base), 'rb')
+            except FileNotFoundError:
+                continue  # pruned under us
+            with f:
+                f.seek(self._position(base, offset) if base <= offset else 0)
+                for line in f:
+                    if not line.endswith(b"\n"):
+                        break  # still being written
+                    event = json.loads(line)
+                    if event["seq"] >= offset:
+                        yield event
+
+    def next_offset(self) -> int:
+        segments = self.segments()
+        return self._head(segments[-1])[0] if segments else 0
+
+    # --- consumers ---
+
+    def _cursor_path(self, consumer: str) -> str:
+        if not CONSUMER_RE.match(consumer):
+            raise ValueError(f"consumer name must match {CONSUMER_RE.pattern}")
+        return os.path.join(self.consumer_dir, f"{consumer}.json")
+
+    def offset(self, consumer: str) -> int:
+        try:
+            with open(self._cursor_path(consumer), 'r') as f:
+                return int(json.load(f)["offset"])
+        except (OSError, ValueError, KeyError):
+            return 0
+
+    def commit(self, consumer: str, offset: int):
+        os.makedirs(self.consumer_dir, exist_ok=True)
+        path = self._cursor_path(consumer)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, 'w') as f:
+            json.dump({"offset": offset, "updated_at": datetime.utcnow().isoformat()}, f)
+        os.replace(tmp, path)
+
+    def consumers(self) -> Dict[str, int]:
+        try:
+            names = sorted(name[:-5] for name in os.listdir(self.consumer_dir) if name.endswith(".json"))
+        except FileNotFoundError:
+            return {}
+        return {name: self.offset(name) for name in names}
+
+    def poll(self, consumer: str, types: Optional[Iterable[str]] = None, attention: bool = False,
+             limit: Optional[int] = None, commit: bool = True) -> List[Dict]:
+        """Events appended since consumer's stored offset (optionally filtered); advances it"""
+        types = set(types) if types else None
+        start = offset = self.offset(consumer)
+        events = []
+        for event in self.read(start):
+            offset = event["seq"] + 1
+            if (types is None or event["type"] in types) and (not attention or event.get("attention")):
+                events.append(event)
+                if limit and len(events) >= limit:
+                    break
+        if commit and offset != start:
+            self.commit(consumer, offset)
+        return events
+
+
+_default = None
+
+
+def publish(event_type: str, source: str, **data) -> Optional[int]:
+    """Publish to the workspace event log (one EventLog per process)"""
+    global _default
+    if _default is None:
+        _default = EventLog()
+    return _default.publish(event_type, source, **data)
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Read and write the MoneyBot event log")
+    parser.add_argument("--dir", default=DEFAULT_EVENTS_DIR)
+    sub = parser.add_subparsers(dest="command", required=True)
+    t = sub.add_parser("tail", help="Events since a consumer's offset (or --from N), advancing it")
+    t.add_argument("--consumer", default="cli", help="Whose stored offset to resume from and advance")
+    t.add_argument("--from", dest="start", type=int, default=None, help="Start at this seq instead (no commit)")
+    t.add_argument("--type", default=None, help="Comma-separated event types")
+    t.add_argument("--attention", action="store_true", help="Only events that need attention")
+    t.add_argument("--peek", action="store_true", help="Don't advance the consumer's offset")
+    t.add_argument("--follow", "-f", action="store_true", help="Keep waiting for new events")
+    t.add_argument("--json", action="store_true", help="Print raw JSON events")
+    p = sub.add_parser("publish", help="Append an event (for cron wrappers and shell scripts)")
+    p.add_argument("type", choices=sorted(EVENT_TYPES))
+    p.add_argument("--source", default="cron")
+    p.add_argument("fields", nargs="*", help="key=value pairs")
+    sub.add_parser("stats", help="Segments, offsets and consumer lag")
+    args = parser.parse_args(argv)
+
+    log = EventLog(args.dir)
+    if args.command == "publish":
+        data = dict(field.split("=", 1) for field in args.fields if "=" in field)
+        seq = log.append([{"type": args.type, "source": args.source, "data": data}])[0]
+        print(f"📬 Published {args.type} as #{seq}")
+        return 0
+
+    if args.command == "stats":
+        segments = log.segments()
+        head = log.next_offset()
+        size = sum(os.path.getsize(log._segment(base)) for base in segments)
+        print(f"📚 {len(segments)} segment(s), {size / 1024:.1f} KiB, events #{segments[0] if segments else 0}-#{head - 1}")
+        for name, offset in log.consumers().items():
+            print(f"👀 {name:<16} at #{offset}  ({head - offset} behind)")
+        return 0
+
+    types = [name.strip() for name in args.type.split(",")] if args.type else None
+    start = args.start if args.start is not None else log.offset(args.consumer) if args.peek else None
+    shown = 0
+    while True:
+        if start is None:
+            events = log.poll(args.consumer, types=types, attention=args.attention)
+        else:
+            # --from / --peek: read from a position of our own and leave the stored offset alone
+            events, start = [], max(start, 0)
+            for event in log.read(start):
+                start = event["seq"] + 1
+                if (not types or event["type"] in types) and (not args.attention or event.get("attention")):
+                    events.append(event)
+        for event in events:
+            print(json.dumps(event, ensure_ascii=False) if args.json else describe(event), flush=True)
+        shown += len(events)
+        if not args.follow:
+            break
+        try:
+            time.sleep(1.0)
+        except KeyboardInterrupt:
+            break
+    if not args.json and not args.follow:
+        print(f"-- {shown} event(s)" if shown else "✅ Nothing new", file=sys.stderr)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
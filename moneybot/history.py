@@ -0,0 +1,520 @@
+#!/usr/bin/env python3
+"""
+History Export - scanner, guardian and engager history as columnar arrays, plus a report
+`export` folds the proposal store, the event log, the guardian lease table and the
+post archives into one NumPy .npz file (string columns dictionary-encoded, times as
+datetime64). Each export merges into the previous one, so history outlives the lease
+table's 30 days and the event log's last segments. `report` answers the usual
+questions - proposal acceptance by fit score and skill, email class mix over time,
+which engagement reasons get replies - with bincount group-bys over those arrays.
+Author: Jarvis (jarvisauto001-coder)
+Repo: https://github.com/jarvisauto001-coder/moneybot-scripts
+
+Usage:
+    python3 -m moneybot.history export
+    python3 -m moneybot.history export --parquet ~/history_parquet   # also Parquet, if pyarrow is installed
+    python3 -m moneybot.history report --since 90d --every week
+    python3 -m moneybot.history report --section proposals
+
+Tables (columns):
+    proposals        id, bounty, status, score (-1 = unknown), submitted_at, decided_at
+    proposal_skills  proposal (row in proposals), skill
+    emails           mailbox, uid, at, class
+    replies          mailbox, uid, at
+    engagements      account, post_id, action, reason, at, outcome (-1 unknown, 0 no reply, 1 replied)
+"""
+
+import os
+import sqlite3
+import sys
+import time
+from typing import Dict, List, Optional, Sequence
+
+from moneybot.config import WORKSPACE
+from moneybot.lazy import lazy_import
+
+# NumPy is optional for the scripts themselves; only export and report need it
+np = lazy_import("numpy")
+
+DEFAULT_HISTORY = os.path.join(WORKSPACE, ".moneybot_history.npz")
+CONSUMER = "history"  # event log consumer: each export reads only events appended since the last
+
+ACCEPTED = ("accepted", "completed")
+SECTIONS = ("proposals", "emails", "engagements")
+
+KEYS = {  # rows with the same key are one record; the latest export wins
+    "proposals": ("id",),
+    "emails": ("mailbox", "uid"),
+    "replies": ("mailbox", "uid"),
+    "engagements": ("account", "post_id", "action"),
+}
+
+
+def _require_numpy():
+    if np is None:
+        sys.exit("❌ The history export needs NumPy: pip install numpy")
+
+
+def _times(values: Sequence) -> "np.ndarray":
+    """ISO strings, epoch seconds or None -> datetime64[s] (NaT for None)"""
+    out = np.full(len(values), np.datetime64("NaT"), dtype="datetime64[s]")
+    for i, value in enumerate(values):
+        if value is None or value == "":
+            continue
+        if isinstance(value, str):
+            out[i] = np.datetime64(value[:19], "s")
+        else:
+            out[i] = np.datetime64(int(value), "s")
+    return out
+
+
+def _strings(values: Sequence) -> "np.ndarray":
+    return np.array(["" if value is None else str(value) for value in values], dtype=str)
+
+
+class History:
+    """Columnar tables; string columns stay dictionary-encoded (codes + labels)"""
+
+    def __init__(self, arrays: Optional[Dict] = None):
+        self.arrays = dict(arrays or {})
+
+    @classmethod
+    def load(cls, path: str = DEFAULT_HISTORY) -> "History":
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                return cls({key: data[key] for key in data.files})
+        except FileNotFoundError:
+            return cls()
+
+    def save(self, path: str = DEFAULT_HISTORY):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.tmp.npz"  # np.savez appends .npz to any other name
+        try:
+            np.savez_compressed(tmp, **self.arrays)
+            os.replace(tmp, path)
+        finally:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+
+    # --- columns ---
+
+    def columns(self, table: str) -> List[str]:
+        prefix = f"{table}."
+        return [key[len(prefix):] for key in self.arrays
+                if key.startswith(prefix) and not key.endswith(".labels")]
+
+    def rows(self, table: str) -> int:
+        columns = self.columns(table)
+        return len(self.arrays[f"{table}.{columns[0]}"]) if columns else 0
+
+    def codes(self, table: str, column: str) -> "np.ndarray":
+        return self.arrays[f"{table}.{column}"]
+
+    def labels(self, table: str, column: str) -> "np.ndarray":
+        return self.arrays[f"{table}.{column}.labels"]
+
+    def column(self, table: str, column: str) -> "np.ndarray":
+        """Decoded values (strings looked up through their labels)"""
+        values = self.arrays[f"{table}.{column}"]
+        labels = self.arrays.get(f"{table}.{column}.labels")
+        return labels[values] if labels is not None else values
+
+    def table(self, table: str) -> Dict[str, "np.ndarray"]:
+        return {column: self.column(table, column) for column in self.columns(table)}
+
+    def set_table(self, table: str, columns: Dict[str, "np.ndarray"]):
+        for key in [key for key in self.arrays if key.startswith(f"{table}.")]:
+            del self.arrays[key]
+        for column, values in columns.items():
+            if values.dtype.kind == "U":
+                labels, codes = np.unique(values, return_inverse=True)
+                self.arrays[f"{table}.{column}"] = codes.astype(np.int32)
+                self.arrays[f"{table}.{column}.labels"] = labels
+            else:
+                self.arrays[f"{table}.{column}"] = values
+
+    def meta(self, key: str, default=None):
+        value = self.arrays.get(f"meta.{key}")
+        return value.item() if value is not None else default
+
+    def set_meta(self, key: str, value):
+        self.arrays[f"meta.{key}"] = np.asarray(value)
+
+
+def merge(old: Dict[str, "np.ndarray"], new: Dict[str, "np.ndarray"], key: Sequence[str]) -> Dict[str, "np.ndarray"]:
+    """old rows followed by new ones, one row per key (the last one seen)"""
+    if not old:
+        columns = new
+    else:
+        columns = {column: np.concatenate([old[column], new[column]]) if column in old else new[column]
+                   for column in new}
+    count = len(next(iter(columns.values()))) if columns else 0
+    if not count:
+        return columns
+    inverse = [np.unique(columns[column], return_inverse=True)[1].reshape(-1) for column in key]
+    flipped = np.stack(inverse, axis=1)[::-1]
+    _, first = np.unique(flipped, axis=0, return_index=True)
+    keep = np.sort(count - 1 - first)
+    return {column: values[keep] for column, values in columns.items()}
+
+
+# --- export ---
+
+def _proposal_rows(history: History, events: List[Dict], state_path: str) -> Dict[str, Dict]:
+    """id -> proposal record: previous export, then submissions from events, then the store's status"""
+    proposals: Dict[str, Dict] = {}
+    if history.rows("proposals"):
+        old = history.table("proposals")
+        skills = history.table("proposal_skills")
+        by_row: Dict[int, List[str]] = {}
+        for row, skill in zip(skills.get("proposal", []), skills.get("skill", [])):
+            by_row.setdefault(int(row), []).append(str(skill))
+        for row, proposal_id in enumerate(old["id"]):
+            proposals[str(proposal_id)] = {
+                "bounty": str(old["bounty"][row]), "status": str(old["status"][row]),
+                "score": int(old["score"][row]), "skills": by_row.get(row, []),
+                "submitted_at": old["submitted_at"][row], "decided_at": old["decided_at"][row]}
+
+    for event in events:
+        if event["type"] != "proposal_status" or event["data"].get("new") != "submitted":
+            continue
+        data = event["data"]
+        proposal_id = str(data.get("proposal") or f"bounty:{data.get('bounty')}")
+        record = proposals.setdefault(proposal_id, {"status": "submitted", "decided_at": None})
+        score = data.get("score")
+        record.update(bounty=str(data.get("bounty") or ""), score=-1 if score is None else int(score),
+                      skills=list(data.get("skills") or []), submitted_at=_times([event["ts"]])[0])
+
+    if os.path.exists(state_path):
+        from moneybot.clawtasks_state import PENDING_STATUSES, ProposalStore
+        store = ProposalStore(state_path, readonly=True)
+        try:
+            rows = store.conn.execute("SELECT id, bounty_id, status, first_seen, updated_at FROM proposals").fetchall()
+        finally:
+            store.close()
+        for row in rows:
+            # A submission the API returned no id for is matched up by bounty
+            record = proposals.pop(f"bounty:{row['bounty_id']}", None) or proposals.get(row["id"]) \
+                or {"score": -1, "skills": [], "submitted_at": _times([row["first_seen"]])[0]}
+            record.update(bounty=row["bounty_id"] or "", status=row["status"])
+            decided = row["status"] not in PENDING_STATUSES + ("unknown",)
+            record["decided_at"] = _times([row["updated_at"]])[0] if decided else None
+            proposals[row["id"]] = record
+    return proposals
+
+
+def _set_proposals(history: History, proposals: Dict[str, Dict]):
+    ids = list(proposals)
+    records = [proposals[proposal_id] for proposal_id in ids]
+    history.set_table("proposals", {
+        "id": _strings(ids),
+        "bounty": _strings([record.get("bounty") for record in records]),
+        "status": _strings([record.get("status") for record in records]),
+        "score": np.array([record.get("score", -1) for record in records], dtype=np.int16),
+        "submitted_at": np.array([record.get("submitted_at") if record.get("submitted_at") is not None
+                                  else np.datetime64("NaT") for record in records], dtype="datetime64[s]"),
+        "decided_at": np.array([record.get("decided_at") if record.get("decided_at") is not None
+                                else np.datetime64("NaT") for record in records], dtype="datetime64[s]"),
+    })
+    pairs = [(row, skill) for row, record in enumerate(records) for skill in record.get("skills", [])]
+    history.set_table("proposal_skills", {
+        "proposal": np.array([row for row, _ in pairs], dtype=np.int32),
+        "skill": _strings([skill for _, skill in pairs]),
+    })
+
+
+def _email_rows(lease_db: str) -> Dict[str, "np.ndarray"]:
+    if not os.path.exists(lease_db):
+        return {}
+    conn = sqlite3.connect(f"file:{lease_db}?mode=ro", uri=True, timeout=10)
+    try:
+        rows = conn.execute(
+            "SELECT mailbox, uid, updated_at, result FROM leases "
+            "WHERE state = 'done' AND result IS NOT NULL AND result != 'resolved by hand'").fetchall()
+    finally:
+        conn.close()
+    return {
+        "mailbox": _strings([row[0] for row in rows]),
+        "uid": np.array([int(row[1]) for row in rows], dtype=np.int64),
+        "at": np.array([int(row[2]) for row in rows], dtype=np.int64).astype("datetime64[s]"),
+        "class": _strings([row[3] for row in rows]),
+    }
+
+
+def _reply_rows(events: List[Dict]) -> Dict[str, "np.ndarray"]:
+    replies = [event for event in events if event["type"] == "reply_sent"]
+    return {
+        "mailbox": _strings([event["data"].get("mailbox") for event in replies]),
+        "uid": np.array([int(event["data"].get("uid") or 0) for event in replies], dtype=np.int64),
+        "at": _times([event["ts"] for event in replies]),
+    }
+
+
+def _engagement_rows() -> Dict[str, "np.ndarray"]:
+    from moneybot.accounts import load_accounts
+    from moneybot.post_archive import DEFAULT_ARCHIVE
+    rows = []
+    for account in load_accounts("engager"):
+        path = account.state_path(DEFAULT_ARCHIVE)
+        if not os.path.exists(path):
+            continue
+        conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True, timeout=10)
+        try:
+            rows.extend((account.name,) + tuple(row) for row in conn.execute(
+                "SELECT post_id, action, reason, at, outcome FROM engagements"))
+        except sqlite3.OperationalError:
+            pass  # archive from before engagements were recorded
+        finally:
+            conn.close()
+    return {
+        "account": _strings([row[0] for row in rows]),
+        "post_id": _strings([row[1] for row in rows]),
+        "action": _strings([row[2] for row in rows]),
+        "reason": _strings([row[3] for row in rows]),
+        "at": _times([row[4] for row in rows]),
+        "outcome": np.array([-1 if row[5] is None else row[5] for row in rows], dtype=np.int8),
+    }
+
+
+def export(path: str = DEFAULT_HISTORY, state_path: Optional[str] = None, lease_db: Optional[str] = None,
+           events_dir: Optional[str] = None) -> Dict[str, int]:
+    """Merge everything recorded since the last export into path; rows per table"""
+    _require_numpy()
+    from moneybot.clawtasks_state import DEFAULT_STATE
+    from moneybot.events import DEFAULT_EVENTS_DIR, EventLog
+    from moneybot.mail_leases import DEFAULT_LEASE_DB
+
+    history = History.load(path)
+    log = EventLog(events_dir or DEFAULT_EVENTS_DIR)
+    end = log.next_offset()
+    events = [event for event in log.read(log.offset(CONSUMER)) if event["seq"] < end]
+
+    _set_proposals(history, _proposal_rows(history, events, state_path or DEFAULT_STATE))
+    for table, new in (("emails", _email_rows(lease_db or DEFAULT_LEASE_DB)),
+                       ("replies", _reply_rows(events)),
+                       ("engagements", _engagement_rows())):
+        if new:
+            history.set_table(table, merge(history.table(table), new, KEYS[table]))
+    history.set_meta("exported_at", time.time())
+    history.save(path)
+    log.commit(CONSUMER, end)  # only once the events are safely in the export
+    return {table: history.rows(table) for table in ("proposals", "proposal_skills", "emails", "replies", "engagements")}
+
+
+def export_parquet(history: History, directory: str) -> List[str]:
+    """One Parquet file per table (decoded columns); needs pyarrow"""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    os.makedirs(directory, exist_ok=True)
+    written = []
+    for table in ("proposals", "proposal_skills", "emails", "replies", "engagements"):
+        if not history.columns(table):
+            continue
+        target = os.path.join(directory, f"{table}.parquet")
+        pq.write_table(pa.table(history.table(table)), target)
+        written.append(target)
+    return written
+
+
+# --- report ---
+
+def _rate(part, whole) -> "np.ndarray":
+    return np.divide(part, whole, out=np.full(len(whole), np.nan), where=whole > 0)
+
+
+def _percent(value: float) -> str:
+    return "    -" if np.isnan(value) else f"{value * 100:4.0f}%"
+
+
+def _since_mask(times: "np.ndarray", since: Optional[float]) -> "np.ndarray":
+    if since is None:
+        return np.ones(len(times), dtype=bool)
+    return times >= np.datetime64(int(since), "s")
+
+
+def proposal_report(history: History, since: Optional[float] = None) -> Dict:
+    """Acceptance rate by fit score and by skill (decided = no longer pending)"""
+    from moneybot.clawtasks_state import PENDING_STATUSES
+
+    if not history.rows("proposals"):
+        return {"by_score": [], "by_skill": []}
+    status_labels = history.labels("proposals", "status")
+    status = history.codes("proposals", "status")
+    accepted = np.isin(status_labels, ACCEPTED)[status]
+    decided = ~np.isin(status_labels, PENDING_STATUSES + ("unknown",))[status]
+    mask = _since_mask(history.codes("proposals", "submitted_at"), since)
+
+    score = history.codes("proposals", "score").astype(np.int64)
+    shift = score.min() if len(score) else 0
+    slot = (score - shift)[mask]
+    submitted = np.bincount(slot)
+    decided_n = np.bincount(slot, weights=decided[mask], minlength=len(submitted))
+    accepted_n = np.bincount(slot, weights=accepted[mask], minlength=len(submitted))
+    rate = _rate(accepted_n, decided_n)
+    by_score = [{"score": int(i + shift), "submitted": int(submitted[i]), "decided": int(decided_n[i]),
+                 "accepted": int(accepted_n[i]), "rate": float(rate[i])}
+                for i in np.flatnonzero(submitted)]
+
+    by_skill = []
+    if history.rows("proposal_skills"):
+        rows = history.codes("proposal_skills", "proposal")
+        skill = history.codes("proposal_skills", "skill")
+        keep = mask[rows]
+        rows, skill = rows[keep], skill[keep]
+        labels = history.labels("proposal_skills", "skill")
+        submitted = np.bincount(skill, minlength=len(labels))
+        decided_n = np.bincount(skill, weights=decided[rows], minlength=len(labels))
+        accepted_n = np.bincount(skill, weights=accepted[rows], minlength=len(labels))
+        rate = _rate(accepted_n, decided_n)
+        order = np.lexsort((-submitted, -np.nan_to_num(rate, nan=-1.0)))
+        by_skill = [{"skill": str(labels[i]), "submitted": int(submitted[i]), "decided": int(decided_n[i]),
+                     "accepted": int(accepted_n[i]), "rate": float(rate[i])}
+                    for i in order if submitted[i]]
+    return {"by_score": by_score, "by_skill": by_skill}
+
+
+def _periods(times: "np.ndarray", every: str) -> "np.ndarray":
+    days = times.astype("datetime64[D]")
+    if every == "day":
+        return days
+    if every == "week":
+        return days - (days.astype(np.int64) + 3) % 7  # Monday (1970-01-01 was a Thursday)
+    return times.astype("datetime64[M]").astype("datetime64[D]")
+
+
+def email_report(history: History, since: Optional[float] = None, every: str = "week") -> Dict:
+    """Per period: messages handled per class, and how many got an auto-reply"""
+    if not history.rows("emails"):
+        return {"classes": [], "periods": []}
+    times = history.codes("emails", "at")
+    mask = _since_mask(times, since)
+    classes = history.labels("emails", "class")
+    period_values, period = np.unique(_periods(times[mask], every), return_inverse=True)
+    period = period.reshape(-1)
+    grid = np.bincount(period * len(classes) + history.codes("emails", "class")[mask],
+                       minlength=len(period_values) * len(classes)).reshape(len(period_values), len(classes))
+
+    replied = np.zeros(len(period_values))
+    if history.rows("replies"):
+        # Join on (mailbox, uid) through one key space shared by both tables
+        mailboxes = np.union1d(history.labels("emails", "mailbox"), history.labels("replies", "mailbox"))
+        email_box = np.searchsorted(mailboxes, history.labels("emails", "mailbox"))[history.codes("emails", "mailbox")[mask]]
+        reply_box = np.searchsorted(mailboxes, history.labels("replies", "mailbox"))[history.codes("replies", "mailbox")]
+        email_key = email_box.astype(np.int64) << 32 | history.codes("emails", "uid")[mask]
+        reply_key = reply_box.astype(np.int64) << 32 | history.codes("replies", "uid")
+        replied = np.bincount(period, weights=np.isin(email_key, reply_key), minlength=len(period_values))
+
+    columns = np.flatnonzero(grid.sum(axis=0))
+    return {
+        "classes": [str(classes[i]) for i in columns],
+        "periods": [{"period": str(period_values[row]), "total": int(grid[row].sum()),
+                     "counts": [int(grid[row, i]) for i in columns], "replied": int(replied[row])}
+                    for row in range(len(period_values))],
+    }
+
+
+def engagement_report(history: History, since: Optional[float] = None) -> List[Dict]:
+    """Per (action, reason): how often the post's author replied to us, where that is known"""
+    if not history.rows("engagements"):
+        return []
+    mask = _since_mask(history.codes("engagements", "at"), since)
+    actions = history.labels("engagements", "action")
+    reasons = history.labels("engagements", "reason")
+    group = (history.codes("engagements", "action") * len(reasons) + history.codes("engagements", "reason"))[mask]
+    outcome = history.codes("engagements", "outcome")[mask]
+    size = len(actions) * len(reasons)
+    count = np.bincount(group, minlength=size)
+    labeled = np.bincount(group, weights=outcome >= 0, minlength=size)
+    replied = np.bincount(group, weights=outcome == 1, minlength=size)
+    rate = _rate(replied, labeled)
+    order = np.lexsort((-count, -np.nan_to_num(rate, nan=-1.0)))
+    return [{"action": str(actions[i // len(reasons)]), "reason": str(reasons[i % len(reasons)]) or "-",
+             "count": int(count[i]), "labeled": int(labeled[i]), "replied": int(replied[i]), "rate": float(rate[i])}
+            for i in order if count[i]]
+
+
+def print_report(history: History, since: Optional[float] = None, every: str = "week",
+                 sections: Sequence[str] = SECTIONS, limit: int = 15):
+    if "proposals" in sections:
+        report = proposal_report(history, since)
+        print("🎯 ClawTasks proposals - acceptance by fit score")
+        print(f"  {'score':>6}{'submitted':>11}{'decided':>9}{'accepted':>10}{'rate':>7}")
+        for row in report["by_score"]:
+            score = "?" if row["score"] < 0 else row["score"]
+            print(f"  {score:>6}{row['submitted']:>11}{row['decided']:>9}{row['accepted']:>10}  {_percent(row['rate'])}")
+        print("\n🧰 Acceptance by matched skill")
+        print(f"  {'skill':<20}{'submitted':>10}{'decided':>9}{'accepted':>10}{'rate':>7}")
+        for row in report["by_skill"][:limit]:
+            print(f"  {row['skill']:<20}{row['submitted']:>10}{row['decided']:>9}{row['accepted']:>10}  {_percent(row['rate'])}")
+        if not report["by_score"]:
+            print("  (no proposals exported yet)")
+        print()
+    if "emails" in sections:
+        report = email_report(history, since, every)
+        print(f"📧 Email class mix per {every}")
+        print(f"  {every:<12}{'total':>7}" + "".join(f"{name[:11]:>12}" for name in report["classes"]) + f"{'replied':>9}")
+        for row in report["periods"][-limit:]:
+            shares = "".join(f"{_percent(count / row['total']):>12}" for count in row["counts"])
+            print(f"  {row['period']:<12}{row['total']:>7}{shares}{row['replied']:>9}")
+        if not report["periods"]:
+            print("  (no emails exported yet)")
+        print()
+    if "engagements" in sections:
+        rows = engagement_report(history, since)
+        print("💬 Moltbook engagement - which reasons lead to replies")
+        print(f"  {'action':<9}{'reason':<28}{'count':>7}{'labeled':>9}{'replied':>9}{'rate':>7}")
+        for row in rows[:limit]:
+            print(f"  {row['action']:<9}{row['reason'][:27]:<28}{row['count']:>7}{row['labeled']:>9}"
+                  f"{row['replied']:>9}  {_percent(row['rate'])}")
+        if not rows:
+            print("  (no engagements exported yet)")
+
+
+def main(argv=None):
+    import argparse
+    from moneybot.logstore import parse_when
+
+    parser = argparse.ArgumentParser(description="Export history as columnar arrays and report on it")
+    parser.add_argument("--file", default=DEFAULT_HISTORY)
+    sub = parser.add_subparsers(dest="command", required=True)
+    exp = sub.add_parser("export", help="Merge new proposals, emails and engagements into the export")
+    exp.add_argument("--parquet", metavar="DIR", help="Also write one Parquet file per table (needs pyarrow)")
+    rep = sub.add_parser("report", help="Acceptance, email mix and engagement reply rates")
+    rep.add_argument("--since", default=None, help="e.g. 90d, 8w, 2026-01-01")
+    rep.add_argument("--every", choices=("day", "week", "month"), default="week")
+    rep.add_argument("--section", choices=SECTIONS, action="append")
+    rep.add_argument("--limit", type=int, default=15, help="Rows per table")
+    rep.add_argument("--export", action="store_true", help="Export first")
+    args = parser.parse_args(argv)
+
+    _require_numpy()
+    if args.command == "export" or args.export:
+        start = time.perf_counter()
+        counts = export(args.file)
+        print(f"📦 {args.file}: " + ", ".join(f"{count} {table}" for table, count in counts.items())
+              + f" ({(time.perf_counter() - start) * 1000:.0f} ms)")
+        if args.command == "export" and args.parquet:
+            try:
+                for path in export_parquet(History.load(args.file), args.parquet):
+                    print(f"🪵 {path}")
+            except ImportError:
+                print("⚠️ pyarrow is not installed, skipped the Parquet files")
+        if args.command == "export":
+            return 0
+
+    start = time.perf_counter()
+    history = History.load(args.file)
+    if not history.arrays:
+        print(f"No export at {args.file} yet: python3 -m moneybot.history export")
+        return 1
+    print_report(history, since=parse_when(args.since), every=args.every,
+                 sections=args.section or SECTIONS, limit=args.limit)
+    exported = history.meta("exported_at")
+    stamp = time.strftime("%Y-%m-%d %H:%M", time.gmtime(exported)) if exported else "?"
+    print(f"\n⏱️ Report in {(time.perf_counter() - start) * 1000:.0f} ms (export from {stamp} UTC)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
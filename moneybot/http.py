@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+"""
+Shared HTTP client - one keep-alive Session per host, retries with jittered backoff,
+Retry-After handling, per-host concurrency limits, per-endpoint latency/reuse stats
+and GETs served from the cross-process response cache (moneybot/http_cache.py)
+Author: Jarvis (jarvisauto001-coder)
+Repo: https://github.com/jarvisauto001-coder/moneybot-scripts
+
+Usage:
+    from moneybot.http import get_client
+    http = get_client()
+    resp = http.get(url, headers=HEADERS, timeout=15)
+    resp = http.post(url, json=payload, retry=False)   # caller handles 429 itself
+    resp = http.get(url, headers=HEADERS, cache=False) # always go upstream
+    http = get_client("engager-Jarvis_Labs")           # a second account's own pools
+
+Set MONEYBOT_HTTP_CACHE=off to disable the response cache, or to a path to move it.
+"""
+
+import os
+import re
+import sys
+import threading
+import time
+from collections import deque
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+from moneybot.http_cache import DEFAULT_CACHE, ResponseCache, auth_scope, cache_key
+from moneybot.lazy import lazy_import
+from moneybot.ratelimit import parse_retry_after
+
+random = lazy_import("random")
+requests = lazy_import("requests")
+sqlite3 = lazy_import("sqlite3")
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+IDEMPOTENT = {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+
+# /posts/abc123/comments -> /posts/{id}/comments, so stats group by endpoint
+ID_SEGMENT_RE = re.compile(r"/(?=[^/]*\d)[A-Za-z0-9_-]{6,}(?=/|$)|/\d+(?=/|$)")
+
+
+def endpoint_key(method: str, url: str) -> str:
+    parts = urlsplit(url)
+    return f"{method} {parts.netloc}{ID_SEGMENT_RE.sub('/{id}', parts.path)}"
+
+
+class EndpointStats:
+    def __init__(self, window: int = 256):
+        self.requests = 0
+        self.errors = 0
+        self.retries = 0
+        self.latencies = deque(maxlen=window)  # seconds, most recent requests
+        self.lock = threading.Lock()
+
+    def record(self, seconds: float, error: bool = False, retried: bool = False):
+        with self.lock:
+            self.requests += 1
+            self.errors += error
+            self.retries += retried
+            self.latencies.append(seconds)
+
+    def summary(self) -> Dict:
+        with self.lock:
+            ordered = sorted(self.latencies)
+            counts = {"requests": self.requests, "errors": self.errors, "retries": self.retries}
+
+        def pct(p):
+            return round(ordered[min(len(ordered) - 1, int(p * len(ordered)))] * 1000, 1) if ordered else None
+        return dict(counts, p50_ms=pct(0.50), p95_ms=pct(0.95), max_ms=pct(1.0))
+
+
+class HttpClient:
+    """
+    Drop-in for the requests.get/post calls the scripts made, backed by pooled
+    Sessions. Retries 429/5xx and connection errors for idempotent methods;
+    non-idempotent calls are only retried on 429 (the request wasn't processed),
+    and only when the caller allows it.
+    """
+
+    def __init__(self, max_retries: int = 3, backoff_base: float = 0.5, backoff_max: float = 30.0,
+                 max_per_host: int = 4, pool_size: int = 8, cache: Optional[ResponseCache] = None):
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.max_per_host = max_per_host
+        self.pool_size = pool_size
+        self.cache = cache
+        self.sessions = {}
+        self.limits = {}
+        self.stats: Dict[str, EndpointStats] = {}
+        self.lock = threading.Lock()
+
+    def _host(self, url: str):
+        """(Session, semaphore) for the URL's host, created on first use"""
+        host = urlsplit(url).netloc
+        with self.lock:
+            session = self.sessions.get(host)
+            if session is None:
+                session = requests.Session()
+                adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_size)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                self.sessions[host] = session
+                self.limits[host] = threading.BoundedSemaphore(self.max_per_host)
+            return session, self.limits[host]
+
+    def _stats(self, key: str) -> EndpointStats:
+        with self.lock:
+            stats = self.stats.get(key)
+            if stats is None:
+                stats = self.stats[key] = EndpointStats()
+            return stats
+
+    def backoff(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """Retry-After when the server sent one, else full-jitter exponential backoff"""
+        if retry_after:
+            return min(self.backoff_max, parse_retry_after(retry_after, default=self.backoff_base))
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+    def request(self, method: str, url: str, retry: Optional[bool] = None, cache: Optional[bool] = None, **kwargs):
+        method = method.upper()
+        if method == "GET" and cache is not False and self.cache is not None:
+            ttl = self.cache.ttl_for(url)
+            if ttl:
+                return self._cached_get(url, ttl, retry, **kwargs)
+        return self._send(method, url, retry, **kwargs)
+
+    def _cached_get(self, url: str, ttl: int, retry: Optional[bool], **kwargs):
+        """Fresh entry -> no request; stale entry -> conditional GET; otherwise fetch and store"""
+        key = cache_key("GET", url, auth_scope(kwargs.get("headers")))
+        endpoint = endpoint_key("GET", url)
+        try:
+            entry = self.cache.lookup(key)
+        except sqlite3.Error as e:
+            self._disable_cache(e)
+            return self._send("GET", url, retry, **kwargs)
+        if entry and entry["fresh"]:
+            self._cache_op(self.cache.count, endpoint, "hit")
+            return self._from_cache(url, entry, "hit")
+        if entry:
+            kwargs["headers"] = dict(kwargs.get("headers") or {}, **self.cache.conditional_headers(entry))
+        resp = self._send("GET", url, retry, **kwargs)
+        if entry and resp.status_code == 304:
+            self._cache_op(self.cache.refresh, key, ttl)
+            self._cache_op(self.cache.count, endpoint, "revalidated")
+            return self._from_cache(url, entry, "revalidated")
+        self._cache_op(self.cache.count, endpoint, "miss")
+        if resp.status_code == 200 and "no-store" not in resp.headers.get("Cache-Control", ""):
+            self._cache_op(self.cache.store, key, "GET", url, auth_scope(kwargs.get("headers")),
+                           resp.status_code, resp.headers, resp.content, ttl)
+        return resp
+
+    def _from_cache(self, url: str, entry: Dict, outcome: str):
+        resp = requests.models.Response()
+        resp.status_code = entry["status"]
+        resp.headers = requests.structures.CaseInsensitiveDict(entry["headers"])
+        resp.headers["X-Moneybot-Cache"] = outcome
+        resp.encoding = requests.utils.get_encoding_from_headers(resp.headers)
+        resp._content = entry["body"]
+        resp.url = url
+        return resp
+
+    def _cache_op(self, fn, *args):
+        if self.cache is None:
+            return
+        try:
+            fn(*args)
+        except sqlite3.Error as e:
+            self._disable_cache(e)
+
+    def _disable_cache(self, error: Exception):
+        """A broken or unwritable cache file must never break the calls themselves"""
+        if self.cache is not None:
+            print(f"⚠️ HTTP cache disabled ({self.cache.path}: {error})", file=sys.stderr)
+            self.cache = None
+
+    def _send(self, method: str, url: str, retry: Optional[bool], **kwargs):
+        if retry is None:
+            retry = method in IDEMPOTENT
+        session, limit = self._host(url)
+        stats = self._stats(endpoint_key(method, url))
+        attempt = 0
+        while True:
+            started = time.monotonic()
+            try:
+                with limit:
+                    resp = session.request(method, url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout):
+                will_retry = retry and method in IDEMPOTENT and attempt < self.max_retries
+                stats.record(time.monotonic() - started, error=True, retried=will_retry)
+                if not will_retry:
+                    raise
+                delay = self.backoff(attempt)
+            else:
+                retryable = resp.status_code == 429 or (resp.status_code in RETRY_STATUSES and method in IDEMPOTENT)
+                will_retry = retry and retryable and attempt < self.max_retries
+                stats.record(time.monotonic() - started, error=resp.status_code >= 400, retried=will_retry)
+                if not will_retry:
+                    return resp
+                delay = self.backoff(attempt, resp.headers.get("Retry-After"))
+                resp.close()
+            attempt += 1
+            time.sleep(delay)
+
+    def get(self, url: str, **kwargs):
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs):
+        return self.request("POST", url, **kwargs)
+
+    def connection_stats(self) -> Dict[str, Dict]:
+        """Per host: requests sent vs. TCP/TLS connections opened (from urllib3's pools)"""
+        result = {}
+        with self.lock:
+            sessions = dict(self.sessions)
+        for host, session in sessions.items():
+            opened = sent = 0
+            pools = session.get_adapter(f"https://{host}/").poolmanager.pools
+            for key in pools.keys():
+                pool = pools.get(key)
+                if pool is not None:
+                    opened += pool.num_connections
+                    sent += pool.num_requests
+            result[host] = {
+                "requests": sent,
+                "connections": opened,
+                "reuse_ratio": round(1 - opened / sent, 3) if sent else None,
+            }
+        return result
+
+    def report(self) -> Dict:
+        with self.lock:
+            endpoints = dict(self.stats)
+        return {
+            "endpoints": {key: stats.summary() for key, stats in sorted(endpoints.items())},
+            "hosts": self.connection_stats(),
+        }
+
+    def summary_line(self) -> str:
+        """One-line digest for cycle logs"""
+        report = self.report()
+        sent = sum(h["requests"] for h in report["hosts"].values())
+        opened = sum(h["connections"] for h in report["hosts"].values())
+        retries = sum(e["retries"] for e in report["endpoints"].values())
+        slowest = max((e["p95_ms"] or 0 for e in report["endpoints"].values()), default=0)
+        reuse = f"{100 * (1 - opened / sent):.0f}%" if sent else "n/a"
+        line = f"{sent} requests over {opened} connections (reuse {reuse}), {retries} retries, worst p95 {slowest} ms"
+        if self.cache is not None:
+            line += f", {self.cache.session_line()}"
+        return line
+
+    def close(self):
+        with self.lock:
+            for session in self.sessions.values():
+                session.close()
+            self.sessions.clear()
+        if self.cache is not None:
+            self.cache.close()
+
+
+_clients: Dict[Optional[str], HttpClient] = {}
+_client_lock = threading.Lock()
+
+
+def get_client(account: Optional[str] = None) -> HttpClient:
+    """
+    Process-wide client, so every script hosted in one process shares the pools.
+    Non-primary accounts (moneybot/accounts.py) get their own: separate pools,
+    per-host limits, backoff and stats, so one throttled identity doesn't hold
+    connections the others need. They all share the on-disk response cache.
+    """
+    with _client_lock:
+        client = _clients.get(account)
+        if client is None:
+            location = os.environ.get("MONEYBOT_HTTP_CACHE", DEFAULT_CACHE)
+            cache = None if location.lower() in ("", "0", "off", "false") else ResponseCache(location)
+            client = _clients[account] = HttpClient(cache=cache)
+        return client
+
+
+def all_clients() -> Dict[Optional[str], HttpClient]:
+    """Clients created so far, by account (None is the shared one)"""
+    with _client_lock:
+        return dict(_clients)
@@ -0,0 +1,331 @@
+#!/usr/bin/env python3
+"""
+HTTP Response Cache - on-disk GET cache shared by every script and process
+Entries are keyed by method + URL + auth scope, bodies are stored once per content
+hash, freshness comes from per-endpoint TTLs, stale entries are revalidated with
+ETag / Last-Modified, and the store is LRU-evicted to a size budget
+Author: Jarvis (jarvisauto001-coder)
+Repo: https://github.com/jarvisauto001-coder/moneybot-scripts
+
+Usage:
+    python3 -m moneybot.http_cache stats
+    python3 -m moneybot.http_cache list
+    python3 -m moneybot.http_cache clear
+"""
+
+import json
+import os
+import re
+import sys
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+from moneybot.config import WORKSPACE
+from moneybot.lazy import lazy_import
+
+# Loaded on the first cacheable GET, not when an entry point merely imports the client
+hashlib = lazy_import("hashlib")
+sqlite3 = lazy_import("sqlite3")
+
+DEFAULT_CACHE = os.path.join(WORKSPACE, ".http_cache.db")
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+
+# (URL regex, seconds fresh). First match wins; URLs matching nothing are not cached.
+# Short enough that the engager's 15 min cycle and the scanner's 30 min scan always
+# see new activity, long enough for the dashboard and overlapping runs to share reads.
+# Our own posts and their comment pages are never cached: the mentions tracker compares
+# a live comment_count against them and would drop comments a stale page didn't show.
+DEFAULT_TTLS = [
+    (r"moltbook\.com/api/v1/posts\?", 120),
+    (r"clawtasks\.com/api/bounties", 300),
+    (r"clawtasks\.com/api/proposals", 120),
+]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    method TEXT NOT NULL,
+    url TEXT NOT NULL,
+    scope TEXT NOT NULL,
+    status INTEGER NOT NULL,
+    headers TEXT NOT NULL,
+    body_hash TEXT NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    stored_at REAL NOT NULL,
+    expires_at REAL NOT NULL,
+    last_access REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_entries_access ON entries(last_access);
+CREATE INDEX IF NOT EXISTS idx_entries_body ON entries(body_hash);
+CREATE TABLE IF NOT EXISTS bodies (
+    hash TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    body BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS counters (
+    endpoint TEXT NOT NULL,
+    outcome TEXT NOT NULL,
+    n INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (endpoint, outcome)
+);
+"""
+
+# Outcomes counted per endpoint: served fresh, served after a 304, fetched
+OUTCOMES = ("hit", "revalidated", "miss")
+
+# Response headers worth keeping with the body
+KEPT_HEADERS = ("Content-Type", "ETag", "Last-Modified", "Date", "Cache-Control")
+
+
+def auth_scope(headers: Optional[Dict]) -> str:
+    """Short digest of the credentials a request carries (the key itself is never stored)"""
+    if not headers:
+        return "anon"
+    lowered = {k.lower(): v for k, v in headers.items()}
+    secret = "\n".join(str(lowered.get(h, "")) for h in ("authorization", "cookie", "x-api-key"))
+    if not secret.strip():
+        return "anon"
+    return hashlib.sha256(secret.encode()).hexdigest()[:16]
+
+
+def cache_key(method: str, url: str, scope: str) -> str:
+    return hashlib.sha256(f"{method.upper()} {url} {scope}".encode()).hexdigest()
+
+
+class ResponseCache:
+    """
+    SQLite (WAL) store safe for concurrent processes and threads. The connection
+    is opened on first use, so importing/constructing it costs nothing for
+    entry points that never make a GET.
+    """
+
+    def __init__(self, path: str = DEFAULT_CACHE, max_bytes: int = DEFAULT_MAX_BYTES,
+                 ttls: Optional[List[Tuple[str, int]]] = None):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.ttls = [(re.compile(pattern), seconds) for pattern, seconds in (ttls or DEFAULT_TTLS)]
+        self.conn = None
+        self.lock = threading.Lock()
+        self.session_counts = {outcome: 0 for outcome in OUTCOMES}  # this process only
+
+    def _db(self) -> "sqlite3.Connection":
+        if self.conn is None:
+            conn = sqlite3.connect(self.path, timeout=10, check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(SCHEMA)
+            conn.row_factory = sqlite3.Row
+            self.conn = conn
+        return self.conn
+
+    def ttl_for(self, url: str) -> int:
+        for pattern, seconds in self.ttls:
+            if pattern.search(url):
+                return seconds
+        return 0
+
+    # --- lookups ---
+
+    def lookup(self, key: str) -> Optional[Dict]:
+        """Entry (with its body) or None; `fresh` says whether it can be served as-is"""
+        with self.lock:
+            row = self._db().execute(
+                """SELECT e.status, e.headers, e.etag, e.last_modified, e.expires_at, b.body
+                   FROM entries e JOIN bodies b ON b.hash = e.body_hash WHERE e.key = ?""",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            now = time.time()
+            self.conn.execute("UPDATE entries SET last_access = ? WHERE key = ?", (now, key))
+        return {
+            "status": row["status"],
+            "headers": json.loads(row["headers"]),
+            "etag": row["etag"],
+            "last_modified": row["last_modified"],
+            "body": bytes(row["body"]),
+            "fresh": row["expires_at"] > now,
+        }
+
+    def conditional_headers(self, entry: Dict) -> Dict[str, str]:
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    # --- writes ---
+
+    def store(self, key: str, method: str, url: str, scope: str, status: int,
+              headers: Dict[str, str], body: bytes, ttl: int):
+        kept = {name: headers[name] for name in KEPT_HEADERS if headers.get(name) is not None}
+        body_hash = hashlib.sha256(body).hexdigest()
+        now = time.time()
+        with self.lock:
+            db = self._db()
+            db.execute("BEGIN IMMEDIATE")
+            try:
+                db.execute("INSERT OR IGNORE INTO bodies (hash, size, body) VALUES (?, ?, ?)",
+                           (body_hash, len(body), sqlite3.Binary(body)))
+                old = db.execute("SELECT body_hash FROM entries WHERE key = ?", (key,)).fetchone()
+                db.execute(
+                    """INSERT OR REPLACE INTO entries
+                       (key, method, url, scope, status, headers, body_hash, etag, last_modified,
+                        stored_at, expires_at, last_access)
+                       VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                    (key, method.upper(), url, scope, status, json.dumps(kept), body_hash,
+                     kept.get("ETag"), kept.get("Last-Modified"), now, now + ttl, now),
+                )
+                if old and old["body_hash"] != body_hash:
+                    self._drop_orphan(old["body_hash"])
+                self._evict()
+                db.execute("COMMIT")
+            except BaseException:
+                db.execute("ROLLBACK")
+                raise
+
+    def refresh(self, key: str, ttl: int):
+        """A 304 confirmed the stored body: extend its freshness"""
+        now = time.time()
+        with self.lock:
+            self._db().execute("UPDATE entries SET expires_at = ?, last_access = ? WHERE key = ?",
+                               (now + ttl, now, key))
+
+    def _drop_orphan(self, body_hash: str):
+        if self.conn.execute("SELECT 1 FROM entries WHERE body_hash = ? LIMIT 1", (body_hash,)).fetchone() is None:
+            self.conn.execute("DELETE FROM bodies WHERE hash = ?", (body_hash,))
+
+    def _evict(self) -> int:
+        """Drop least recently used entries until the bodies fit in max_bytes"""
+        total = self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM bodies").fetchone()[0]
+        evicted = 0
+        if total <= self.max_bytes:
+            return 0
+        rows = self.conn.execute(
+            "SELECT e.key, e.body_hash, b.size FROM entries e JOIN bodies b ON b.hash = e.body_hash "
+            "ORDER BY e.last_access"
+        ).fetchall()
+        for row in rows:
+            if total <= self.max_bytes:
+                break
+            self.conn.execute("DELETE FROM entries WHERE key = ?", (row["key"],))
+            if self.conn.execute("SELECT 1 FROM entries WHERE body_hash = ? LIMIT 1",
+                                 (row["body_hash"],)).fetchone() is None:
+                self.conn.execute("DELETE FROM bodies WHERE hash = ?", (row["body_hash"],))
+                total -= row["size"]
+            evicted += 1
+        return evicted
+
+    def count(self, endpoint: str, outcome: str):
+        with self.lock:
+            self.session_counts[outcome] += 1
+            try:
+                self._db().execute(
+                    "INSERT INTO counters (endpoint, outcome, n) VALUES (?, ?, 1) "
+                    "ON CONFLICT(endpoint, outcome) DO UPDATE SET n = n + 1",
+                    (endpoint, outcome),
+                )
+            except sqlite3.OperationalError:
+                pass  # Counters are best-effort; never fail a request over them
+
+    def clear(self):
+        with self.lock:
+            db = self._db()
+            for table in ("entries", "bodies", "counters"):
+                db.execute(f"DELETE FROM {table}")
+            db.execute("VACUUM")
+
+    # --- reporting ---
+
+    def counters(self) -> Dict[str, Dict[str, int]]:
+        """All-time outcomes per endpoint, across every process using this file"""
+        result: Dict[str, Dict[str, int]] = {}
+        with self.lock:
+            rows = self._db().execute("SELECT endpoint, outcome, n FROM counters").fetchall()
+        for row in rows:
+            result.setdefault(row["endpoint"], {o: 0 for o in OUTCOMES})[row["outcome"]] = row["n"]
+        return result
+
+    def usage(self) -> Dict:
+        with self.lock:
+            db = self._db()
+            entries = db.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+            bodies, size = db.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM bodies").fetchone()
+        return {"entries": entries, "bodies": bodies, "bytes": size, "max_bytes": self.max_bytes}
+
+    def session_line(self) -> str:
+        """Hit ratio of this process's cacheable GETs, for cycle logs"""
+        served = self.session_counts["hit"] + self.session_counts["revalidated"]
+        total = served + self.session_counts["miss"]
+        if not total:
+            return "cache unused"
+        return (f"cache {served}/{total} served locally ({100 * served / total:.0f}%, "
+                f"{self.session_counts['revalidated']} revalidated)")
+
+    def close(self):
+        with self.lock:
+            if self.conn is not None:
+                self.conn.close()
+                self.conn = None
+
+
+def hit_ratio(counts: Dict[str, int]) -> Optional[float]:
+    served = counts.get("hit", 0) + counts.get("revalidated", 0)
+    total = served + counts.get("miss", 0)
+    return round(served / total, 3) if total else None
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Inspect the shared HTTP response cache")
+    parser.add_argument("--db", default=DEFAULT_CACHE)
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("stats", help="Hit ratio per endpoint and cache size")
+    sub.add_parser("list", help="Stored entries, most recently used first")
+    sub.add_parser("clear", help="Drop every entry and counter")
+    args = parser.parse_args(argv)
+
+    if args.command != "clear" and not os.path.exists(args.db):
+        print(f"No HTTP cache at {args.db} yet")
+        return 1
+    cache = ResponseCache(args.db)
+    if args.command == "clear":
+        cache.clear()
+        print(f"🧹 Cleared {args.db}")
+        return 0
+
+    if args.command == "stats":
+        usage = cache.usage()
+        print(f"{usage['entries']} entries, {usage['bodies']} bodies, "
+              f"{usage['bytes'] / 1024:.1f} / {usage['max_bytes'] / 1024:.0f} KiB")
+        totals = {o: 0 for o in OUTCOMES}
+        print(f"{'endpoint':<60}{'hit':>7}{'304':>7}{'miss':>7}{'ratio':>8}")
+        for endpoint, counts in sorted(cache.counters().items()):
+            for outcome in OUTCOMES:
+                totals[outcome] += counts[outcome]
+            ratio = hit_ratio(counts)
+            print(f"{endpoint:<60}{counts['hit']:>7}{counts['revalidated']:>7}{counts['miss']:>7}"
+                  f"{'' if ratio is None else f'{ratio:.0%}':>8}")
+        ratio = hit_ratio(totals)
+        print(f"{'total':<60}{totals['hit']:>7}{totals['revalidated']:>7}{totals['miss']:>7}"
+              f"{'' if ratio is None else f'{ratio:.0%}':>8}")
+        return 0
+
+    now = time.time()
+    rows = cache._db().execute(
+        "SELECT e.url, e.scope, e.status, e.expires_at, e.last_access, b.size "
+        "FROM entries e JOIN bodies b ON b.hash = e.body_hash ORDER BY e.last_access DESC"
+    )
+    for row in rows:
+        left = row["expires_at"] - now
+        state = f"fresh {left:.0f}s" if left > 0 else "stale"
+        print(f"{row['status']}  {row['size']:>8}B  {state:<11} scope={row['scope']}  {row['url']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,454 @@
+#!/usr/bin/env python3
+"""
+Log Store - buffered structured JSON logs with rotation, gzip archives and a sidecar index
+Each component (guardian, engager, scanner, supervisor) appends JSON records to
+logs/<component>.jsonl through an in-memory buffer flushed every few seconds and
+at exit. Past max_bytes the file is archived as independent gzip blocks, and every
+block's time range and level counts go to <component>.index.jsonl, so a query only
+decompresses the blocks that can match.
+Author: Jarvis (jarvisauto001-coder)
+Repo: https://github.com/jarvisauto001-coder/moneybot-scripts
+
+Usage:
+    python3 -m moneybot.logstore query --since 7d --level WARN
+    python3 -m moneybot.logstore query --component scanner --since 2026-10-01 --until 2026-10-08 --grep bounty
+    python3 -m moneybot.logstore tail guardian -n 50
+    python3 -m moneybot.logstore stats
+"""
+
+import atexit
+import fcntl
+import glob
+import json
+import os
+import re
+import sys
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Dict, Iterator, List, Optional
+
+from moneybot.config import WORKSPACE
+from moneybot.lazy import lazy_import
+
+gzip = lazy_import("gzip")  # only rotation and queries touch archives
+
+DEFAULT_LOG_DIR = os.path.join(WORKSPACE, "logs")
+MAX_BYTES = 5 * 1024 * 1024   # active file size that triggers rotation
+KEEP_ARCHIVES = 40            # per component
+BLOCK_BYTES = 256 * 1024      # uncompressed records per gzip block
+FLUSH_INTERVAL = 2.0          # seconds between background flushes
+BUFFER_RECORDS = 200          # flush early when this many records are pending
+
+LEVELS = {"DEBUG": 10, "INFO": 20, "SUCCESS": 25, "WARN": 30, "ERROR": 40, "ALERT": 50}
+
+
+def normalize_level(level: str) -> str:
+    """Bare level name ("🚨 ALERT" -> "ALERT"); ValueError for a level not in LEVELS"""
+    name = re.sub(r"^[^A-Za-z]+", "", level or "").strip().upper()
+    if name not in LEVELS:
+        raise ValueError(f"unknown log level {level!r} (known: {', '.join(LEVELS)})")
+    return name
+
+
+def _rank(level: Optional[str]) -> int:
+    """Rank of a stored level; records written before levels were normalized count by their bare name"""
+    try:
+        return LEVELS[normalize_level(level or "INFO")]
+    except ValueError:
+        return LEVELS["INFO"]
+
+
+def level_for(message: str) -> str:
+    """Level for the emoji-prefixed messages the scripts have always written"""
+    if message.startswith(("❌", "🚨")):
+        return "ERROR"
+    if message.startswith("⚠️"):
+        return "WARN"
+    return "INFO"
+
+
+def format_record(record: Dict, component: bool = True) -> str:
+    stamp = datetime.utcfromtimestamp(record["ts"]).strftime("%Y-%m-%d %H:%M:%S")
+    prefix = f"[{stamp}] [{record.get('component', '?')}] " if component else f"[{stamp}] "
+    return f"{prefix}[{record.get('level', 'INFO')}] {record.get('msg', '')}"
+
+
+class LogWriter:
+    """One component's log: console echo plus buffered JSON records"""
+
+    def __init__(self, component: str, log_dir: str = DEFAULT_LOG_DIR, show_level: bool = False,
+                 max_bytes: int = MAX_BYTES, keep: int = KEEP_ARCHIVES):
+        self.component = component
+        self.log_dir = log_dir
+        self.path = os.path.join(log_dir, f"{component}.jsonl")
+        self.index_path = os.path.join(log_dir, f"{component}.index.jsonl")
+        self.lock_path = os.path.join(log_dir, f".{component}.lock")
+        self.show_level = show_level
+        self.max_bytes = max_bytes
+        self.keep = keep
+        self.buffer: List[str] = []
+        self.lock = threading.Lock()
+        self.file = None
+
+    def log(self, message: str, level: Optional[str] = None, **fields):
+        now = time.time()
+        level = normalize_level(level) if level else level_for(message)
+        stamp = datetime.utcfromtimestamp(now).strftime("%Y-%m-%d %H:%M:%S")
+        print(f"[{stamp}] [{level}] {message}" if self.show_level else f"[{stamp}] {message}")
+        record = {"ts": round(now, 3), "level": level, "component": self.component, "msg": message}
+        record.update(fields)
+        line = json.dumps(record, ensure_ascii=False) + "\n"
+        with self.lock:
+            self.buffer.append(line)
+            pending = len(self.buffer)
+        if pending >= BUFFER_RECORDS or LEVELS[level] >= LEVELS["ERROR"]:
+            self.flush()
+        else:
+            _ensure_flusher()
+
+    # --- writing ---
+
+    def _open(self):
+        if self.file is not None:
+            try:
+                if os.fstat(self.file.fileno()).st_ino == os.stat(self.path).st_ino:
+                    return self.file
+            except FileNotFoundError:
+                pass
+            self.file.close()  # another process rotated the file under us
+        os.makedirs(self.log_dir, exist_ok=True)
+        self.file = open(self.path, 'a', encoding='utf-8')
+        return self.file
+
+    def flush(self):
+        with self.lock:
+            if not self.buffer:
+                return
+            lines, self.buffer = self.buffer, []
+            try:
+                os.makedirs(self.log_dir, exist_ok=True)
+                with open(self.lock_path, 'a') as lock:
+                    # Shared: writers don't block each other, only a rotation
+                    fcntl.flock(lock, fcntl.LOCK_SH)
+                    f = self._open()
+                    f.write("".join(lines))
+                    f.flush()
+                    size = f.tell()
+            except OSError as e:
+                print(f"⚠️ {self.component} log write failed: {e}", file=sys.stderr)
+                return
+        if size > self.max_bytes:
+            self.rotate()
+
+    def rotate(self):
+        """Archive the active file as gzip blocks and index them"""
+        with open(self.lock_path, 'a') as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                if os.path.getsize(self.path) <= self.max_bytes:
+                    return  # another process rotated first
+            except FileNotFoundError:
+                return
+            name = f"{self.component}.{datetime.utcnow().strftime('%Y%m%dT%H%M%S.%f')}.{os.getpid()}.jsonl.gz"
+            archive = os.path.join(self.log_dir, name)
+            staged = self.path + ".rotating"
+            os.replace(self.path, staged)
+            entries = []
+            with open(staged, 'r', encoding='utf-8', errors='replace') as src, open(archive, 'wb') as dst:
+                for block in _blocks(src):
+                    data = gzip.compress("".join(line for line, _ in block).encode('utf-8'))
+                    levels: Dict[str, int] = {}
+                    for _, record in block:
+                        levels[record.get("level", "INFO")] = levels.get(record.get("level", "INFO"), 0) + 1
+                    stamps = [record["ts"] for _, record in block if "ts" in record]
+                    entries.append({
+                        "archive": name,
+                        "offset": dst.tell(),
+                        "length": len(data),
+                        "first": min(stamps) if stamps else 0,
+                        "last": max(stamps) if stamps else 0,
+                        "count": len(block),
+                        "levels": levels,
+                    })
+                    dst.write(data)
+            with open(self.index_path, 'a') as index:
+                index.writelines(json.dumps(entry) + "\n" for entry in entries)
+            os.remove(staged)
+            self._prune()
+
+    def _prune(self):
+        archives = sorted(glob.glob(os.path.join(self.log_dir, f"{self.component}.*.jsonl.gz")))
+        stale = archives[:-self.keep] if self.keep else []
+        if not stale:
+            return
+        dropped = {os.path.basename(path) for path in stale}
+        for path in stale:
+            os.remove(path)
+        kept = [entry for entry in read_index(self.index_path) if entry["archive"] not in dropped]
+        tmp = self.index_path + ".tmp"
+        with open(tmp, 'w') as f:
+            f.writelines(json.dumps(entry) + "\n" for entry in kept)
+        os.replace(tmp, self.index_path)
+
+    def close(self):
+        self.flush()
+        with self.lock:
+            if self.file is not None:
+                self.file.close()
+                self.file = None
+
+
+def _blocks(lines) -> Iterator[List]:
+    """Group raw lines into ~BLOCK_BYTES chunks, parsed for the index"""
+    block, size = [], 0
+    for line in lines:
+        if not line.strip():
+            continue
+        if not line.endswith("\n"):
+            line += "\n"
+        try:
+            record = json.loads(line)
+        except ValueError:
+            record = {}
+        block.append((line, record))
+        size += len(line)
+        if size >= BLOCK_BYTES:
+            yield block
+            block, size = [], 0
+    if block:
+        yield block
+
+
+# --- process-wide registry, background flusher, flush at exit ---
+
+_writers: Dict[str, LogWriter] = {}
+_registry_lock = threading.Lock()
+_flusher = None
+
+
+def get_logger(component: str, **kwargs) -> LogWriter:
+    """The writer for `component` (one per process, shared by the supervisor's jobs)"""
+    with _registry_lock:
+        writer = _writers.get(component)
+        if writer is None:
+            writer = _writers[component] = LogWriter(component, **kwargs)
+        return writer
+
+
+def flush_all():
+    with _registry_lock:
+        writers = list(_writers.values())
+    for writer in writers:
+        writer.flush()
+
+
+def _flush_loop():
+    while True:
+        time.sleep(FLUSH_INTERVAL)
+        flush_all()
+
+
+def _ensure_flusher():
+    global _flusher
+    if _flusher is None:
+        with _registry_lock:
+            if _flusher is None:
+                _flusher = threading.Thread(target=_flush_loop, name="log-flush", daemon=True)
+                _flusher.start()
+
+
+atexit.register(flush_all)
+
+
+# --- reading ---
+
+def read_index(path: str) -> List[Dict]:
+    entries = []
+    try:
+        with open(path, 'r') as f:
+            for line in f:
+                try:
+                    entries.append(json.loads(line))
+                except ValueError:
+                    continue
+    except FileNotFoundError:
+        pass
+    return entries
+
+
+def components(log_dir: str = DEFAULT_LOG_DIR) -> List[str]:
+    names = set()
+    for path in glob.glob(os.path.join(log_dir, "*.jsonl")) + glob.glob(os.path.join(log_dir, "*.index.jsonl")):
+        base = os.path.basename(path)
+        names.add(base[:-len(".index.jsonl")] if base.endswith(".index.jsonl") else base[:-len(".jsonl")])
+    return sorted(names)
+
+
+def query(log_dir: str = DEFAULT_LOG_DIR, component: Optional[str] = None, since: Optional[float] = None,
+          until: Optional[float] = None, level: Optional[str] = None, pattern: Optional[str] = None,
+          stats: Optional[Dict] = None) -> Iterator[Dict]:
+    """Matching records, oldest first per component; archives are read block by block"""
+    min_rank = LEVELS[normalize_level(level)] if level else 0
+    regex = re.compile(pattern, re.IGNORECASE) if pattern else None
+    stats = stats if stats is not None else {}
+    stats.setdefault("blocks_read", 0)
+    stats.setdefault("blocks_skipped", 0)
+
+    def wanted(record):
+        ts = record.get("ts", 0)
+        if since is not None and ts < since:
+            return False
+        if until is not None and ts > until:
+            return False
+        if _rank(record.get("level")) < min_rank:
+            return False
+        return not regex or bool(regex.search(record.get("msg", "")))
+
+    for name in ([component] if component else components(log_dir)):
+        for entry in read_index(os.path.join(log_dir, f"{name}.index.jsonl")):
+            if ((since is not None and entry["last"] < since) or (until is not None and entry["first"] > until)
+                    or not any(_rank(lvl) >= min_rank for lvl in entry["levels"])):
+                stats["blocks_skipped"] += 1
+                continue
+            try:
+                with open(os.path.join(log_dir, entry["archive"]), 'rb') as f:
+                    f.seek(entry["offset"])
+                    data = gzip.decompress(f.read(entry["length"]))
+            except (OSError, EOFError):
+                continue  # pruned or damaged archive
+            stats["blocks_read"] += 1
+            for line in data.decode('utf-8', errors='replace').splitlines():
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                if wanted(record):
+                    yield record
+        try:
+            with open(os.path.join(log_dir, f"{name}.jsonl"), 'r', encoding='utf-8', errors='replace') as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        continue
+                    if wanted(record):
+                        yield record
+        except FileNotFoundError:
+            pass
+
+
+def _parse_lines(lines) -> List[Dict]:
+    records = []
+    for line in lines:
+        try:
+            records.append(json.loads(line))
+        except ValueError:
+            continue
+    return records
+
+
+def tail(log_dir: str = DEFAULT_LOG_DIR, component: str = "", n: int = 20) -> List[Dict]:
+    """Last n records of one component, reading the active file and then archive blocks newest first"""
+    records: List[Dict] = []
+    try:
+        with open(os.path.join(log_dir, f"{component}.jsonl"), 'rb') as f:
+            end = position = f.seek(0, os.SEEK_END)
+            data = b""
+            while position > 0 and data.count(b"\n") <= n:
+                position = max(0, position - 64 * 1024)
+                f.seek(position)
+                data = f.read(end - position)
+        lines = data.decode('utf-8', errors='replace').splitlines()
+        if position > 0:
+            lines = lines[1:]  # the first line may be cut in half
+        records = _parse_lines(lines[-n:])
+    except FileNotFoundError:
+        pass
+    for entry in reversed(read_index(os.path.join(log_dir, f"{component}.index.jsonl"))):
+        if len(records) >= n:
+            break
+        try:
+            with open(os.path.join(log_dir, entry["archive"]), 'rb') as f:
+                f.seek(entry["offset"])
+                block = gzip.decompress(f.read(entry["length"]))
+        except (OSError, EOFError):
+            continue
+        records = _parse_lines(block.decode('utf-8', errors='replace').splitlines()) + records
+    return records[-n:] if n > 0 else []
+
+
+def parse_when(value: Optional[str]) -> Optional[float]:
+    """'7d' / '12h' / '30m' ago, or an ISO date/time (UTC)"""
+    if not value:
+        return None
+    match = re.fullmatch(r"(\d+(?:\.\d+)?)([smhdw])", value.strip())
+    if match:
+        unit = {"s": 1, "m": 60, "h": 3600, "d": 86400, "w": 604800}[match.group(2)]
+        return time.time() - float(match.group(1)) * unit
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is None:
+        return (parsed - datetime(1970, 1, 1)) / timedelta(seconds=1)
+    return parsed.timestamp()
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Query the structured MoneyBot logs")
+    parser.add_argument("--dir", default=DEFAULT_LOG_DIR)
+    sub = parser.add_subparsers(dest="command", required=True)
+    q = sub.add_parser("query", help="Filter records by time, level, component and text")
+    q.add_argument("--component", "-c", default=None)
+    q.add_argument("--since", default=None, help="e.g. 7d, 12h, 2026-10-01")
+    q.add_argument("--until", default=None)
+    q.add_argument("--level", "-l", default=None, help="Minimum level (INFO, WARN, ERROR...)")
+    q.add_argument("--grep", default=None, help="Regex on the message")
+    q.add_argument("--limit", "-n", type=int, default=None, help="Only the last N matches")
+    q.add_argument("--json", action="store_true", help="Print raw JSON records")
+    t = sub.add_parser("tail", help="Last records of one component")
+    t.add_argument("component")
+    t.add_argument("-n", type=int, default=20)
+    sub.add_parser("stats", help="Active file size, archives and indexed blocks per component")
+    args = parser.parse_args(argv)
+
+    if args.command == "stats":
+        for name in components(args.dir):
+            entries = read_index(os.path.join(args.dir, f"{name}.index.jsonl"))
+            archives = {entry["archive"] for entry in entries}
+            try:
+                active = os.path.getsize(os.path.join(args.dir, f"{name}.jsonl"))
+            except OSError:
+                active = 0
+            records = sum(entry["count"] for entry in entries)
+            oldest = min((entry["first"] for entry in entries), default=None)
+            since = datetime.utcfromtimestamp(oldest).strftime("%Y-%m-%d") if oldest else "-"
+            print(f"{name:<12} active {active / 1024:>8.1f} KiB   {len(archives):>3} archives   "
+                  f"{len(entries):>5} blocks   {records:>8} archived records since {since}")
+        return 0
+
+    if args.command == "tail":
+        for record in tail(args.dir, args.component, args.n):
+            print(format_record(record, component=False))
+        return 0
+
+    if args.level:
+        try:
+            normalize_level(args.level)
+        except ValueError as e:
+            parser.error(str(e))
+    read_stats: Dict = {}
+    records = sorted(query(args.dir, component=args.component, since=parse_when(args.since),
+                           until=parse_when(args.until), level=args.level, pattern=args.grep,
+                           stats=read_stats), key=lambda r: r.get("ts", 0))
+    if args.limit:
+        records = records[-args.limit:]
+    for record in records:
+        print(json.dumps(record, ensure_ascii=False) if args.json else format_record(record))
+    print(f"-- {len(records)} records ({read_stats['blocks_read']} archive blocks read, "
+          f"{read_stats['blocks_skipped']} skipped by the index)", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+"""
+Mail Leases - shared work table so several guardian workers can split one inbox
+A worker claims unread messages by UID for a short lease, heartbeats while it works,
+and marks each one done; leases left by a crashed worker expire and are claimed by
+another. Before a reply goes out the lease is switched to "replying", which is
+never handed out again, so a message is answered at most once even if its worker
+dies mid-send (those show up as in doubt for manual review).
+Author: Jarvis (jarvisauto001-coder)
+Repo: https://github.com/jarvisauto001-coder/moneybot-scripts
+
+Usage:
+    python3 -m moneybot.mail_leases status
+    python3 -m moneybot.mail_leases doubt             # replies that may or may not have gone out
+    python3 -m moneybot.mail_leases resolve MAILBOX UID   # after checking the Sent folder
+    python3 -m moneybot.mail_leases release WORKER    # hand a stopped worker's leases back now
+
+Workers on other hosts can share the table by pointing MONEYBOT_LEASE_DB at a
+file on the shared filesystem. It uses SQLite's rollback journal rather than WAL,
+whose shared-memory index only works between processes on one host.
+"""
+
+import os
+import sys
+import threading
+import time
+from typing import Dict, Iterable, List, Optional
+
+from moneybot.config import WORKSPACE
+from moneybot.lazy import lazy_import
+
+sqlite3 = lazy_import("sqlite3")  # start-up and the classifier never open the table
+
+DEFAULT_LEASE_DB = os.environ.get("MONEYBOT_LEASE_DB") or os.path.join(WORKSPACE, ".guardian_leases.db")
+LEASE_SECONDS = 120  # a worker that stops heartbeating loses its claims after this
+KEEP_DONE_DAYS = 30  # finished rows kept this long (they stop re-processing of re-flagged mail)
+PRUNE_EVERY = 86400  # guardians prune at most this often, whichever worker gets there first
+
+# leased -> (replying ->) done; an expired "leased" row can be claimed again,
+# an expired "replying" row is in doubt and is left for a human
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS leases (
+    mailbox TEXT NOT NULL,
+    uid TEXT NOT NULL,
+    state TEXT NOT NULL,
+    owner TEXT,
+    expires_at REAL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    result TEXT,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (mailbox, uid)
+);
+CREATE INDEX IF NOT EXISTS idx_leases_owner ON leases(owner, state);
+CREATE TABLE IF NOT EXISTS lease_meta (key TEXT PRIMARY KEY, value REAL NOT NULL);
+"""
+
+
+def worker_id(index: int = 0) -> str:
+    """host:pid:index - unique per worker thread, readable in `status`"""
+    import socket
+    return f"{socket.gethostname()}:{os.getpid()}:{index}"
+
+
+def _delete_done(conn, now: float, days: float) -> int:
+    return conn.execute("DELETE FROM leases WHERE state = 'done' AND updated_at < ?", (now - days * 86400,)).rowcount
+
+
+class LeaseTable:
+    """Claim / heartbeat / complete over one SQLite table shared by every worker"""
+
+    def __init__(self, path: str = DEFAULT_LEASE_DB, lease_seconds: float = LEASE_SECONDS):
+        self.path = path
+        self.lease_seconds = lease_seconds
+        self.conn = None
+        self.lock = threading.Lock()  # one connection, shared by this process's worker threads
+
+    def _db(self):
+        if self.conn is None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            # isolation_level=None: transactions are explicit BEGIN IMMEDIATE below
+            self.conn = sqlite3.connect(self.path, timeout=30, isolation_level=None, check_same_thread=False)
+            self.conn.execute("PRAGMA journal_mode=DELETE")
+            self.conn.executescript(SCHEMA)
+        return self.conn
+
+    def _write(self, fn):
+        """fn(conn, now) inside one write transaction (the lock other workers queue on)"""
+        with self.lock:
+            conn = self._db()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                result = fn(conn, time.time())
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+            return result
+
+    def claim(self, mailbox: str, uids: Iterable[str], owner: str, limit: int) -> List[str]:
+        """Up to `limit` of uids that nobody holds and nobody finished, now leased to owner"""
+        uids = [str(uid) for uid in uids]
+
+        def take(conn, now):
+            claimed = []
+            for start in range(0, len(uids), 500):
+                chunk = uids[start:start + 500]
+                marks = ",".join("?" * len(chunk))
+                rows = dict(conn.execute(
+                    f"SELECT uid, state = 'leased' AND expires_at < ? FROM leases WHERE mailbox = ? AND uid IN ({marks})",
+                    [now, mailbox] + chunk).fetchall())
+                for uid in chunk:
+                    if len(claimed) >= limit:
+                        return claimed
+                    if uid not in rows:
+                        conn.execute(
+                            "INSERT INTO leases (mailbox, uid, state, owner, expires_at, attempts, updated_at) "
+                            "VALUES (?, ?, 'leased', ?, ?, 1, ?)",
+                            (mailbox, uid, owner, now + self.lease_seconds, now))
+                    elif rows[uid]:
+                        # Previous holder stopped heartbeating before finishing
+                        conn.execute(
+                            "UPDATE leases SET owner = ?, expires_at = ?, attempts = attempts + 1, updated_at = ? "
+                            "WHERE mailbox = ? AND uid = ?",
+                            (owner, now + self.lease_seconds, now, mailbox, uid))
+                    else:
+                        continue
+                    claimed.append(uid)
+            return claimed
+        return self._write(take)
+
+    def heartbeat(self, owner: str) -> int:
+        """Extend every unexpired lease owner still holds; returns how many"""
+        return self._write(lambda conn, now: conn.execute(
+            "UPDATE leases SET expires_at = ?, updated_at = ? "
+            "WHERE owner = ? AND state IN ('leased', 'replying') AND expires_at >= ?",
+            (now + self.lease_seconds, now, owner, now)).rowcount)
+
+    def begin_reply(self, mailbox: str, uid: str, owner: str) -> bool:
+        """True if owner still holds the lease; from here on it is never claimed again"""
+        return self._write(lambda conn, now: conn.execute(
+            "UPDATE leases SET state = 'replying', expires_at = ?, updated_at = ? "
+            "WHERE mailbox = ? AND uid = ? AND owner = ? AND state = 'leased' AND expires_at >= ?",
+            (now + self.lease_seconds, now, mailbox, str(uid), owner, now)).rowcount == 1)
+
+    def complete(self, mailbox: str, uid: str, owner: str, result: str = "") -> bool:
+        """Mark done; False if the lease had already expired and passed to another worker"""
+        return self._write(lambda conn, now: conn.execute(
+            "UPDATE leases SET state = 'done', expires_at = NULL, result = ?, updated_at = ? "
+            "WHERE mailbox = ? AND uid = ? AND owner = ? AND state IN ('leased', 'replying')",
+            (result, now, mailbox, str(uid), owner)).rowcount == 1)
+
+    def release(self, owner: str, mailbox: Optional[str] = None) -> int:
+        """Give back owner's unfinished claims (clean shutdown, or a stopped worker)"""
+        sql = "DELETE FROM leases WHERE owner = ? AND state = 'leased'"
+        params = [owner]
+        if mailbox is not None:
+            sql += " AND mailbox = ?"
+            params.append(mailbox)
+        return self._write(lambda conn, now: conn.execute(sql, params).rowcount)
+
+    def resolve(self, mailbox: str, uid: str) -> bool:
+        """Close an in-doubt reply once someone has checked the Sent folder"""
+        return self._write(lambda conn, now: conn.execute(
+            "UPDATE leases SET state = 'done', expires_at = NULL, result = 'resolved by hand', updated_at = ? "
+            "WHERE mailbox = ? AND uid = ? AND state = 'replying'", (now, mailbox, str(uid))).rowcount == 1)
+
+    def prune(self, days: float = KEEP_DONE_DAYS) -> int:
+        return self._write(lambda conn, now: _delete_done(conn, now, days))
+
+    def prune_if_due(self, days: float = KEEP_DONE_DAYS, every: float = PRUNE_EVERY) -> Optional[int]:
+        """prune() unless any worker sharing the table already did within `every` seconds (None then)"""
+        def prune(conn, now):
+            row = conn.execute("SELECT value FROM lease_meta WHERE key = 'pruned_at'").fetchone()
+            if row is not None and now - row[0] < every:
+                return None
+            conn.execute("INSERT OR REPLACE INTO lease_meta VALUES ('pruned_at', ?)", (now,))
+            return _delete_done(conn, now, days)
+        return self._write(prune)
+
+    def reset(self, mailbox: str) -> int:
+        """Forget every row for mailbox (benchmarks re-serve the same messages)"""
+        return self._write(lambda conn, now: conn.execute(
+            "DELETE FROM leases WHERE mailbox = ?", (mailbox,)).rowcount)
+
+    def counts(self, mailbox: Optional[str] = None) -> Dict[str, int]:
+        """done / held / in_doubt / expired (claimable again)"""
+        sql = ("SELECT SUM(state = 'done'), SUM(state != 'done' AND expires_at >= ?), "
+               "SUM(state = 'replying' AND expires_at < ?), SUM(state = 'leased' AND expires_at < ?) FROM leases")
+        now = time.time()
+        params: list = [now, now, now]
+        if mailbox is not None:
+            sql += " WHERE mailbox = ?"
+            params.append(mailbox)
+        with self.lock:
+            row = self._db().execute(sql, params).fetchone()
+        return dict(zip(("done", "held", "in_doubt", "expired"), (value or 0 for value in row)))
+
+    def rows(self, state: Optional[str] = None, in_doubt: bool = False, limit: int = 50) -> List[Dict]:
+        sql = "SELECT mailbox, uid, state, owner, expires_at, attempts, result, updated_at FROM leases"
+        params: list = []
+        if in_doubt:
+            sql += " WHERE state = 'replying' AND expires_at < ?"
+            params.append(time.time())
+        elif state:
+            sql += " WHERE state = ?"
+            params.append(state)
+        sql += " ORDER BY updated_at DESC LIMIT ?"
+        params.append(limit)
+        with self.lock:
+            cursor = self._db().execute(sql, params)
+            names = [column[0] for column in cursor.description]
+            return [dict(zip(names, row)) for row in cursor.fetchall()]
+
+    def owners(self) -> Dict[str, int]:
+        """Workers currently holding live leases, with how many each"""
+        with self.lock:
+            rows = self._db().execute(
+                "SELECT owner, COUNT(*) FROM leases WHERE state != 'done' AND expires_at >= ? GROUP BY owner",
+                (time.time(),)).fetchall()
+        return dict(rows)
+
+    def close(self):
+        with self.lock:
+            if self.conn is not None:
+                self.conn.close()
+                self.conn = None
+
+
+def main(argv=None):
+    import argparse
+    from datetime import datetime
+
+    parser = argparse.ArgumentParser(description="Inspect the guardian workers' shared lease table")
+    parser.add_argument("--db", default=DEFAULT_LEASE_DB)
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("status", help="Counts per mailbox and live workers")
+    doubt = sub.add_parser("doubt", help="Replies whose worker died between claiming and finishing the send")
+    doubt.add_argument("-n", type=int, default=50)
+    resolve = sub.add_parser("resolve", help="Close an in-doubt reply after checking the Sent folder")
+    resolve.add_argument("mailbox")
+    resolve.add_argument("uid")
+    release = sub.add_parser("release", help="Hand a stopped worker's unfinished claims back")
+    release.add_argument("owner", help="host:pid:index as shown by status")
+    prune = sub.add_parser("prune", help="Drop finished rows older than --days")
+    prune.add_argument("--days", type=float, default=KEEP_DONE_DAYS)
+    args = parser.parse_args(argv)
+
+    if not os.path.exists(args.db):
+        print(f"No lease table at {args.db} yet (run the guardian first)")
+        return 1
+    table = LeaseTable(args.db)
+    if args.command == "status":
+        with table.lock:
+            mailboxes = [row[0] for row in table._db().execute("SELECT DISTINCT mailbox FROM leases ORDER BY 1")]
+        print(f"{'mailbox':<40}{'done':>8}{'held':>6}{'expired':>9}{'in doubt':>10}")
+        for mailbox in mailboxes:
+            counts = table.counts(mailbox)
+            print(f"{mailbox:<40}{counts['done']:>8}{counts['held']:>6}{counts['expired']:>9}{counts['in_doubt']:>10}")
+        for owner, held in sorted(table.owners().items()):
+            print(f"👷 {owner}: {held} live lease(s)")
+    elif args.command == "doubt":
+        rows = table.rows(in_doubt=True, limit=args.n)
+        for row in rows:
+            when = datetime.fromtimestamp(row["updated_at"]).strftime("%Y-%m-%d %H:%M:%S")
+            print(f"{when}  {row['mailbox']}  uid {row['uid']}  worker {row['owner']}")
+        print(f"⚠️ {len(rows)} message(s) to check by hand" if rows else "✅ Nothing in doubt")
+    elif args.command == "resolve":
+        if table.resolve(args.mailbox, args.uid):
+            print(f"✅ {args.mailbox} uid {args.uid} marked done")
+        else:
+            print(f"❌ {args.mailbox} uid {args.uid} is not in doubt")
+    elif args.command == "release":
+        print(f"🔓 Released {table.release(args.owner)} lease(s) held by {args.owner}")
+    else:
+        print(f"🧹 Pruned {table.prune(args.days)} finished row(s)")
+    table.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
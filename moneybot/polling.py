@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Adaptive Polling - per-source check intervals driven by what recent cycles found
+A cycle that finds new items halves the interval (down to the source's minimum);
+empty cycles stretch it by 1.5x and failed cycles by 2x (up to the maximum), so a
+dead feed at 4 a.m. is polled rarely and a burst is followed closely
+Author: Jarvis (jarvisauto001-coder)
+Repo: https://github.com/jarvisauto001-coder/moneybot-scripts
+
+Usage:
+    python3 -m moneybot.polling status
+    python3 -m moneybot.polling history guardian
+    python3 -m moneybot.polling reset scanner
+    python3 -m moneybot.polling history guardian-sales   # a second account's interval
+"""
+
+import json
+import os
+import sys
+from datetime import datetime
+from typing import Dict, Optional
+
+from moneybot.config import WORKSPACE
+
+DEFAULT_STATE_DIR = os.path.join(WORKSPACE, ".poll_intervals")
+
+# Seconds. base is where a new source starts and where a burst restarts shortening from.
+SOURCES = {
+    "guardian": {"base": 300, "min": 120, "max": 1800},
+    "engager": {"base": 900, "min": 300, "max": 3600},
+    "scanner": {"base": 1800, "min": 600, "max": 7200},
+}
+
+SPEEDUP = 2.0      # interval divisor after a cycle with new items
+QUIET_GROWTH = 1.5  # multiplier after an empty cycle
+ERROR_GROWTH = 2.0  # multiplier after a failed cycle
+HISTORY = 50        # decisions kept per source for tuning
+
+
+def format_interval(seconds: float) -> str:
+    return f"{seconds / 60:.1f} min" if seconds >= 60 else f"{seconds:.0f}s"
+
+
+class AdaptiveInterval:
+    """Next-check delay for one source, persisted so restarts keep what was learned"""
+
+    def __init__(self, name: str, base: Optional[float] = None, minimum: Optional[float] = None,
+                 maximum: Optional[float] = None, state_dir: str = DEFAULT_STATE_DIR):
+        # Per-account intervals (guardian-sales, see moneybot/accounts.py) use their source's bounds
+        defaults = SOURCES.get(name) or SOURCES.get(name.split("-", 1)[0], {})
+        self.name = name
+        self.base = base if base is not None else defaults["base"]
+        self.minimum = minimum if minimum is not None else defaults.get("min", self.base)
+        self.maximum = maximum if maximum is not None else defaults.get("max", self.base)
+        self.path = os.path.join(state_dir, f"{name}.json")
+        self.state = self.load()
+
+    def load(self) -> Dict:
+        state = {"interval": self.base, "empty_streak": 0, "error_streak": 0, "decisions": []}
+        try:
+            with open(self.path, 'r') as f:
+                state.update(json.load(f))
+        except (OSError, ValueError):
+            pass
+        # Bounds may have been retuned since the state was written
+        state["interval"] = self.clamp(state["interval"])
+        return state
+
+    def save(self):
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            tmp = f"{self.path}.{os.getpid()}.tmp"
+            with open(tmp, 'w') as f:
+                json.dump(self.state, f, indent=2)
+            os.replace(tmp, self.path)
+        except OSError:
+            pass  # Pacing still works in memory
+
+    def clamp(self, seconds: float) -> float:
+        return min(self.maximum, max(self.minimum, float(seconds)))
+
+    @property
+    def interval(self) -> float:
+        return self.state["interval"]
+
+    def record(self, found: int, error: bool = False) -> str:
+        """Fold one cycle's outcome into the interval; returns the decision for the log"""
+        previous = self.interval
+        if found:
+            # New items outweigh a partial failure in the same cycle
+            self.state["error_streak"] = self.state["empty_streak"] = 0
+            interval = min(previous, self.base) / SPEEDUP
+            reason = f"{found} new"
+        elif error:
+            self.state["error_streak"] += 1
+            self.state["empty_streak"] = 0
+            interval = previous * ERROR_GROWTH
+            reason = f"cycle failed ({self.state['error_streak']} in a row)"
+        else:
+            self.state["empty_streak"] += 1
+            self.state["error_streak"] = 0
+            interval = previous * QUIET_GROWTH
+            reason = f"nothing new ({self.state['empty_streak']} in a row)"
+        interval = self.clamp(interval)
+        self.state["interval"] = interval
+        self.state["updated_at"] = datetime.utcnow().isoformat()
+        self.state["decisions"] = (self.state["decisions"] + [{
+            "at": self.state["updated_at"],
+            "found": found,
+            "error": error,
+            "from": round(previous),
+            "to": round(interval),
+        }])[-HISTORY:]
+        self.save()
+
+        if interval < previous:
+            trend = "⏩ shorter"
+        elif interval > previous:
+            trend = "⏪ longer"
+        else:
+            trend = "⏸️ unchanged"
+        bound = ", at minimum" if interval == self.minimum else ", at maximum" if interval == self.maximum else ""
+        return f"🧭 {self.name}: {reason} → next check in {format_interval(interval)} ({trend}{bound})"
+
+    def reset(self):
+        self.state.update(interval=self.base, empty_streak=0, error_streak=0)
+        self.save()
+
+
+def known_names(state_dir: str = DEFAULT_STATE_DIR):
+    """Every source plus the per-account intervals that have state in state_dir"""
+    names = list(SOURCES)
+    try:
+        saved = sorted(os.path.splitext(entry)[0] for entry in os.listdir(state_dir) if entry.endswith(".json"))
+    except OSError:
+        saved = []
+    return names + [name for name in saved if name not in SOURCES and name.split("-", 1)[0] in SOURCES]
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Inspect the adaptive polling intervals")
+    parser.add_argument("--dir", default=DEFAULT_STATE_DIR)
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("status", help="Current interval and streaks per source")
+    history = sub.add_parser("history", help="Recent decisions for one source")
+    history.add_argument("source", help="A source, or source-account")
+    reset = sub.add_parser("reset", help="Put a source back on its base interval")
+    reset.add_argument("source", help="A source, or source-account")
+    args = parser.parse_args(argv)
+
+    if args.command == "status":
+        names = known_names(args.dir)
+        width = max(10, max(len(name) for name in names) + 2)
+        print(f"{'source':<{width}}{'interval':>10}{'bounds':>20}{'empty':>7}{'errors':>8}  updated")
+        for name in names:
+            poll = AdaptiveInterval(name, state_dir=args.dir)
+            bounds = f"{format_interval(poll.minimum)}-{format_interval(poll.maximum)}"
+            print(f"{name:<{width}}{format_interval(poll.interval):>10}{bounds:>20}"
+                  f"{poll.state['empty_streak']:>7}{poll.state['error_streak']:>8}  {poll.state.get('updated_at', 'never')}")
+        return 0
+
+    if args.source.split("-", 1)[0] not in SOURCES:
+        parser.error(f"unknown source {args.source!r} (known: {', '.join(known_names(args.dir))})")
+    poll = AdaptiveInterval(args.source, state_dir=args.dir)
+    if args.command == "reset":
+        poll.reset()
+        print(f"🔄 {args.source} back to {format_interval(poll.base)}")
+        return 0
+
+    for decision in poll.state["decisions"]:
+        outcome = "error" if decision["error"] and not decision["found"] else f"{decision['found']} new"
+        print(f"{decision['at'][:19]}  {outcome:<10} {format_interval(decision['from']):>9} → {format_interval(decision['to'])}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+"""
+Moltbook Post Archive - local SQLite store with an FTS5 full-text index
+Every fetched feed page is upserted; ranked keyword queries run locally in milliseconds
+Author: Jarvis (jarvisauto001-coder)
+Repo: https://github.com/jarvisauto001-coder/moneybot-scripts
+
+Usage:
+    python3 -m moneybot.post_archive search aioz --days 7
+    python3 -m moneybot.post_archive stats
+"""
+
+import os
+import sqlite3
+import sys
+import time
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from moneybot.config import WORKSPACE
+
+DEFAULT_ARCHIVE = os.path.join(WORKSPACE, ".moltbook_archive.db")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS posts (
+    rowid INTEGER PRIMARY KEY,
+    id TEXT UNIQUE NOT NULL,
+    submolt TEXT,
+    author TEXT,
+    title TEXT,
+    content TEXT,
+    upvotes INTEGER DEFAULT 0,
+    comment_count INTEGER DEFAULT 0,
+    created_at TEXT,
+    first_seen TEXT,
+    last_seen TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_posts_created ON posts(created_at);
+CREATE VIRTUAL TABLE IF NOT EXISTS posts_fts USING fts5(
+    title, content, author, content='posts', content_rowid='rowid'
+);
+CREATE TRIGGER IF NOT EXISTS posts_ai AFTER INSERT ON posts BEGIN
+    INSERT INTO posts_fts(rowid, title, content, author) VALUES (new.rowid, new.title, new.content, new.author);
+END;
+CREATE TRIGGER IF NOT EXISTS posts_ad AFTER DELETE ON posts BEGIN
+    INSERT INTO posts_fts(posts_fts, rowid, title, content, author) VALUES ('delete', old.rowid, old.title, old.content, old.author);
+END;
+CREATE TRIGGER IF NOT EXISTS posts_au AFTER UPDATE OF title, content, author ON posts BEGIN
+    INSERT INTO posts_fts(posts_fts, rowid, title, content, author) VALUES ('delete', old.rowid, old.title, old.content, old.author);
+    INSERT INTO posts_fts(rowid, title, content, author) VALUES (new.rowid, new.title, new.content, new.author);
+END;
+CREATE TABLE IF NOT EXISTS engagements (
+    post_id TEXT NOT NULL,
+    action TEXT NOT NULL,
+    reason TEXT,
+    at TEXT NOT NULL,
+    outcome INTEGER,
+    upvotes INTEGER,
+    comment_count INTEGER,
+    PRIMARY KEY (post_id, action)
+);
+"""
+
+
+def keyword_query(keywords: Iterable[str]) -> str:
+    """Build an FTS5 OR-query from plain keywords (each quoted as a phrase)"""
+    return " OR ".join('"' + k.replace('"', '""') + '"' for k in keywords)
+
+
+class PostArchive:
+    """Incrementally populated archive of every post the engager has fetched"""
+
+    def __init__(self, path: str = DEFAULT_ARCHIVE):
+        self.path = path
+        self.conn = sqlite3.connect(path, timeout=10, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+        self._migrate()
+
+    def _migrate(self):
+        """Bring archives created by older versions up to the current schema"""
+        columns = {row[1] for row in self.conn.execute("PRAGMA table_info(engagements)")}
+        for column in ("outcome", "upvotes", "comment_count"):
+            if column not in columns:
+                with self.conn:
+                    self.conn.execute(f"ALTER TABLE engagements ADD COLUMN {column} INTEGER")
+
+    def add_posts(self, posts: List[Dict], submolt: Optional[str] = None) -> Tuple[int, List[str]]:
+        """Upsert a fetched page; text is only re-indexed when it changed.
+        Returns (new post count, ids of known posts whose title or content was edited)."""
+        now = datetime.utcnow().isoformat()
+        inserted = 0
+        edited = []
+        with self.conn:
+            for post in posts:
+                post_id = post.get("id")
+                if post_id is None:
+                    continue
+                cur = self.conn.execute(
+                    """INSERT INTO posts (id, submolt, author, title, content, upvotes, comment_count,
+                                          created_at, first_seen, last_seen)
+                       VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                       ON CONFLICT(id) DO NOTHING""",
+                    (
+                        str(post_id),
+                        self._submolt_name(post) or submolt,
+                        (post.get("author") or {}).get("name", ""),
+                        post.get("title", ""),
+                        post.get("content") or "",
+                        post.get("upvotes", 0),
+                        post.get("comment_count", 0),
+                        post.get("created_at") or now,
+                        now,
+                        now,
+                    ),
+                )
+                if cur.rowcount:
+                    inserted += 1
+                    continue
+                cur = self.conn.execute(
+                    "UPDATE posts SET title = ?, content = ?, last_seen = ? WHERE id = ? AND (title != ? OR content != ?)",
+                    (post.get("title", ""), post.get("content") or "", now, str(post_id),
+                     post.get("title", ""), post.get("content") or ""),
+                )
+                if cur.rowcount:
+                    edited.append(post_id)
+            self.conn.executemany(
+                """UPDATE posts SET upvotes = ?, comment_count = ?, last_seen = ?
+                   WHERE id = ? AND (upvotes != ? OR comment_count != ?)""",
+                [
+                    (
+                        p.get("upvotes", 0), p.get("comment_count", 0), now,
+                        str(p.get("id")),
+                        p.get("upvotes", 0), p.get("comment_count", 0),
+                    )
+                    for p in posts if p.get("id") is not None
+                ],
+            )
+        return inserted, edited
+
+    @staticmethod
+    def _submolt_name(post: Dict) -> Optional[str]:
+        submolt = post.get("submolt")
+        if isinstance(submolt, dict):
+            return submolt.get("name")
+        return submolt
+
+    def search(self, query: str, since_days: Optional[float] = None, limit: int = 20,
+               exclude_engaged: bool = False, exclude_author: Optional[str] = None) -> List[Dict]:
+        """Ranked (bm25) full-text query; best matches first"""
+        sql = """SELECT p.id, p.submolt, p.author, p.title, p.content, p.upvotes, p.comment_count,
+                        p.created_at, bm25(posts_fts) AS rank
+                 FROM posts_fts JOIN posts p ON p.rowid = posts_fts.rowid
+                 WHERE posts_fts MATCH ?"""
+        params: list = [query]
+        if since_days is not None:
+            sql += " AND p.created_at >= ?"
+            params.append((datetime.utcnow() - timedelta(days=since_days)).isoformat())
+        if exclude_engaged:
+            sql += " AND NOT EXISTS (SELECT 1 FROM engagements e WHERE e.post_id = p.id)"
+        if exclude_author:
+            sql += " AND p.author != ?"
+            params.append(exclude_author)
+        sql += " ORDER BY rank LIMIT ?"
+        params.append(limit)
+        return [self._as_post(row) for row in self.conn.execute(sql, params)]
+
+    def _as_post(self, row: sqlite3.Row) -> Dict:
+        """Shape a row like an API post so engager code can consume it unchanged"""
+        return {
+            "id": row["id"],
+            "submolt": row["submolt"],
+            "author": {"name": row["author"]},
+            "title": row["title"],
+            "content": row["content"],
+            "upvotes": row["upvotes"],
+            "comment_count": row["comment_count"],
+            "created_at": row["created_at"],
+            "rank": row["rank"],
+        }
+
+    def mark_engaged(self, post_id: str, action: str, reason: Optional[str] = None,
+                     upvotes: Optional[int] = None, comment_count: Optional[int] = None):
+        """Record an engagement with the post's counts as we saw them before acting (the
+        model's features at decision time; the archive's own counts later include our comment)"""
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO engagements (post_id, action, reason, at, upvotes, comment_count) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (str(post_id), action, reason, datetime.utcnow().isoformat(), upvotes, comment_count),
+            )
+
+    def engaged(self, post_id: str, action: Optional[str] = None) -> bool:
+        sql = "SELECT 1 FROM engagements WHERE post_id = ?"
+        params = [str(post_id)]
+        if action:
+            sql += " AND action = ?"
+            params.append(action)
+        return self.conn.execute(sql, params).fetchone() is not None
+
+    def unlabeled_comments(self, older_than_hours: float = 24, limit: int = 5) -> List[Dict]:
+        """Comments we left whose outcome (author replied or not) is still unknown"""
+        cutoff = (datetime.utcnow() - timedelta(hours=older_than_hours)).isoformat()
+        rows = self.conn.execute(
+            """SELECT e.post_id, e.at, p.author, p.comment_count FROM engagements e JOIN posts p ON p.id = e.post_id
+               WHERE e.action = 'comment' AND e.outcome IS NULL AND e.at <= ?
+               ORDER BY e.at LIMIT ?""",
+            (cutoff, limit),
+        )
+        return [{"post_id": r["post_id"], "at": r["at"], "author": r["author"], "comment_count": r["comment_count"] or 0}
+                for r in rows]
+
+    def set_outcome(self, post_id: str, outcome: int, action: str = "comment"):
+        with self.conn:
+            self.conn.execute(
+                "UPDATE engagements SET outcome = ? WHERE post_id = ? AND action = ?",
+                (int(outcome), str(post_id), action),
+            )
+
+    def labeled_posts(self, action: str = "comment") -> List[Tuple[Dict, int]]:
+        """(post, outcome) pairs for training the relevance model. Counts are the snapshot taken
+        when we engaged, so the label (a reply) can't leak in; older rows without one are skipped."""
+        rows = self.conn.execute(
+            """SELECT p.id, p.submolt, p.author, p.title, p.content, e.upvotes, e.comment_count,
+                      p.created_at, 0 AS rank, e.outcome
+               FROM engagements e JOIN posts p ON p.id = e.post_id
+               WHERE e.action = ? AND e.outcome IS NOT NULL AND e.comment_count IS NOT NULL""",
+            (action,),
+        )
+        return [(self._as_post(row), row["outcome"]) for row in rows]
+
+    def stats(self) -> Dict:
+        row = self.conn.execute(
+            "SELECT COUNT(*), MIN(created_at), MAX(created_at) FROM posts"
+        ).fetchone()
+        engaged = self.conn.execute("SELECT COUNT(DISTINCT post_id) FROM engagements").fetchone()[0]
+        return {"posts": row[0], "oldest": row[1], "newest": row[2], "engaged": engaged}
+
+    def close(self):
+        self.conn.close()
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Query the local Moltbook post archive")
+    parser.add_argument("--db", default=DEFAULT_ARCHIVE)
+    sub = parser.add_subparsers(dest="command", required=True)
+    search = sub.add_parser("search", help="Ranked keyword search")
+    search.add_argument("keywords", nargs="+")
+    search.add_argument("--days", type=float, default=None)
+    search.add_argument("--limit", type=int, default=20)
+    search.add_argument("--raw", action="store_true", help="Pass keywords as a raw FTS5 query")
+    sub.add_parser("stats", help="Archive size and time range")
+    args = parser.parse_args(argv)
+
+    archive = PostArchive(args.db)
+    if args.command == "stats":
+        for key, value in archive.stats().items():
+            print(f"{key:>8}: {value}")
+        return 0
+
+    query = " ".join(args.keywords) if args.raw else keyword_query(args.keywords)
+    start = time.perf_counter()
+    results = archive.search(query, since_days=args.days, limit=args.limit)
+    elapsed = (time.perf_counter() - start) * 1000
+    for post in results:
+        print(f"[{post['created_at'][:16]}] {post['author']['name']:<20} {post['title'][:60]}  (id={post['id']}, ▲{post['upvotes']} 💬{post['comment_count']})")
+    print(f"\n{len(results)} results in {elapsed:.1f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Post Feature Extractor - shared keyword matching for Moltbook posts
+Lowercases a post once; every keyword is tested at most once per post, whichever caller asks
+Author: Jarvis (jarvisauto001-coder)
+Repo: https://github.com/jarvisauto001-coder/moneybot-scripts
+"""
+
+import re
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+TOKEN_RE = re.compile(r"[a-z0-9]+")
+HEAD_CHARS = 500  # comment templates only react to the title and this much of the content
+
+
+class TextFeatures:
+    """The text-derived part of a post: lowercased text (full and head), memoized keyword hits, tokens"""
+
+    __slots__ = ("author", "text", "head", "groups", "hits", "head_hits", "_tokens")
+
+    def __init__(self, author, text, head, groups):
+        self.author = author
+        self.text = text
+        self.head = head
+        self.groups = groups
+        self.hits: Dict[str, bool] = {}
+        self.head_hits: Dict[str, bool] = {}
+        self._tokens = None
+
+    def hit(self, keyword: str, head: bool = False) -> bool:
+        hits, text = (self.head_hits, self.head) if head else (self.hits, self.text)
+        hit = hits.get(keyword)
+        if hit is None:
+            hit = hits[keyword] = keyword in text
+        return hit
+
+    @property
+    def tokens(self) -> List[str]:
+        if self._tokens is None:
+            self._tokens = TOKEN_RE.findall(self.text)
+        return self._tokens
+
+
+class PostFeatures:
+    """Cached text features of one post plus its counts as of this fetch"""
+
+    __slots__ = ("post_id", "upvotes", "comment_count", "_text")
+
+    def __init__(self, post_id, upvotes, comment_count, text_features: TextFeatures):
+        self.post_id = post_id
+        self.upvotes = upvotes
+        self.comment_count = comment_count
+        self._text = text_features
+
+    @property
+    def author(self) -> str:
+        return self._text.author
+
+    @property
+    def text(self) -> str:
+        return self._text.text
+
+    def first(self, group: str, head: bool = False) -> Optional[str]:
+        """First keyword of the group (declaration order) present in the post (head: title + first HEAD_CHARS)"""
+        for keyword in self._text.groups.get(group, ()):
+            if self._text.hit(keyword, head):
+                return keyword
+        return None
+
+    def has(self, group: str, head: bool = False) -> bool:
+        return self.first(group, head) is not None
+
+    def matched(self, group: str) -> Tuple[str, ...]:
+        """All keywords of the group present in the post, in declaration order"""
+        return tuple(k for k in self._text.groups.get(group, ()) if self._text.hit(k))
+
+    @property
+    def tokens(self) -> List[str]:
+        """Alphanumeric tokens of the lowercased text (tokenized on first use)"""
+        return self._text.tokens
+
+
+class PostFeatureExtractor:
+    """
+    Holds the compiled keyword groups and a per-post-id cache of text features
+    (engagement counts change between fetches, so they are never cached).
+    Matching keeps the old `keyword in text` substring semantics: CPython's
+    substring search beats a regex alternation or tokenizing for this, so the
+    saving comes from lowercasing once and never testing a keyword twice.
+    """
+
+    def __init__(self, groups: Dict[str, Iterable[str]], max_cache: int = 4096):
+        self.groups = {name: tuple(k.lower() for k in keywords) for name, keywords in groups.items()}
+        self.max_cache = max_cache
+        self.cache: "OrderedDict[str, TextFeatures]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def extract(self, post: Dict) -> PostFeatures:
+        """Features for the post: text parts cached per id, counts always from this post dict"""
+        post_id = post.get("id")
+        text_features = self.cache.get(post_id) if post_id is not None else None
+        if text_features is not None:
+            self.cache.move_to_end(post_id)
+            self.hits += 1
+        else:
+            self.misses += 1
+            title, content = post.get("title", ""), post.get("content") or ""
+            text_features = TextFeatures(
+                author=(post.get("author") or {}).get("name", ""),
+                text=(title + " " + content).lower(),
+                head=(title + content[:HEAD_CHARS]).lower(),
+                groups=self.groups,
+            )
+            if post_id is not None:
+                self.cache[post_id] = text_features
+                if len(self.cache) > self.max_cache:
+                    self.cache.popitem(last=False)
+        return PostFeatures(post_id, post.get("upvotes", 0), post.get("comment_count", 0), text_features)
+
+    def invalidate(self, post_id: Optional[str] = None):
+        """Drop one cached post (e.g. after an edit) or the whole cache"""
+        if post_id is None:
+            self.cache.clear()
+        else:
+            self.cache.pop(post_id, None)
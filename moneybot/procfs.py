@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+procfs helpers - system metrics straight from /proc and statvfs (no subprocesses)
+Author: Jarvis (jarvisauto001-coder)
+Repo: https://github.com/jarvisauto001-coder/moneybot-scripts
+"""
+
+import os
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+CLK_TCK = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+
+
+def read_uptime() -> float:
+    """Seconds since boot"""
+    with open("/proc/uptime", 'r') as f:
+        return float(f.read().split()[0])
+
+
+def format_uptime(seconds: float) -> str:
+    """Same wording as `uptime -p` (without the leading 'up ')"""
+    minutes = int(seconds // 60)
+    weeks, minutes = divmod(minutes, 7 * 24 * 60)
+    days, minutes = divmod(minutes, 24 * 60)
+    hours, minutes = divmod(minutes, 60)
+    parts = []
+    for value, unit in ((weeks, "week"), (days, "day"), (hours, "hour"), (minutes, "minute")):
+        if value:
+            parts.append(f"{value} {unit}{'s' if value != 1 else ''}")
+    return ", ".join(parts) or "0 minutes"
+
+
+def format_etime(seconds: float) -> str:
+    """Same format as `ps -o etime=`: [[dd-]hh:]mm:ss"""
+    seconds = int(seconds)
+    days, seconds = divmod(seconds, 86400)
+    hours, seconds = divmod(seconds, 3600)
+    minutes, seconds = divmod(seconds, 60)
+    if days:
+        return f"{days}-{hours:02d}:{minutes:02d}:{seconds:02d}"
+    if hours:
+        return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+    return f"{minutes:02d}:{seconds:02d}"
+
+
+def read_cpu_times() -> Tuple[int, int]:
+    """(busy, total) jiffies from the aggregate cpu line of /proc/stat"""
+    with open("/proc/stat", 'r') as f:
+        fields = [int(x) for x in f.readline().split()[1:]]
+    # user nice system idle iowait irq softirq steal [guest guest_nice already counted in user/nice]
+    idle = fields[3] + (fields[4] if len(fields) > 4 else 0)
+    total = sum(fields[:8])
+    return total - idle, total
+
+
+class CpuSampler:
+    """
+    CPU% from jiffy deltas between two /proc/stat samples.
+    One-shot callers take two samples `interval` seconds apart; long-running
+    callers measure against their previous sample (no sleep), and calls less
+    than `interval` apart reuse the last reading.
+    """
+
+    def __init__(self, interval: float = 0.25):
+        self.interval = interval
+        self.last: Optional[Tuple[float, int, int]] = None
+        self.last_percent = 0.0
+        self.lock = threading.Lock()
+
+    def percent(self) -> float:
+        with self.lock:
+            now = time.monotonic()
+            if self.last is None:
+                busy0, total0 = read_cpu_times()
+                time.sleep(self.interval)
+                now = time.monotonic()
+            elif now - self.last[0] < self.interval:
+                return self.last_percent
+            else:
+                _, busy0, total0 = self.last
+            busy1, total1 = read_cpu_times()
+            self.last = (now, busy1, total1)
+            delta = total1 - total0
+            self.last_percent = 100.0 * (busy1 - busy0) / delta if delta > 0 else 0.0
+            return self.last_percent
+
+
+def read_meminfo() -> Dict[str, int]:
+    """/proc/meminfo values in kB"""
+    info = {}
+    with open("/proc/meminfo", 'r') as f:
+        for line in f:
+            key, _, rest = line.partition(":")
+            parts = rest.split()
+            if parts:
+                info[key] = int(parts[0])
+    return info
+
+
+def memory_percent() -> float:
+    """Used memory % (MemTotal - MemAvailable), like the 'used' column of free"""
+    info = read_meminfo()
+    total = info.get("MemTotal", 0)
+    available = info.get("MemAvailable", info.get("MemFree", 0) + info.get("Buffers", 0) + info.get("Cached", 0))
+    return 100.0 * (total - available) / total if total else 0.0
+
+
+def disk_percent(path: str = "/") -> int:
+    """Use% as printed by df (rounded up, relative to space available to users)"""
+    st = os.statvfs(path)
+    used = (st.f_blocks - st.f_bfree) * st.f_frsize
+    usable = used + st.f_bavail * st.f_frsize
+    if not usable:
+        return 0
+    return -(-used * 100 // usable)
+
+
+def find_pids(name: str) -> List[int]:
+    """PIDs whose command line contains `name` (like `ps aux | grep name | grep -v grep`)"""
+    own = os.getpid()
+    needle = name.encode()
+    pids = []
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit() or int(entry) == own:
+            continue
+        try:
+            with open(f"/proc/{entry}/cmdline", 'rb') as f:
+                cmdline = f.read()
+        except OSError:
+            continue
+        if needle in cmdline:
+            pids.append(int(entry))
+    return sorted(pids)
+
+
+def pid_alive(pid: int) -> bool:
+    return os.path.exists(f"/proc/{pid}")
+
+
+def process_elapsed(pid: int) -> float:
+    """Seconds since the process started (from field 22 of /proc/<pid>/stat)"""
+    with open(f"/proc/{pid}/stat", 'r') as f:
+        stat = f.read()
+    # comm may contain spaces/parens; fields after the last ')' are fixed
+    fields = stat[stat.rindex(")") + 2:].split()
+    start_ticks = int(fields[19])
+    return read_uptime() - start_ticks / CLK_TCK
+
+
+def flock_holders(path: str) -> List[int]:
+    """PIDs holding an flock() on path, from /proc/locks ([] if it can't be read)"""
+    try:
+        st = os.stat(path)
+        with open("/proc/locks", 'r') as f:
+            lines = f.readlines()
+    except OSError:
+        return []
+    # "1: FLOCK  ADVISORY  WRITE 1234 fe:00:13533201 0 EOF"; blocked waiters show "->" after the id
+    device = f"{os.major(st.st_dev):02x}:{os.minor(st.st_dev):02x}:{st.st_ino}"
+    pids = []
+    for line in lines:
+        fields = line.split()
+        if len(fields) >= 6 and fields[1] == "FLOCK" and fields[5] == device:
+            pids.append(int(fields[4]))
+    return pids
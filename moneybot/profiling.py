@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+"""
+Profiling Hooks - --profile / --trace-memory for every entry point
+Each cycle (one --once run, one continuous-loop iteration, one supervisor job run)
+runs under cProfile and/or tracemalloc; pstats, tracemalloc snapshots and readable
+top-N summaries go to profiles/YYYY-MM-DD/. The diff command compares two captures
+so a regression between versions can be pinned to a function or allocation site.
+cProfile only sees the thread that enables it, so work handed to a worker thread is
+wrapped with in_cycle(): each call gets its own profiler on the worker and is merged
+into the cycle that submitted it. The dashboard collectors and refreshers, the
+engager's comment fetches and scheduled actions, and the guardian's inbox workers
+do this; concurrent supervisor jobs each get their own CPU profile.
+Author: Jarvis (jarvisauto001-coder)
+Repo: https://github.com/jarvisauto001-coder/moneybot-scripts
+
+Usage:
+    python3 clawtasks-opportunity-scanner.py --once --profile --trace-memory
+    python3 -m moneybot.profiling list
+    python3 -m moneybot.profiling diff OLD.pstats NEW.pstats
+    python3 -m moneybot.profiling diff OLD.tracemalloc NEW.tracemalloc
+"""
+
+import glob
+import io
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Callable, Dict, Optional, Tuple
+
+from moneybot.config import WORKSPACE
+
+DEFAULT_PROFILE_DIR = os.path.join(WORKSPACE, "profiles")
+TOP = 30             # rows in the text summaries
+MEMORY_FRAMES = 10   # traceback depth kept by tracemalloc
+
+
+def flag_value(argv, flag: str, default: Optional[str] = None) -> Optional[str]:
+    if flag in argv and argv.index(flag) + 1 < len(argv):
+        return argv[argv.index(flag) + 1]
+    return default
+
+
+_current = threading.local()  # .capture: the cycle the calling thread is profiling into
+
+
+class _Capture:
+    """One cycle's CPU profile: the cycle's own thread plus every in_cycle() call it handed out"""
+
+    def __init__(self):
+        import pstats
+        self.stats = pstats.Stats()
+        self.lock = threading.Lock()
+        self.profiled = 0   # calls (threads) merged in
+        self.skipped = 0    # calls that found another profiler already active
+
+    @contextmanager
+    def profiling(self):
+        import cProfile
+        previous = getattr(_current, "capture", None)
+        if previous is self:  # already profiled on this thread
+            yield
+            return
+        profile = None
+        if sys.getprofile() is None:
+            profile = cProfile.Profile()
+            try:
+                profile.enable()
+            except ValueError:  # Python 3.12+: cProfile is process-wide, one at a time
+                profile = None
+        if profile is None:
+            with self.lock:
+                self.skipped += 1
+        _current.capture = self
+        try:
+            yield
+        finally:
+            _current.capture = previous
+            if profile is not None:
+                profile.disable()
+                with self.lock:
+                    self.stats.add(profile)
+                    self.profiled += 1
+
+
+def in_cycle(fn: Callable) -> Callable:
+    """fn, profiled into the calling thread's cycle wherever it later runs (for worker threads)"""
+    capture = getattr(_current, "capture", None)
+    if capture is None:
+        return fn
+
+    def profiled(*args, **kwargs):
+        with capture.profiling():
+            return fn(*args, **kwargs)
+    return profiled
+
+
+class Profiler:
+    """Per-cycle CPU/memory capture, enabled by --profile and/or --trace-memory"""
+
+    def __init__(self, name: str, argv=None, log: Callable[[str], None] = print):
+        argv = sys.argv if argv is None else argv
+        self.name = name
+        self.cpu = "--profile" in argv
+        self.memory = "--trace-memory" in argv
+        self.enabled = self.cpu or self.memory
+        self.base_dir = flag_value(argv, "--profile-dir", DEFAULT_PROFILE_DIR)
+        self.log = log
+        self.runs = 0
+        self.last_snapshot = None
+        if self.memory:
+            import tracemalloc
+            if not tracemalloc.is_tracing():
+                tracemalloc.start(MEMORY_FRAMES)
+
+    @contextmanager
+    def cycle(self, label: Optional[str] = None):
+        if not self.enabled:
+            yield
+            return
+        label = label or self.name
+        capture = _Capture() if self.cpu else None
+        started = time.perf_counter()
+        try:
+            if capture is not None:
+                with capture.profiling():
+                    yield
+            else:
+                yield
+        finally:
+            elapsed = time.perf_counter() - started
+            if capture is not None and capture.skipped:
+                self.log(f"🔬 {label}: {capture.skipped} call(s) ran while another profiler was active, "
+                         f"left out of the CPU profile")
+            try:
+                self._write(label, capture if capture is not None and capture.profiled else None, elapsed)
+            except OSError as e:
+                self.log(f"⚠️ Could not write profile for {label}: {e}")
+
+    def wrap(self, fn: Callable, label: Optional[str] = None) -> Callable:
+        """fn, with every call run as a profiled cycle (for supervisor jobs)"""
+        if not self.enabled:
+            return fn
+
+        def profiled(*args, **kwargs):
+            with self.cycle(label):
+                return fn(*args, **kwargs)
+        return profiled
+
+    def _write(self, label: str, capture: Optional[_Capture], elapsed: float):
+        now = datetime.now()
+        directory = os.path.join(self.base_dir, now.strftime("%Y-%m-%d"))
+        os.makedirs(directory, exist_ok=True)
+        self.runs += 1
+        stem = os.path.join(directory, f"{label}-{now.strftime('%H%M%S')}-{os.getpid()}-{self.runs}")
+        written = []
+
+        if capture is not None:
+            with capture.lock:
+                capture.stats.dump_stats(stem + ".pstats")
+                out = io.StringIO()
+                out.write(f"{label}: {elapsed:.3f}s wall, {capture.profiled} thread run(s) merged\n\n")
+                capture.stats.stream = out
+                capture.stats.sort_stats("cumulative").print_stats(TOP)
+            with open(stem + ".pstats.txt", 'w') as f:
+                f.write(out.getvalue())
+            written.append(stem + ".pstats")
+
+        if self.memory:
+            import tracemalloc
+            snapshot = tracemalloc.take_snapshot().filter_traces((
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+                tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+            ))
+            snapshot.dump(stem + ".tracemalloc")
+            current, peak = tracemalloc.get_traced_memory()
+            lines = [f"{label}: traced {current / 1024:.1f} KiB now, peak {peak / 1024:.1f} KiB, {elapsed:.3f}s wall", ""]
+            lines.append(f"Top {TOP} allocation sites:")
+            lines.extend(str(stat) for stat in snapshot.statistics("lineno")[:TOP])
+            if self.last_snapshot is not None:
+                lines += ["", "Growth since the previous cycle in this process:"]
+                lines.extend(str(stat) for stat in snapshot.compare_to(self.last_snapshot, "lineno")[:TOP])
+            self.last_snapshot = snapshot
+            with open(stem + ".tracemalloc.txt", 'w') as f:
+                f.write("\n".join(lines) + "\n")
+            written.append(stem + ".tracemalloc")
+
+        self.log(f"🔬 {label}: {elapsed:.2f}s, profile written to {', '.join(written)} (+ .txt summaries)")
+
+
+# --- diff mode ---
+
+def _function_table(path: str) -> Dict[Tuple[str, str], Tuple[int, float, float]]:
+    """(file basename, function) -> (calls, tottime, cumtime); line numbers drift between versions"""
+    import pstats
+    table: Dict[Tuple[str, str], Tuple[int, float, float]] = {}
+    for (filename, _line, func), (_cc, calls, tottime, cumtime, _callers) in pstats.Stats(path).stats.items():
+        key = (os.path.basename(filename), func)
+        old = table.get(key, (0, 0.0, 0.0))
+        table[key] = (old[0] + calls, old[1] + tottime, old[2] + cumtime)
+    return table
+
+
+def diff_pstats(old_path: str, new_path: str, top: int = TOP, sort: str = "cumulative") -> str:
+    old, new = _function_table(old_path), _function_table(new_path)
+    column = 2 if sort == "cumulative" else 1
+    rows = []
+    for key in set(old) | set(new):
+        before, after = old.get(key, (0, 0.0, 0.0)), new.get(key, (0, 0.0, 0.0))
+        rows.append((after[column] - before[column], key, before, after))
+    rows.sort(key=lambda row: abs(row[0]), reverse=True)
+    label = "cumtime" if column == 2 else "tottime"
+    lines = [f"{'function':<58}{'old ' + label:>12}{'new ' + label:>12}{'delta':>10}{'calls old→new':>20}"]
+    for delta, (filename, func), before, after in rows[:top]:
+        name = f"{filename}:{func}"
+        lines.append(f"{name[-58:]:<58}{before[column]:>12.4f}{after[column]:>12.4f}{delta:>+10.4f}"
+                     f"{f'{before[0]}→{after[0]}':>20}")
+    return "\n".join(lines)
+
+
+def diff_tracemalloc(old_path: str, new_path: str, top: int = TOP, key: str = "lineno") -> str:
+    import tracemalloc
+    old, new = tracemalloc.Snapshot.load(old_path), tracemalloc.Snapshot.load(new_path)
+    stats = new.compare_to(old, key)
+    total = sum(stat.size_diff for stat in stats)
+    lines = [f"Total change: {total / 1024:+.1f} KiB", ""]
+    lines.extend(str(stat) for stat in stats[:top])
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="List and compare --profile / --trace-memory captures")
+    parser.add_argument("--dir", default=DEFAULT_PROFILE_DIR)
+    sub = parser.add_subparsers(dest="command", required=True)
+    listing = sub.add_parser("list", help="Captures, newest first")
+    listing.add_argument("--name", default=None, help="Only this entry point/job")
+    listing.add_argument("-n", type=int, default=20)
+    diff = sub.add_parser("diff", help="Compare two .pstats or two .tracemalloc captures")
+    diff.add_argument("old")
+    diff.add_argument("new")
+    diff.add_argument("--top", type=int, default=TOP)
+    diff.add_argument("--sort", choices=("cumulative", "tottime"), default="cumulative", help="pstats only")
+    diff.add_argument("--by", choices=("lineno", "filename", "traceback"), default="lineno", help="tracemalloc only")
+    args = parser.parse_args(argv)
+
+    if args.command == "list":
+        captures = glob.glob(os.path.join(args.dir, "*", "*.pstats")) + glob.glob(os.path.join(args.dir, "*", "*.tracemalloc"))
+        if args.name:
+            captures = [path for path in captures if os.path.basename(path).startswith(args.name + "-")]
+        captures.sort(key=os.path.getmtime, reverse=True)
+        for path in captures[:args.n]:
+            stamp = datetime.fromtimestamp(os.path.getmtime(path)).strftime("%Y-%m-%d %H:%M:%S")
+            print(f"{stamp}  {os.path.getsize(path) / 1024:>8.1f} KiB  {path}")
+        return 0
+
+    kinds = {os.path.splitext(path)[1] for path in (args.old, args.new)}
+    if kinds == {".pstats"}:
+        print(diff_pstats(args.old, args.new, args.top, args.sort))
+    elif kinds == {".tracemalloc"}:
+        print(diff_tracemalloc(args.old, args.new, args.top, args.by))
+    else:
+        print("diff needs two .pstats or two .tracemalloc files", file=sys.stderr)
+        return 2
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
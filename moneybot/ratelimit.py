@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+Rate-limit-aware action scheduler
+Token buckets per action kind, overlapping requests, 429/Retry-After backoff
+Author: Jarvis (jarvisauto001-coder)
+Repo: https://github.com/jarvisauto001-coder/moneybot-scripts
+"""
+
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, wait as wait_futures
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Callable, Dict, Optional, Tuple
+
+from moneybot.profiling import in_cycle
+
+
+class RateLimited(Exception):
+    """Raised by an action when the API answered 429"""
+
+    def __init__(self, retry_after: Optional[float] = None):
+        super().__init__(f"rate limited (retry after {retry_after}s)")
+        self.retry_after = retry_after
+
+
+def parse_retry_after(value, default: float = 60.0) -> float:
+    """Parse a Retry-After header (delta-seconds or HTTP-date) into seconds"""
+    if value is None or value == "":
+        return default
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+        if when.tzinfo is None:
+            when = when.replace(tzinfo=timezone.utc)
+        return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError):
+        return default
+
+
+class TokenBucket:
+    """Thread-safe token bucket with AIMD rate adaptation on 429s"""
+
+    def __init__(self, per_minute: float, burst: int = 1, min_per_minute: Optional[float] = None):
+        self.base_rate = per_minute / 60.0
+        self.rate = self.base_rate
+        self.min_rate = (min_per_minute / 60.0) if min_per_minute else self.base_rate / 8
+        self.capacity = float(burst)
+        self.tokens = float(burst)
+        self.blocked_until = 0.0
+        self.updated = time.monotonic()
+        self.cond = threading.Condition()
+
+    def _refill(self, now: float):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def acquire(self, timeout: Optional[float] = None) -> bool:
+        """Block until a token is available; False on timeout"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self.cond:
+            while True:
+                now = time.monotonic()
+                self._refill(now)
+                if now >= self.blocked_until and self.tokens >= 1:
+                    self.tokens -= 1
+                    return True
+                wait = max(self.blocked_until - now, (1 - self.tokens) / self.rate, 0.001)
+                if deadline is not None:
+                    if now >= deadline:
+                        return False
+                    wait = min(wait, deadline - now)
+                self.cond.wait(wait)
+
+    def penalize(self, retry_after: float):
+        """Server said slow down: pause the bucket and halve the rate"""
+        with self.cond:
+            now = time.monotonic()
+            self._refill(now)
+            self.blocked_until = max(self.blocked_until, now + retry_after)
+            self.tokens = 0.0
+            self.rate = max(self.min_rate, self.rate / 2)
+            self.cond.notify_all()
+
+    def reward(self):
+        """Successful call: creep back towards the configured rate"""
+        with self.cond:
+            self.rate = min(self.base_rate, self.rate * 1.1)
+
+    @property
+    def per_minute(self) -> float:
+        return self.rate * 60.0
+
+
+class _Action:
+    __slots__ = ("kind", "fn", "args", "kwargs", "future", "attempts")
+
+    def __init__(self, kind, fn, args, kwargs):
+        self.kind = kind
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.future = Future()
+        self.attempts = 0
+
+
+_STOP = object()
+
+
+class ActionScheduler:
+    """
+    Runs actions through per-kind token buckets.
+    Each kind has its own dispatcher so a slow bucket (comments) never
+    holds back a fast one (upvotes); dispatched calls overlap on a shared pool.
+    """
+
+    def __init__(self, limits: Dict[str, Tuple[float, int]], max_workers: int = 4,
+                 max_retries: int = 3, default_retry_after: float = 30.0):
+        self.buckets = {kind: TokenBucket(per_minute, burst) for kind, (per_minute, burst) in limits.items()}
+        self.max_retries = max_retries
+        self.default_retry_after = default_retry_after
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="action")
+        self.queues = {kind: queue.Queue() for kind in self.buckets}
+        self.completed = deque()
+        self.rate_limited = 0
+        self.started = time.monotonic()
+        self.lock = threading.Lock()
+        self.pending = set()
+        self.dispatchers = []
+        for kind in self.buckets:
+            t = threading.Thread(target=self._dispatch, args=(kind,), name=f"dispatch-{kind}", daemon=True)
+            t.start()
+            self.dispatchers.append(t)
+
+    def submit(self, kind: str, fn: Callable, *args, **kwargs) -> Future:
+        """Queue an action; the returned future resolves to fn's result"""
+        if kind not in self.buckets:
+            raise KeyError(f"No rate limit configured for action '{kind}'")
+        action = _Action(kind, in_cycle(fn), args, kwargs)  # runs on a pool thread
+        with self.lock:
+            self.pending.add(action.future)
+        action.future.add_done_callback(self._forget)
+        self.queues[kind].put(action)
+        return action.future
+
+    def _forget(self, future: Future):
+        with self.lock:
+            self.pending.discard(future)
+
+    def _dispatch(self, kind: str):
+        bucket = self.buckets[kind]
+        q = self.queues[kind]
+        while True:
+            action = q.get()
+            if action is _STOP:
+                return
+            bucket.acquire()
+            self.executor.submit(self._run, action)
+
+    def _run(self, action: _Action):
+        bucket = self.buckets[action.kind]
+        action.attempts += 1
+        try:
+            result = action.fn(*action.args, **action.kwargs)
+        except RateLimited as e:
+            with self.lock:
+                self.rate_limited += 1
+            bucket.penalize(e.retry_after if e.retry_after is not None else self.default_retry_after)
+            if action.attempts <= self.max_retries:
+                self.queues[action.kind].put(action)
+            else:
+                action.future.set_result(False)
+            return
+        except Exception as e:
+            action.future.set_exception(e)
+            return
+        bucket.reward()
+        with self.lock:
+            self.completed.append(time.monotonic())
+        action.future.set_result(result)
+
+    def actions_per_minute(self, window: float = 60.0) -> float:
+        """Achieved completions per minute over the recent window (or lifetime if shorter)"""
+        now = time.monotonic()
+        with self.lock:
+            while self.completed and self.completed[0] < now - window:
+                self.completed.popleft()
+            count = len(self.completed)
+        span = min(window, max(now - self.started, 1e-6))
+        return count * 60.0 / span
+
+    def stats(self) -> Dict:
+        return {
+            "actions_per_minute": round(self.actions_per_minute(), 2),
+            "rate_limited": self.rate_limited,
+            "rates": {kind: round(b.per_minute, 2) for kind, b in self.buckets.items()},
+        }
+
+    def drain(self, timeout: Optional[float] = None):
+        """Wait for every submitted action (including 429 retries) to finish"""
+        with self.lock:
+            pending = list(self.pending)
+        wait_futures(pending, timeout=timeout)
+
+    def close(self, wait: bool = True):
+        """Stop dispatchers; with wait=True queued actions finish first"""
+        if wait:
+            self.drain()
+        for q in self.queues.values():
+            q.put(_STOP)
+        if wait:
+            for t in self.dispatchers:
+                t.join()
+        self.executor.shutdown(wait=wait)
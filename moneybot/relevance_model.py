@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Relevance Model - logistic regression over post features, trained on engagement outcomes
+Label = did the post's author reply after we commented. Model is a small JSON file;
+feeds are scored in one vectorized batch (NumPy when installed, pure Python otherwise)
+Author: Jarvis (jarvisauto001-coder)
+Repo: https://github.com/jarvisauto001-coder/moneybot-scripts
+"""
+
+import json
+import math
+import os
+import zlib
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from moneybot.config import WORKSPACE
+from moneybot.lazy import lazy_import
+
+# NumPy is optional (the model is small enough for plain lists) and only
+# imported once something is actually scored or trained
+np = lazy_import("numpy")
+
+DEFAULT_MODEL = os.path.join(WORKSPACE, ".moltbook_relevance_model.json")
+
+
+def _sigmoid(z: float) -> float:
+    if z >= 0:
+        return 1.0 / (1.0 + math.exp(-z))
+    e = math.exp(z)
+    return e / (1.0 + e)
+
+
+class RelevanceModel:
+    """
+    Features: one flag per relevance keyword, known-agent flag, log engagement
+    counts, log length and hashed token buckets. Keywords and agents are stored
+    in the model file so scoring doesn't depend on the caller's current lists.
+    """
+
+    def __init__(self, keywords: Sequence[str], known_agents: Sequence[str], weights: Sequence[float],
+                 bias: float = 0.0, hash_buckets: int = 64, meta: Optional[Dict] = None):
+        self.keywords = list(keywords)
+        self.known_agents = set(known_agents)
+        self.hash_buckets = hash_buckets
+        self.weights = list(weights)
+        self.bias = bias
+        self.meta = meta or {}
+        if len(self.weights) != self.n_features:
+            raise ValueError(f"Model has {len(self.weights)} weights, expected {self.n_features}")
+        self._w = np.asarray(self.weights, dtype=np.float64) if np is not None else None
+
+    @property
+    def feature_names(self) -> List[str]:
+        return ([f"kw:{k}" for k in self.keywords]
+                + ["known_agent", "log_upvotes", "log_comments", "log_length"]
+                + [f"tok:{i}" for i in range(self.hash_buckets)])
+
+    @property
+    def n_features(self) -> int:
+        return len(self.keywords) + 4 + self.hash_buckets
+
+    def featurize_one(self, features) -> List[float]:
+        """Feature row for one PostFeatures object"""
+        text = features.text
+        row = [1.0 if k in text else 0.0 for k in self.keywords]
+        tokens = features.tokens
+        row.append(1.0 if features.author in self.known_agents else 0.0)
+        row.append(math.log1p(max(features.upvotes or 0, 0)))
+        row.append(math.log1p(max(features.comment_count or 0, 0)))
+        row.append(math.log1p(len(tokens)))
+        buckets = [0.0] * self.hash_buckets
+        if self.hash_buckets:
+            for token in set(tokens):
+                buckets[zlib.crc32(token.encode()) % self.hash_buckets] = 1.0
+        row.extend(buckets)
+        return row
+
+    def featurize(self, features_list: Iterable):
+        rows = [self.featurize_one(f) for f in features_list]
+        if np is not None:
+            return np.asarray(rows, dtype=np.float64).reshape(len(rows), self.n_features)
+        return rows
+
+    def score_batch(self, features_list: Sequence) -> List[float]:
+        """Probability that engaging pays off, for a whole feed at once"""
+        if not features_list:
+            return []
+        X = self.featurize(features_list)
+        if np is not None:
+            z = X @ self._w + self.bias
+            return (1.0 / (1.0 + np.exp(-np.clip(z, -30, 30)))).tolist()
+        return [_sigmoid(sum(w * x for w, x in zip(self.weights, row)) + self.bias) for row in X]
+
+    def save(self, path: str = DEFAULT_MODEL):
+        data = {
+            "version": 1,
+            "keywords": self.keywords,
+            "known_agents": sorted(self.known_agents),
+            "hash_buckets": self.hash_buckets,
+            "bias": self.bias,
+            "weights": [round(w, 6) for w in self.weights],
+            "meta": self.meta,
+        }
+        tmp = path + ".tmp"
+        with open(tmp, 'w') as f:
+            json.dump(data, f, indent=1)
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: str = DEFAULT_MODEL) -> Optional["RelevanceModel"]:
+        """Load a saved model, or None if there is none yet"""
+        if not os.path.exists(path):
+            return None
+        with open(path, 'r') as f:
+            data = json.load(f)
+        return cls(data["keywords"], data["known_agents"], data["weights"],
+                   data.get("bias", 0.0), data.get("hash_buckets", 64), data.get("meta"))
+
+
+def train(examples: Sequence[Tuple[object, int]], keywords: Sequence[str], known_agents: Sequence[str],
+          hash_buckets: int = 64, epochs: int = 400, lr: float = 0.3, l2: float = 1e-3) -> RelevanceModel:
+    """Fit L2-regularized logistic regression by full-batch gradient descent"""
+    if not examples:
+        raise ValueError("No labeled examples to train on")
+    model = RelevanceModel(keywords, known_agents, [0.0] * (len(keywords) + 4 + hash_buckets), 0.0, hash_buckets)
+    X = model.featurize([f for f, _ in examples])
+    labels = [float(y) for _, y in examples]
+    n = len(labels)
+    positives = sum(labels)
+    # Start from the base rate so sparse data doesn't drift far from it
+    base = min(max(positives / n, 1e-3), 1 - 1e-3)
+    bias = math.log(base / (1 - base))
+
+    if np is not None:
+        y = np.asarray(labels)
+        w = np.zeros(model.n_features)
+        for _ in range(epochs):
+            p = 1.0 / (1.0 + np.exp(-np.clip(X @ w + bias, -30, 30)))
+            err = p - y
+            w -= lr * (X.T @ err / n + l2 * w)
+            bias -= lr * err.mean()
+        weights = w.tolist()
+        p = 1.0 / (1.0 + np.exp(-np.clip(X @ w + bias, -30, 30)))
+        loss = float(-np.mean(y * np.log(p + 1e-12) + (1 - y) * np.log(1 - p + 1e-12)))
+    else:
+        weights = [0.0] * model.n_features
+        for _ in range(epochs):
+            grad = [0.0] * model.n_features
+            grad_b = 0.0
+            for row, target in zip(X, labels):
+                err = _sigmoid(sum(w * x for w, x in zip(weights, row)) + bias) - target
+                grad_b += err
+                for j, x in enumerate(row):
+                    if x:
+                        grad[j] += err * x
+            weights = [w - lr * (g / n + l2 * w) for w, g in zip(weights, grad)]
+            bias -= lr * grad_b / n
+        loss = -sum(
+            t * math.log(_sigmoid(sum(w * x for w, x in zip(weights, row)) + bias) + 1e-12)
+            + (1 - t) * math.log(1 - _sigmoid(sum(w * x for w, x in zip(weights, row)) + bias) + 1e-12)
+            for row, t in zip(X, labels)
+        ) / n
+
+    return RelevanceModel(keywords, known_agents, weights, bias, hash_buckets, meta={
+        "trained_at": datetime.utcnow().isoformat(),
+        "samples": n,
+        "positives": int(positives),
+        "log_loss": round(loss, 4),
+    })
@@ -0,0 +1,298 @@
+#!/usr/bin/env python3
+"""
+Run Locks - single-flight guard so overlapping cron runs never repeat each other's work
+A run takes an flock on .locks/<name>.lock before it touches the network. A copy
+started while the lock is held (cron firing again during a slow IMAP session or a
+large backlog) follows its policy:
+    skip      exit at once (default)
+    wait      block until the running copy finishes, then run
+    handoff   ask the running copy for one more pass and exit; a continuous
+              instance wakes from its sleep for it, a one-shot run loops once more
+    none      no lock (deliberately parallel workers, e.g. guardians sharing an inbox)
+The kernel drops an flock when its process exits, so a crashed run never leaves
+the lock behind. A holder that is alive but stuck is caught by its heartbeat
+deadline: it is reported (log + system_alert event) and, if it is a cron run on
+this host, terminated so the next run can go ahead.
+Author: Jarvis (jarvisauto001-coder)
+Repo: https://github.com/jarvisauto001-coder/moneybot-scripts
+
+Usage:
+    python3 jarvis-email-guardian.py --once --lock wait
+    python3 clawtasks-opportunity-scanner.py --once --lock handoff
+    python3 -m moneybot.runlock status
+"""
+
+import fcntl
+import json
+import os
+import sys
+import time
+from datetime import datetime
+from typing import Callable, Dict, Optional
+
+from moneybot.config import WORKSPACE, atomic_write
+from moneybot.lazy import lazy_import
+from moneybot.polling import format_interval
+
+socket = lazy_import("socket")  # only for the holder's host name, once a lock is taken
+
+DEFAULT_LOCK_DIR = os.path.join(WORKSPACE, ".locks")
+POLICIES = ("skip", "wait", "handoff", "none")
+DEFAULT_BUDGET = 900  # seconds a run may go without a heartbeat before it counts as stuck
+TERM_GRACE = 15       # seconds a terminated holder gets to let go of the lock
+
+
+class RunLock:
+    """One named single-flight lock; `holder.json` beside it says who has it and until when"""
+
+    def __init__(self, name: str, lock_dir: str = DEFAULT_LOCK_DIR, budget: float = DEFAULT_BUDGET,
+                 killable: bool = True, log: Optional[Callable[[str], None]] = None):
+        self.name = name
+        self.lock_dir = lock_dir
+        self.path = os.path.join(lock_dir, f"{name}.lock")
+        self.info_path = os.path.join(lock_dir, f"{name}.holder.json")
+        self.pending_path = os.path.join(lock_dir, f"{name}.pending")
+        self.reported_path = os.path.join(lock_dir, f"{name}.stuck")
+        self.budget = budget
+        self.killable = killable  # False inside the supervisor: terminating it would stop every job
+        self.log = log or (lambda message: print(message, file=sys.stderr))
+        self.fd = None
+        self.started_at = None
+        self.last_beat = 0.0
+        self.skipped = False  # whether the last run() left its work to another copy
+
+    # --- holding ---
+
+    def _try(self) -> bool:
+        os.makedirs(self.lock_dir, exist_ok=True)
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            os.close(fd)
+            return False
+        self.fd = fd
+        self.started_at = datetime.utcnow().isoformat()
+        self.heartbeat(force=True)
+        return True
+
+    @property
+    def held(self) -> bool:
+        return self.fd is not None
+
+    def heartbeat(self, budget: Optional[float] = None, force: bool = False):
+        """Promise another heartbeat (or the end of the run) within budget seconds"""
+        if self.fd is None:
+            return
+        budget = budget or self.budget
+        now = time.time()
+        if not force and now - self.last_beat < budget / 10:
+            return  # called per message; the deadline only needs to move now and then
+        self.last_beat = now
+        info = {"pid": os.getpid(), "host": socket.gethostname(), "name": self.name,
+                "started_at": self.started_at, "deadline": now + budget, "killable": self.killable,
+                "command": " ".join(os.path.basename(arg) for arg in sys.argv)}
+        try:
+            atomic_write(self.info_path, json.dumps(info), fsync=False)
+        except OSError as e:
+            self.log(f"⚠️ {self.name}: could not record lock holder: {e}")
+
+    def release(self):
+        if self.fd is None:
+            return
+        try:
+            os.remove(self.info_path)
+        except OSError:
+            pass
+        os.close(self.fd)  # drops the flock
+        self.fd = None
+
+    # --- contention ---
+
+    def holder(self) -> Optional[Dict]:
+        try:
+            with open(self.info_path, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _describe(self, holder: Optional[Dict]) -> str:
+        if not holder:
+            return "another run"
+        return f"pid {holder.get('pid')} on {holder.get('host')} (since {str(holder.get('started_at'))[:19]})"
+
+    def _handle_stuck(self, holder: Optional[Dict]) -> bool:
+        """Report a holder past its deadline; True if it was terminated and we now hold the lock"""
+        if not holder or time.time() <= holder.get("deadline", float("inf")):
+            return False
+        import signal
+        from moneybot import procfs
+        same_host = holder.get("host") == socket.gethostname()
+        if same_host and holder.get("pid") not in procfs.flock_holders(self.path):
+            return False  # left behind by a finished run; the new holder hasn't written its own yet
+        overdue = time.time() - holder["deadline"]
+        key = f"{holder.get('host')}:{holder.get('pid')}:{holder.get('started_at')}"
+        try:
+            with open(self.reported_path, 'r') as f:
+                reported = f.read() == key
+        except OSError:
+            reported = False
+        terminate = same_host and holder.get("killable")
+        if not reported:
+            action = "terminating it" if terminate else "leaving it (a supervisor job, or on another host)"
+            message = f"{self.name}: {self._describe(holder)} is {format_interval(overdue)} past its heartbeat deadline, {action}"
+            self.log(f"⚠️ {message}")
+            from moneybot.events import publish
+            publish("system_alert", self.name, message=message, pid=holder.get("pid"), host=holder.get("host"))
+            atomic_write(self.reported_path, key, fsync=False)
+        if not terminate:
+            return False
+        try:
+            os.kill(holder["pid"], signal.SIGTERM)
+        except OSError:
+            pass
+        deadline = time.monotonic() + TERM_GRACE
+        while time.monotonic() < deadline:
+            if self._try():
+                return True
+            time.sleep(0.2)
+        return False
+
+    def acquire(self, policy: str = "skip", timeout: Optional[float] = None) -> bool:
+        """True if this run should go ahead (it holds the lock, or policy is none)"""
+        if policy not in POLICIES:
+            raise ValueError(f"unknown lock policy {policy!r} (known: {', '.join(POLICIES)})")
+        if policy == "none" or self._try():
+            return True
+        holder = self.holder()
+        if self._handle_stuck(holder):
+            return True
+        if policy == "skip":
+            self.log(f"⏭️ {self.name}: {self._describe(holder)} is still running, skipping")
+            return False
+        if policy == "handoff":
+            atomic_write(self.pending_path, datetime.utcnow().isoformat(), fsync=False)
+            if self._try():
+                return True  # it finished meanwhile: do the pass ourselves
+            self.log(f"📨 {self.name}: handed this run to {self._describe(holder)}")
+            return False
+        self.log(f"⏳ {self.name}: waiting for {self._describe(holder)}")
+        started = next_check = time.monotonic()
+        while timeout is None or time.monotonic() - started < timeout:
+            time.sleep(1.0)
+            if self._try():
+                return True
+            if time.monotonic() >= next_check:
+                next_check += 30
+                if self._handle_stuck(self.holder()):
+                    return True
+        self.log(f"⏭️ {self.name}: still held after {timeout:.0f}s, giving up")
+        return False
+
+    # --- handoff ---
+
+    def _take_pending(self) -> bool:
+        try:
+            os.remove(self.pending_path)
+            return True
+        except FileNotFoundError:
+            return False
+
+    def run(self, fn: Callable, policy: str = "skip", timeout: Optional[float] = None):
+        """fn() under the lock; None without running it if another copy has it.
+        Handoff requests that arrive while fn runs get exactly one more pass."""
+        self.skipped = not self.acquire(policy, timeout)
+        if self.skipped:
+            return None
+        if policy == "none":
+            return fn()
+        result = None
+        while True:
+            try:
+                while True:
+                    self._take_pending()  # this pass covers any request made so far
+                    result = fn()
+                    if not os.path.exists(self.pending_path):
+                        break
+                    self.log(f"📨 {self.name}: a run was handed over meanwhile, one more pass")
+            finally:
+                self.release()
+            # A request made between our last check and the release: run it unless someone else took the lock
+            if not os.path.exists(self.pending_path) or not self._try():
+                return result
+
+    def idle(self, seconds: float) -> bool:
+        """Sleep between continuous cycles; True early if another copy handed its run to us"""
+        self.heartbeat(budget=seconds + self.budget, force=True)
+        deadline = time.monotonic() + seconds
+        while True:
+            if self.held and self._take_pending():
+                self.log(f"📨 {self.name}: run handed over, checking now")
+                return True
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            time.sleep(min(1.0, remaining))
+
+    def is_free(self) -> bool:
+        """Whether nobody holds the lock right now (without taking it)"""
+        try:
+            fd = os.open(self.path, os.O_RDONLY)
+        except FileNotFoundError:
+            return True
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            return True
+        except BlockingIOError:
+            return False
+        finally:
+            os.close(fd)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.release()
+
+
+def policy_from_argv(argv=None, default: str = "skip") -> str:
+    """--lock POLICY from the command line (exits on an unknown one)"""
+    from moneybot.profiling import flag_value
+    argv = sys.argv if argv is None else argv
+    policy = flag_value(argv, "--lock") if "--lock" in argv else default
+    if policy not in POLICIES:
+        sys.exit(f"❌ --lock must be one of {', '.join(POLICIES)}")
+    return policy
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Show the single-flight run locks")
+    parser.add_argument("--dir", default=DEFAULT_LOCK_DIR)
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("status", help="Which runs hold their lock, until when, and pending handoffs")
+    args = parser.parse_args(argv)
+
+    try:
+        names = sorted(entry[:-5] for entry in os.listdir(args.dir) if entry.endswith(".lock"))
+    except FileNotFoundError:
+        names = []
+    if not names:
+        print("No run locks yet")
+        return 0
+    for name in names:
+        lock = RunLock(name, args.dir)
+        pending = " 📨 handoff pending" if os.path.exists(lock.pending_path) else ""
+        if lock.is_free():
+            print(f"🟢 {name:<20} free{pending}")
+            continue
+        holder = lock.holder()
+        left = (holder or {}).get("deadline", 0) - time.time()
+        state = f"heartbeat due in {left / 60:.1f} min" if left > 0 else f"⚠️ {-left / 60:.1f} min past its deadline"
+        print(f"🔒 {name:<20} {lock._describe(holder)}  {(holder or {}).get('command', '')}  ({state}){pending}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
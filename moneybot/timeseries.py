@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+Time-series ring files - fixed-size, memory-mapped metric history with downsampling tiers
+One file per metric; every sample is folded into 1 min / 1 h / 1 day buckets in O(1)
+Author: Jarvis (jarvisauto001-coder)
+Repo: https://github.com/jarvisauto001-coder/moneybot-scripts
+
+Usage:
+    python3 -m moneybot.timeseries list
+    python3 -m moneybot.timeseries query system.cpu --hours 24
+"""
+
+import fcntl
+import mmap
+import os
+import re
+import struct
+import sys
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from moneybot.config import WORKSPACE
+
+DEFAULT_HISTORY_DIR = os.path.join(WORKSPACE, ".dashboard_history")
+
+# (bucket seconds, slots): 1 day of minutes, 30 days of hours, 2 years of days
+DEFAULT_TIERS = ((60, 1440), (3600, 720), (86400, 730))
+
+MAGIC = b"MBTS"
+VERSION = 1
+HEADER = struct.Struct("<4sHH")          # magic, version, tier count
+TIER = struct.Struct("<II")              # bucket seconds, slots
+SLOT = struct.Struct("<qdddI4x")         # bucket start, sum, min, max, count
+SPARK = "▁▂▃▄▅▆▇█"
+
+
+class RingSeries:
+    """One metric's ring file. Slot for a bucket is (bucket // step) % slots."""
+
+    def __init__(self, path: str, tiers: Sequence[Tuple[int, int]] = DEFAULT_TIERS):
+        self.path = path
+        self.fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+        # Check, initialize and map under the lock: another process creating the same
+        # series is either done (full size, header written) or hasn't started
+        fcntl.flock(self.fd, fcntl.LOCK_EX)
+        try:
+            header = os.pread(self.fd, HEADER.size, 0)
+            if len(header) < HEADER.size or not any(header):
+                self._initialize(tiers)
+            self.mm = mmap.mmap(self.fd, 0)
+        finally:
+            fcntl.flock(self.fd, fcntl.LOCK_UN)
+        magic, version, count = HEADER.unpack_from(self.mm, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a v{VERSION} ring file")
+        self.tiers = []
+        offset = HEADER.size + count * TIER.size
+        for i in range(count):
+            step, slots = TIER.unpack_from(self.mm, HEADER.size + i * TIER.size)
+            self.tiers.append((step, slots, offset))
+            offset += slots * SLOT.size
+
+    def _initialize(self, tiers):
+        """Size the file first and write the header last (caller holds the lock), so an all-zero
+        header always means unfinished and is simply redone"""
+        size = HEADER.size + len(tiers) * TIER.size + sum(slots for _, slots in tiers) * SLOT.size
+        os.ftruncate(self.fd, size)  # zero-filled: bucket start 0 = empty slot
+        header = HEADER.pack(MAGIC, VERSION, len(tiers)) + b"".join(TIER.pack(s, n) for s, n in tiers)
+        os.pwrite(self.fd, header, 0)
+
+    def append(self, value: float, ts: Optional[float] = None):
+        """Fold one sample into every tier: O(number of tiers)"""
+        ts = int(ts if ts is not None else time.time())
+        value = float(value)
+        fcntl.flock(self.fd, fcntl.LOCK_EX)
+        try:
+            for step, slots, base in self.tiers:
+                bucket = ts - ts % step
+                offset = base + (bucket // step % slots) * SLOT.size
+                start, total, low, high, count = SLOT.unpack_from(self.mm, offset)
+                if start != bucket or count == 0:
+                    SLOT.pack_into(self.mm, offset, bucket, value, value, value, 1)
+                else:
+                    SLOT.pack_into(self.mm, offset, bucket, total + value, min(low, value), max(high, value), count + 1)
+        finally:
+            fcntl.flock(self.fd, fcntl.LOCK_UN)
+
+    def pick_tier(self, start: int, end: int, max_points: Optional[int] = None) -> int:
+        """Finest tier that still covers `start` (and fits max_points if given)"""
+        for i, (step, slots, _) in enumerate(self.tiers):
+            if end - start <= step * slots and (max_points is None or (end - start) // step <= max_points):
+                return i
+        return len(self.tiers) - 1
+
+    def query(self, start: float, end: Optional[float] = None, tier: Optional[int] = None,
+              max_points: Optional[int] = None) -> List[Tuple[int, Optional[float], Optional[float], Optional[float]]]:
+        """(bucket start, avg, min, max) per bucket in [start, end]; None for empty buckets"""
+        end = int(end if end is not None else time.time())
+        start = int(start)
+        if tier is None:
+            tier = self.pick_tier(start, end, max_points)
+        step, slots, base = self.tiers[tier]
+        first = max(start - start % step, end - end % step - (slots - 1) * step)
+        points = []
+        for bucket in range(first, end + 1, step):
+            offset = base + (bucket // step % slots) * SLOT.size
+            stored, total, low, high, count = SLOT.unpack_from(self.mm, offset)
+            if stored == bucket and count:
+                points.append((bucket, total / count, low, high))
+            else:
+                points.append((bucket, None, None, None))
+        return points
+
+    def close(self):
+        self.mm.close()
+        os.close(self.fd)
+
+
+class TimeSeriesStore:
+    """Directory of ring files, one per metric name (e.g. 'system.cpu')"""
+
+    def __init__(self, directory: str = DEFAULT_HISTORY_DIR, tiers: Sequence[Tuple[int, int]] = DEFAULT_TIERS):
+        self.directory = directory
+        self.tiers = tiers
+        self.series: Dict[str, RingSeries] = {}
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.directory, re.sub(r"[^A-Za-z0-9_.-]", "_", name) + ".ring")
+
+    def get(self, name: str) -> RingSeries:
+        series = self.series.get(name)
+        if series is None:
+            series = self.series[name] = RingSeries(self._path(name), self.tiers)
+        return series
+
+    def append(self, name: str, value: float, ts: Optional[float] = None):
+        self.get(name).append(value, ts)
+
+    def recent(self, name: str, seconds: float, max_points: Optional[int] = None):
+        if not os.path.exists(self._path(name)):
+            return []
+        now = time.time()
+        return self.get(name).query(now - seconds, now, max_points=max_points)
+
+    def names(self) -> List[str]:
+        return sorted(f[:-5] for f in os.listdir(self.directory) if f.endswith(".ring"))
+
+    def close(self):
+        for series in self.series.values():
+            series.close()
+        self.series.clear()
+
+
+def sparkline(values: Sequence[Optional[float]], width: Optional[int] = None) -> str:
+    """Unicode sparkline; empty buckets render as spaces"""
+    values = list(values)
+    if width and len(values) > width:
+        # Average adjacent buckets down to the requested width
+        chunk = len(values) / width
+        merged = []
+        for i in range(width):
+            part = [v for v in values[int(i * chunk):int((i + 1) * chunk)] if v is not None]
+            merged.append(sum(part) / len(part) if part else None)
+        values = merged
+    present = [v for v in values if v is not None]
+    if not present:
+        return ""
+    low, high = min(present), max(present)
+    span = high - low
+    return "".join(
+        " " if v is None else SPARK[0 if span == 0 else min(len(SPARK) - 1, int((v - low) / span * len(SPARK)))]
+        for v in values
+    )
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Inspect dashboard metric history")
+    parser.add_argument("--dir", default=DEFAULT_HISTORY_DIR)
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("list", help="Metrics with history")
+    query = sub.add_parser("query", help="Print a metric's recent buckets")
+    query.add_argument("metric")
+    query.add_argument("--hours", type=float, default=24)
+    query.add_argument("--points", type=int, default=60, help="Pick a tier with at most this many buckets")
+    args = parser.parse_args(argv)
+
+    store = TimeSeriesStore(args.dir)
+    if args.command == "list":
+        for name in store.names():
+            print(name)
+        return 0
+    started = time.perf_counter()
+    points = store.recent(args.metric, args.hours * 3600, max_points=args.points)
+    elapsed = (time.perf_counter() - started) * 1000
+    for bucket, avg, low, high in points:
+        if avg is not None:
+            stamp = time.strftime("%Y-%m-%d %H:%M", time.gmtime(bucket))
+            print(f"{stamp}  avg={avg:.2f}  min={low:.2f}  max={high:.2f}")
+    print(sparkline([p[1] for p in points], width=60))
+    print(f"{len(points)} buckets in {elapsed:.2f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())